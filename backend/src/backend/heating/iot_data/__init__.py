@@ -6,19 +6,54 @@ Provides get_iot_config, get_feature_data, get_device_features, and feature extr
 Note: get_iot_config is in get_iot_config submodule; import via
   from backend.heating.iot_data.get_iot_config import get_iot_config
 """
-from .feature_data_fetcher import get_device_features, get_feature_data
-from .feature_extractors import (
-    extract_feature_value,
-    get_feature_value,
-)
-from .get_iot_config import IotConfig
-from .heating_values import get_heating_values
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .feature_data_fetcher import get_device_features, get_feature_data
+    from .feature_extractors import (
+        extract_feature_value,
+        get_feature_value,
+        get_feature_value_from_cache,
+        get_feature_values_bulk,
+    )
+    from .get_iot_config import IotConfig
+    from .heating_values import HeatingValues, get_heating_values
+
+# Public names resolve lazily (PEP 562) so that CLI entry points in this package,
+# e.g. `iot-data-feature --help`, do not import requests before they need it.
+_LAZY_EXPORTS = {
+    "HeatingValues": ".heating_values",
+    "IotConfig": ".get_iot_config",
+    "extract_feature_value": ".feature_extractors",
+    "get_device_features": ".feature_data_fetcher",
+    "get_feature_data": ".feature_data_fetcher",
+    "get_feature_value": ".feature_extractors",
+    "get_feature_value_from_cache": ".feature_extractors",
+    "get_feature_values_bulk": ".feature_extractors",
+    "get_heating_values": ".heating_values",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__: list[str] = [
+    "HeatingValues",
     "IotConfig",
     "extract_feature_value",
     "get_device_features",
     "get_feature_data",
     "get_heating_values",
     "get_feature_value",
+    "get_feature_value_from_cache",
+    "get_feature_values_bulk",
 ]
@@ -8,19 +8,140 @@ Supports optional caching to avoid duplicate HTTP calls when querying multiple f
 
 from __future__ import annotations
 
+import copy
 import logging
-from types import SimpleNamespace
-from typing import Any, Optional
-
-import requests
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from ...shared import config as config_mod
 from ...viessmann.api_auth import auth as auth_mod
-from .get_iot_config import IotConfig, api_get_json, _extract_list
+from .get_iot_config import (
+    IotConfig,
+    _atomic_write_private,
+    _body_preview,
+    _extract_list,
+    api_get_json,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+# Process-wide keep-alive session used when callers do not pass one (see _get_default_session).
+_default_session: Optional[requests.Session] = None
+
+
+def _get_default_session() -> requests.Session:
+    """
+    Return the shared pooled session for feature requests, creating it on first use.
+
+    All feature endpoints live on the API host, so reusing one session keeps its
+    TCP+TLS connection alive across fetches (and across warm Lambda invocations).
+    Built by `auth_mod._build_session` (same retry policy, including
+    returning the final 5xx), with a pool sized for concurrent feature fetches.
+    """
+    global _default_session
+    if _default_session is None:
+        _default_session = auth_mod._build_session(pool_connections=4, pool_maxsize=16)
+    return _default_session
+
+
+# Pre-fetched features: the raw list from get_device_features, or index_features() of it.
+FeaturesData = Union[list[dict[str, Any]], dict[str, dict[str, Any]]]
+
+# Short-lived response memo, keyed by device (and feature path for single features).
+# Repeated queries for the same device within one process (e.g. a warm Lambda)
+# reuse the parsed JSON. TTL: VIESSMANN_FEATURE_CACHE_TTL unless overridden here.
+# Entries are private deep copies (callers may mutate what they get back), and
+# the lock covers lookups, inserts and eviction: get_single_features fills the
+# memo from several worker threads.
+_FEATURE_CACHE_TTL_SECONDS: Optional[float] = None
+_FEATURE_CACHE_MAXSIZE = 256
+_FEATURE_CACHE: dict[tuple[str, ...], tuple[float, Any]] = {}
+_FEATURE_CACHE_LOCK = threading.Lock()
+_CACHE_MISS = object()
+
+
+def _cache_get(key: tuple[str, ...]) -> Any:
+    with _FEATURE_CACHE_LOCK:
+        entry = _FEATURE_CACHE.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            _FEATURE_CACHE.pop(key, None)
+            return _CACHE_MISS
+    return copy.deepcopy(value)
+
+
+def _cache_put(key: tuple[str, ...], value: Any) -> None:
+    ttl = _FEATURE_CACHE_TTL_SECONDS
+    if ttl is None:
+        ttl = config_mod.get_feature_cache_ttl_seconds()
+    value = copy.deepcopy(value)
+    with _FEATURE_CACHE_LOCK:
+        if key not in _FEATURE_CACHE and len(_FEATURE_CACHE) >= _FEATURE_CACHE_MAXSIZE:
+            # Dicts keep insertion order: evict the oldest entry.
+            _FEATURE_CACHE.pop(next(iter(_FEATURE_CACHE)), None)
+        _FEATURE_CACHE[key] = (time.monotonic() + ttl, value)
+
+
+def _device_features_cached(iot_config: IotConfig) -> bool:
+    """Whether get_device_features would currently answer from the memo."""
+    key = (iot_config.installation_id, iot_config.gateway_serial, iot_config.device_id)
+    with _FEATURE_CACHE_LOCK:
+        entry = _FEATURE_CACHE.get(key)
+    return entry is not None and entry[0] > time.monotonic()
+
+
+def clear_feature_cache() -> None:
+    """Drop all memoized feature responses (e.g. after a setMode command or in tests)."""
+    with _FEATURE_CACHE_LOCK:
+        _FEATURE_CACHE.clear()
+
+
+# On-disk variant for the CLI, where each invocation is a new process: a JSON file
+# of {key: {"expires_at": epoch_seconds, "feature": {...} | null}}, written
+# atomically like the token cache. Best effort; unreadable files count as empty.
+def _feature_disk_key(iot_config: IotConfig, feature_path: str) -> str:
+    return "/".join(
+        (iot_config.installation_id, iot_config.gateway_serial, iot_config.device_id, feature_path)
+    )
+
+
+def _load_feature_disk_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        data = auth_mod._json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
-# Module-level URL templates for testability.
-IOT_FEATURES_URL_TMPL = config_mod.get_iot_features_url_tmpl()
-IOT_SINGLE_FEATURE_URL_TMPL = config_mod.get_iot_single_feature_url_tmpl()
+
+def _disk_cache_get(cache_path: Path, key: str) -> Any:
+    entry = _load_feature_disk_cache(cache_path).get(key)
+    if not isinstance(entry, dict) or "feature" not in entry:
+        return _CACHE_MISS
+    expires_at = entry.get("expires_at")
+    if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+        return _CACHE_MISS
+    return entry["feature"]
+
+
+def _disk_cache_put(cache_path: Path, key: str, feature: Optional[dict[str, Any]], ttl_seconds: float) -> None:
+    now = time.time()
+    entries = {
+        k: v
+        for k, v in _load_feature_disk_cache(cache_path).items()
+        if isinstance(v, dict) and isinstance(v.get("expires_at"), (int, float)) and v["expires_at"] > now
+    }
+    entries[key] = {"expires_at": now + ttl_seconds, "feature": feature}
+    try:
+        _atomic_write_private(cache_path, auth_mod._json_dumpb(entries))
+    except OSError:
+        pass
 
 
 def get_device_features(
@@ -35,34 +156,37 @@ def get_device_features(
     Fetch all device features from the Viessmann IoT API.
 
     Returns the raw `data` array of feature objects. Each feature has `feature`,
-    `isEnabled`, and optionally `properties` and `commands`.
+    `isEnabled`, and optionally `properties` and `commands`. Responses are
+    memoized per device for the feature cache TTL (see clear_feature_cache).
 
     Args:
         iot_config: IoT configuration from get_iot_config().
         timeout_seconds: HTTP timeout.
         ssl_verify: Whether to verify TLS certificates.
-        session: Optional requests session (created if None).
+        session: Optional requests session (shared pooled session if None).
         log: Optional logger (unused, for API consistency).
 
     Returns:
         List of feature dicts from the API response.
     """
-    cfg = SimpleNamespace(timeout_seconds=timeout_seconds, ssl_verify=ssl_verify)
-    url = IOT_FEATURES_URL_TMPL.format(
-        installation_id=iot_config.installation_id,
-        gateway_serial=iot_config.gateway_serial,
-        device_id=iot_config.device_id,
-    )
-    sess = session if session is not None else requests.Session()
+    cache_key = (iot_config.installation_id, iot_config.gateway_serial, iot_config.device_id)
+    cached = _cache_get(cache_key)
+    if cached is not _CACHE_MISS:
+        return cached
+    url = iot_config.features_url
+    sess = session if session is not None else _get_default_session()
     payload = api_get_json(
         session=sess,
         url=url,
         access_token=iot_config.access_token,
-        cfg=cfg,
         log=log,
         auth_mod=auth_mod,
+        timeout=timeout_seconds,
+        verify=ssl_verify,
     )
-    return _extract_list(payload, url=url, auth_mod=auth_mod)
+    features = _extract_list(payload, url=url, auth_mod=auth_mod)
+    _cache_put(cache_key, features)
+    return features
 
 
 def get_single_feature(
@@ -73,58 +197,150 @@ def get_single_feature(
     ssl_verify: bool = True,
     session: Optional[requests.Session] = None,
     log: Optional[logging.LoggerAdapter] = None,
+    use_cache: bool = True,
 ) -> Optional[dict[str, Any]]:
     """
     Fetch a single feature directly from the single-feature endpoint.
 
     Response shape: {"data": {...}}. Returns raw feature dict or None if not
-    found, disabled, or HTTP 404.
+    found, disabled, or HTTP 404. Results are memoized like get_device_features;
+    with use_cache=False the memo is not read (the fresh result still refreshes it).
     """
-    url = IOT_SINGLE_FEATURE_URL_TMPL.format(
-        installation_id=iot_config.installation_id,
-        gateway_serial=iot_config.gateway_serial,
-        device_id=iot_config.device_id,
-        feature_path=feature_path,
+    cache_key = (
+        iot_config.installation_id,
+        iot_config.gateway_serial,
+        iot_config.device_id,
+        feature_path,
     )
-    cfg = SimpleNamespace(timeout_seconds=timeout_seconds, ssl_verify=ssl_verify)
-    sess = session if session is not None else requests.Session()
+    if use_cache:
+        cached = _cache_get(cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+    url = iot_config.single_feature_url(feature_path)
+    sess = session if session is not None else _get_default_session()
     headers = {"Authorization": f"Bearer {iot_config.access_token}"}
-    resp = sess.get(
-        url,
-        headers=headers,
-        timeout=float(cfg.timeout_seconds),
-        verify=bool(cfg.ssl_verify),
-    )
+    resp = sess.get(url, headers=headers, timeout=timeout_seconds, verify=ssl_verify)
     if resp.status_code == 404:
+        _cache_put(cache_key, None)
         return None
     if resp.status_code >= 400:
-        body = (resp.text or "")[:800]
+        body = _body_preview(resp)
         raise auth_mod.CliError(
             f"GET {url} failed: HTTP {resp.status_code}. "
             f"Body (truncated, sanitized): {auth_mod._sanitize_text(body)!r}"
         )
     try:
-        payload = resp.json()
+        payload = auth_mod._json_loads(resp.content)
     except Exception as e:
-        body = (resp.text or "")[:800]
+        body = _body_preview(resp)
         raise auth_mod.CliError(
             f"GET {url} response was not valid JSON: {e}. "
             f"Body: {auth_mod._sanitize_text(body)!r}"
         ) from e
-    items = _extract_list(payload, url=url, auth_mod=auth_mod)
-    if not items:
-        return None
-    f = items[0]
-    if not f.get("isEnabled", True):
-        return None
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if isinstance(data, dict):
+        # Documented shape {"data": {...}}: use it directly.
+        f = data
+    else:
+        # List-shaped or malformed payloads: normalize (raises CliError on bad shapes).
+        items = _extract_list(payload, url=url, auth_mod=auth_mod)
+        f = items[0] if items else None
+    if f is not None and not f.get("isEnabled", True):
+        f = None
+    _cache_put(cache_key, f)
     return f
 
 
+def get_single_features(
+    feature_paths: Sequence[str],
+    iot_config: IotConfig,
+    *,
+    timeout_seconds: float = 30.0,
+    ssl_verify: bool = True,
+    session: Optional[requests.Session] = None,
+    log: Optional[logging.LoggerAdapter] = None,
+    max_workers: int = 8,
+) -> dict[str, Optional[dict[str, Any]]]:
+    """
+    Fetch several features from the single-feature endpoint concurrently.
+
+    The GETs are independent, so they run on a small thread pool: wall time is
+    roughly one round-trip instead of N. Each fetch gets its own Session over
+    the pooled session's adapters (see auth_mod._worker_session). Returns
+    {feature_path: feature dict or None}, in the order of feature_paths. The
+    first CliError raised by any fetch propagates.
+    """
+    paths = list(dict.fromkeys(feature_paths))
+    if not paths:
+        return {}
+    sess = session if session is not None else _get_default_session()
+
+    def fetch(path: str, fetch_session: requests.Session) -> Optional[dict[str, Any]]:
+        return get_single_feature(
+            path,
+            iot_config,
+            timeout_seconds=timeout_seconds,
+            ssl_verify=ssl_verify,
+            session=fetch_session,
+            log=log,
+        )
+
+    if len(paths) == 1:
+        return {paths[0]: fetch(paths[0], sess)}
+    worker_sessions = [auth_mod._worker_session(sess) for _ in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return dict(zip(paths, pool.map(fetch, paths, worker_sessions)))
+
+
+def index_features(
+    features_data: list[dict[str, Any]],
+    paths: Optional[Iterable[str]] = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Index a features list by feature path for O(1) lookups in get_feature_data.
+
+    Build once and pass the result as features_data when querying many features.
+    With `paths`, only those features are kept: one pass over the list without
+    building an entry for every feature the device reports.
+    """
+    if paths is None:
+        return {
+            f["feature"]: f
+            for f in features_data
+            if isinstance(f, dict) and "feature" in f
+        }
+    wanted = frozenset(paths)
+    return {
+        f["feature"]: f
+        for f in features_data
+        if isinstance(f, dict) and f.get("feature") in wanted
+    }
+
+
+def lookup_feature(feature_path: str, features_data: FeaturesData) -> Optional[dict[str, Any]]:
+    """
+    Find a feature in pre-fetched features without any HTTP fallback.
+
+    Returns the raw feature object, or None if it is absent or disabled.
+    """
+    if isinstance(features_data, dict):
+        f = features_data.get(feature_path)
+        if f is None or not f.get("isEnabled", True):
+            return None
+        return f
+    for f in features_data:
+        if isinstance(f, dict) and f.get("feature") == feature_path:
+            if not f.get("isEnabled", True):
+                return None
+            return f
+    return None
+
+
 def get_feature_data(
     feature_path: str,
     iot_config: IotConfig,
     *,
-    features_data: Optional[list[dict[str, Any]]] = None,
+    features_data: Optional[FeaturesData] = None,
     timeout_seconds: float = 30.0,
     ssl_verify: bool = True,
     session: Optional[requests.Session] = None,
@@ -136,7 +352,8 @@ def get_feature_data(
     Args:
         feature_path: Feature identifier (e.g. "heating.circuits.0.temperature").
         iot_config: IoT configuration from get_iot_config().
-        features_data: Optional pre-fetched features list to avoid duplicate HTTP calls.
+        features_data: Optional pre-fetched features to avoid duplicate HTTP calls:
+            the list from get_device_features, or its index_features() mapping.
         timeout_seconds: HTTP timeout (used only when features_data is None).
         ssl_verify: Whether to verify TLS certificates.
         session: Optional requests session.
@@ -147,12 +364,7 @@ def get_feature_data(
         or None if not found or isEnabled is false.
     """
     if features_data is not None:
-        for f in features_data:
-            if isinstance(f, dict) and f.get("feature") == feature_path:
-                if not f.get("isEnabled", True):
-                    return None
-                return f
-        return None
+        return lookup_feature(feature_path, features_data)
 
     return get_single_feature(
         feature_path,
@@ -164,4 +376,49 @@ def get_feature_data(
     )
 
 
-__all__ = ["get_device_features", "get_feature_data", "get_single_feature"]
+def get_feature_data_disk_cached(
+    feature_path: str,
+    iot_config: IotConfig,
+    *,
+    cache_path: Optional[Path],
+    ttl_seconds: float = 30.0,
+    timeout_seconds: float = 30.0,
+    ssl_verify: bool = True,
+    session: Optional[requests.Session] = None,
+    log: Optional[logging.LoggerAdapter] = None,
+) -> Optional[dict[str, Any]]:
+    """
+    get_feature_data backed by an on-disk cache shared between processes.
+
+    Intended for the CLI, where the in-memory memo does not survive between
+    invocations. With cache_path None this is a plain get_feature_data call.
+    """
+    key = _feature_disk_key(iot_config, feature_path)
+    if cache_path is not None:
+        cached = _disk_cache_get(cache_path, key)
+        if cached is not _CACHE_MISS:
+            return cached
+    feature = get_feature_data(
+        feature_path,
+        iot_config,
+        timeout_seconds=timeout_seconds,
+        ssl_verify=ssl_verify,
+        session=session,
+        log=log,
+    )
+    if cache_path is not None:
+        _disk_cache_put(cache_path, key, feature, ttl_seconds)
+    return feature
+
+
+__all__ = [
+    "FeaturesData",
+    "clear_feature_cache",
+    "get_device_features",
+    "get_feature_data",
+    "get_feature_data_disk_cached",
+    "get_single_feature",
+    "get_single_features",
+    "index_features",
+    "lookup_feature",
+]
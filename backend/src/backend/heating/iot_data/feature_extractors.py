@@ -9,10 +9,19 @@ Different features return different shapes: scalars (temperature), complex objec
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import functools
+import math
+from collections.abc import Callable, Sequence
 from typing import Any, Optional
 
-from .feature_data_fetcher import get_feature_data
+from .feature_data_fetcher import (
+    FeaturesData,
+    get_device_features,
+    get_feature_data,
+    get_single_features,
+    index_features,
+    lookup_feature,
+)
 from .get_iot_config import IotConfig
 
 
@@ -26,15 +35,24 @@ def extract_temperature(feature: dict[str, Any]) -> Optional[float]:
     - {"value": 21, "unit": "celsius"}
     - {"temperature": 21}
     """
-    props = feature.get("properties") or {}
+    props = feature.get("properties")
+    if not props:
+        return None
     if "temperature" in props:
         val = props["temperature"]
         if isinstance(val, dict):
             return _extract_scalar_from_prop(val.get("value"))
         return _coerce_float(val)
-    if "value" in props:
-        return _extract_scalar_from_prop(props["value"])
-    return None
+    val = props.get("value")
+    # Inlined common shapes; anything else goes through the general helper.
+    t = type(val)
+    if t is dict:
+        return _coerce_float(val.get("value"))
+    if t is float:
+        return val
+    if t is int:
+        return float(val)
+    return _extract_scalar_from_prop(val)
 
 
 def extract_consumption(feature: dict[str, Any]) -> dict[str, Any]:
@@ -82,35 +100,62 @@ def extract_burner_statistics(feature: dict[str, Any]) -> dict[str, Any]:
 
 
 def _coerce_int(value: Any) -> Optional[int]:
-    """Coerce value to int if numeric, else None."""
+    """Coerce value to int if numeric (truncating floats), else None."""
+    # Exact-type checks first: JSON values are plain int/float/str, and
+    # `type(x) is T` skips the MRO walk of isinstance.
+    t = type(value)
+    if t is int:
+        return value
+    if t is float:
+        return int(value) if math.isfinite(value) else None
+    if t is str:
+        return _parse_int_str(value)
     if value is None:
         return None
     if isinstance(value, int):
         return value
     if isinstance(value, float):
-        return int(value) if value == int(value) else int(value)
-    if isinstance(value, str):
-        try:
-            return int(float(value))
-        except ValueError:
-            return None
+        return int(value) if math.isfinite(value) else None
     return None
 
 
 def _coerce_float(value: Any) -> Optional[float]:
     """Coerce value to float if numeric, else None."""
+    t = type(value)
+    if t is float:
+        return value
+    if t is int:
+        return float(value)
+    if t is str:
+        return _parse_float_str(value)
     if value is None:
         return None
-    if isinstance(value, (int, float)):
+    # Subclasses (bool, numpy scalars): checked singly, float first as the common case.
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, int):
         return float(value)
-    if isinstance(value, str):
-        try:
-            return float(value)
-        except ValueError:
-            return None
     return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_float_str(value: str) -> Optional[float]:
+    """Parse a numeric string; cached since the API repeats values like "0" or "21.0"."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_int_str(value: str) -> Optional[int]:
+    """Parse a numeric string to a truncated int; None for non-numeric or non-finite."""
+    parsed = _parse_float_str(value)
+    if parsed is None or not math.isfinite(parsed):
+        return None
+    return int(parsed)
+
+
 def _extract_scalar_from_prop(prop_value: Any) -> Optional[float]:
     """
     Extract a numeric scalar from a property value.
@@ -119,20 +164,31 @@ def _extract_scalar_from_prop(prop_value: Any) -> Optional[float]:
     - 36.8
     - {"type": "number", "value": 36.8, "unit": "celsius"}
     """
-    if prop_value is None:
+    t = type(prop_value)
+    if t is float:
+        return prop_value
+    if t is dict:
+        return _coerce_float(prop_value["value"]) if "value" in prop_value else None
+    if t is int:
+        return float(prop_value)
+    if prop_value is None or t is str:
         return None
-    if isinstance(prop_value, (int, float)):
+    if isinstance(prop_value, float):
+        return float(prop_value)
+    if isinstance(prop_value, int):
         return float(prop_value)
     if isinstance(prop_value, dict) and "value" in prop_value:
         return _coerce_float(prop_value["value"])
     return None
 
 
+@functools.lru_cache(maxsize=512)
 def _get_extractor(feature_path: str) -> Callable[[dict[str, Any]], Any]:
     """
     Return the appropriate extractor for a feature path.
 
     Uses pattern matching for common feature types to avoid a large explicit registry.
+    Feature paths are a small, fixed set per device, so the result is cached.
     """
     # Temperature features: heating.circuits.*.temperature, heating.boiler.temperature,
     # heating.dhw.sensors.temperature.*, heating.sensors.temperature.*, etc.
@@ -168,7 +224,7 @@ def get_feature_value(
     feature_path: str,
     iot_config: IotConfig,
     *,
-    features_data: Optional[list[dict[str, Any]]] = None,
+    features_data: Optional[FeaturesData] = None,
     timeout_seconds: float = 30.0,
     ssl_verify: bool = True,
     session: Optional[Any] = None,
@@ -183,7 +239,7 @@ def get_feature_value(
     Args:
         feature_path: Feature identifier (e.g. "heating.circuits.0.temperature").
         iot_config: IoT configuration from get_iot_config().
-        features_data: Optional pre-fetched features list.
+        features_data: Optional pre-fetched features (list or index_features() mapping).
         timeout_seconds: HTTP timeout (used only when features_data is None).
         ssl_verify: Whether to verify TLS certificates.
         session: Optional requests session.
@@ -204,6 +260,53 @@ def get_feature_value(
     return extract_feature_value(feature_path, feature)
 
 
+def get_feature_value_from_cache(feature_path: str, features_data: FeaturesData) -> Any:
+    """
+    Extract a feature value from pre-fetched features only; never makes a request.
+
+    Unlike get_feature_value, a path missing from features_data yields None
+    instead of a single-feature GET.
+    """
+    return extract_feature_value(feature_path, lookup_feature(feature_path, features_data))
+
+
+# From this many paths on, one device-features GET is cheaper than per-path GETs.
+_BULK_FETCH_THRESHOLD = 3
+
+def get_feature_values_bulk(
+    feature_paths: Sequence[str],
+    iot_config: IotConfig,
+    *,
+    timeout_seconds: float = 30.0,
+    ssl_verify: bool = True,
+    session: Optional[Any] = None,
+    log: Optional[Any] = None,
+) -> dict[str, Any]:
+    """
+    Fetch and extract several features with as few HTTP calls as possible.
+
+    With _BULK_FETCH_THRESHOLD or more distinct paths, fetches all device
+    features once and looks each path up locally; otherwise fetches the
+    paths from the single-feature endpoint (concurrently).
+
+    Returns:
+        {feature_path: extracted value or None}, in the order of feature_paths.
+    """
+    paths = tuple(dict.fromkeys(feature_paths))
+    fetch_kwargs = dict(timeout_seconds=timeout_seconds, ssl_verify=ssl_verify, session=session, log=log)
+    if len(paths) < _BULK_FETCH_THRESHOLD:
+        features = get_single_features(paths, iot_config, **fetch_kwargs)
+        return _extract_paths(paths, features)
+
+    device_features = get_device_features(iot_config, **fetch_kwargs)
+    return _extract_paths(paths, index_features(device_features, paths))
+
+
+def _extract_paths(paths: Sequence[str], features: FeaturesData) -> dict[str, Any]:
+    # Local lookups only: after the fetch above, the bulk call makes no further requests.
+    return {path: get_feature_value_from_cache(path, features) for path in paths}
+
+
 __all__ = [
     "extract_burner_statistics",
     "extract_consumption",
@@ -211,4 +314,6 @@ __all__ = [
     "extract_raw_properties",
     "extract_temperature",
     "get_feature_value",
+    "get_feature_value_from_cache",
+    "get_feature_values_bulk",
 ]
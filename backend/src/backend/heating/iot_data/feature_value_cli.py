@@ -9,13 +9,11 @@ Prints the result as JSON to stdout.
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from typing import Optional
 
+from ...shared import config as config_mod
 from ...viessmann.api_auth import auth as auth_mod
-from .feature_extractors import get_feature_value
-from .get_iot_config import get_iot_config
 
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
@@ -28,7 +26,8 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     )
     p.add_argument(
         "--timeout-seconds",
-        default="30",
+        type=float,
+        default=30.0,
         help="HTTP timeout in seconds (default: 30).",
     )
     p.add_argument(
@@ -57,6 +56,11 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Disable token cache (always use full OAuth flow).",
     )
+    p.add_argument(
+        "--no-feature-cache",
+        action="store_true",
+        help="Disable the on-disk feature response cache (always fetch from the API).",
+    )
     return p.parse_args(sys.argv[1:] if argv is None else argv)
 
 
@@ -67,25 +71,35 @@ def main(argv: Optional[list[str]] = None) -> int:
     Returns 0 on success, 1 when feature not found, 2 on auth/config errors.
     """
     args = _parse_args(argv)
+    # Deferred so `--help` and argument errors exit before requests is imported.
+    from . import feature_data_fetcher as fetcher_mod
+    from .feature_extractors import extract_feature_value
+    from .get_iot_config import get_iot_config
+
+    timeout_seconds = args.timeout_seconds
+    ssl_verify = not args.insecure_skip_ssl_verify
     try:
         cfg = get_iot_config(
-            timeout_seconds=float(args.timeout_seconds),
-            ssl_verify=not bool(args.insecure_skip_ssl_verify),
+            timeout_seconds=timeout_seconds,
+            ssl_verify=ssl_verify,
             log_level=args.log_level,
             pkce_method=args.pkce_method,
             code_verifier=args.code_verifier,
-            token_cache_disabled=bool(args.no_token_cache),
+            token_cache_disabled=args.no_token_cache,
         )
-        value = get_feature_value(
+        feature = fetcher_mod.get_feature_data_disk_cached(
             args.feature,
             cfg,
-            timeout_seconds=float(args.timeout_seconds),
-            ssl_verify=not bool(args.insecure_skip_ssl_verify),
+            cache_path=None if args.no_feature_cache else config_mod.get_feature_cache_path(),
+            ttl_seconds=config_mod.get_feature_cache_ttl_seconds(),
+            timeout_seconds=timeout_seconds,
+            ssl_verify=ssl_verify,
         )
+        value = extract_feature_value(args.feature, feature)
         if value is None:
             print("null", file=sys.stdout)
             return 1
-        print(json.dumps(value, ensure_ascii=False, default=str))
+        print(auth_mod._json_dumps(value, default=str))
         return 0
     except auth_mod.CliError as e:
         print(f"Error: {auth_mod._sanitize_text(str(e))}", file=sys.stderr)
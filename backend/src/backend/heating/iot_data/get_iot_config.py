@@ -16,36 +16,61 @@ from each list endpoint and extract:
 
 from __future__ import annotations
 
-import argparse
 import json
 import os
+import secrets
 import sys
+import tempfile
 import time
-import uuid
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
-
-import requests
+from typing import TYPE_CHECKING, Any, Optional
 
 from ...shared import config as config_mod
 from ...viessmann.api_auth import auth as auth_mod
 
+if TYPE_CHECKING:
+    import argparse
+
+    # Only needed for annotations; HTTP goes through `auth_mod._build_session()`,
+    # so importers of this module don't pay for requests/urllib3 up front.
+    import requests
+
 # Buffer in seconds: treat token as expired this many seconds before actual expiry.
 _TOKEN_EXPIRY_BUFFER = 300  # 5 minutes
 
-# Module-level URL constants for testability.
+# Module-level URL constants for testability (`mod.IOT_INSTALLATIONS_URL`, monkeypatch).
 IOT_INSTALLATIONS_URL = config_mod.get_iot_installations_url()
 IOT_GATEWAYS_URL = config_mod.get_iot_gateways_url()
 IOT_DEVICES_URL_TMPL = config_mod.get_iot_devices_url_tmpl()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IotConfig:
     access_token: str
     installation_id: str
     gateway_serial: str
     device_id: str
+    # Per-device endpoint URLs, resolved once in __post_init__ (slots leave no
+    # __dict__ for functools.cached_property).
+    features_url: str = field(init=False, repr=False, compare=False)
+    _single_feature_url_parts: tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ids = {
+            "installation_id": self.installation_id,
+            "gateway_serial": self.gateway_serial,
+            "device_id": self.device_id,
+        }
+        head, _, tail = config_mod.get_iot_single_feature_url_tmpl().partition("{feature_path}")
+        object.__setattr__(self, "features_url", config_mod.get_iot_features_url_tmpl().format(**ids))
+        object.__setattr__(self, "_single_feature_url_parts", (head.format(**ids), tail.format(**ids)))
+
+    def single_feature_url(self, feature_path: str) -> str:
+        """Single-feature endpoint for this device; only `feature_path` varies per call."""
+        prefix, suffix = self._single_feature_url_parts
+        return prefix + feature_path + suffix
 
 
 def _build_auth_args(
@@ -59,8 +84,11 @@ def _build_auth_args(
     """
     Build an argparse.Namespace compatible with `api_auth.auth.load_config()`.
     """
+    import argparse
+
     return argparse.Namespace(
-        timeout_seconds=str(timeout_seconds),
+        # `load_config()` runs float() on this; no need to round-trip through str.
+        timeout_seconds=timeout_seconds,
         insecure_skip_ssl_verify=not bool(ssl_verify),
         pkce_method=pkce_method,
         code_verifier=code_verifier,
@@ -75,29 +103,69 @@ def load_token_cache(cache_path: Path) -> Optional[dict[str, Any]]:
     """
     Load token cache from file. Returns None if file does not exist or is invalid.
     """
-    if not cache_path.exists():
-        return None
     try:
-        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        data = auth_mod._json_loads(cache_path.read_bytes())
         if not isinstance(data, dict):
             return None
         required = {"access_token", "expires_at"}
         if not required.issubset(data.keys()):
             return None
         return data
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):  # missing/unreadable file; JSON decode errors are ValueErrors
         return None
 
 
+def _atomic_write_private(path: Path, data: bytes) -> None:
+    """
+    Atomically replace `path` with `data`, readable only by the owner.
+
+    mkstemp creates the temp file with 0o600 already (no separate chmod), and
+    os.replace is atomic on both POSIX and Windows.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def save_token_cache(cache_path: Path, data: dict[str, Any]) -> None:
     """
     Save token cache with atomic write and restrictive permissions (0o600).
     """
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
-    tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
-    tmp_path.chmod(0o600)
-    tmp_path.rename(cache_path)
+    _atomic_write_private(cache_path, auth_mod._json_dumpb(data))
+
+
+def _fast_cache_hit(cache_path: Path) -> Optional[IotConfig]:
+    """
+    Return an IotConfig straight from the token cache if it is complete and fresh.
+
+    Fresh means the same expiry rule as get_valid_token (with _TOKEN_EXPIRY_BUFFER);
+    complete means all three IoT ids are present. Otherwise returns None.
+    """
+    cached = load_token_cache(cache_path)
+    if cached is None:
+        return None
+    access_token = cached.get("access_token")
+    expires_at = cached.get("expires_at")
+    ids = (cached.get("installation_id"), cached.get("gateway_serial"), cached.get("device_id"))
+    if not access_token or not isinstance(expires_at, (int, float)) or not all(ids):
+        return None
+    if int(time.time()) >= expires_at - _TOKEN_EXPIRY_BUFFER:
+        return None
+    return IotConfig(
+        access_token=access_token,
+        installation_id=str(ids[0]),
+        gateway_serial=str(ids[1]),
+        device_id=str(ids[2]),
+    )
 
 
 def get_valid_token(
@@ -133,7 +201,6 @@ def get_valid_token(
                     log.debug(
                         "using cached token (expires_at=%s)",
                         expires_at,
-                        extra={"run_id": log.extra.get("run_id")},
                     )
                     return (
                         access_token,
@@ -158,32 +225,31 @@ def get_valid_token(
                             if token_response.expires_in is not None
                             else expires_at
                         )
+                        new_refresh_token = token_response.refresh_token or refresh_token
+                        # Token fields are always set; cached ids only when known.
                         save_data = {
                             "access_token": token_response.access_token,
-                            "refresh_token": token_response.refresh_token or refresh_token,
+                            "refresh_token": new_refresh_token,
                             "expires_at": new_expires,
-                            "installation_id": inst_id,
-                            "gateway_serial": gw_serial,
-                            "device_id": dev_id,
                         }
-                        save_token_cache(cache_path, {k: v for k, v in save_data.items() if v is not None})
-                        log.debug(
-                            "refreshed token and updated cache",
-                            extra={"run_id": log.extra.get("run_id")},
-                        )
+                        if inst_id is not None:
+                            save_data["installation_id"] = inst_id
+                        if gw_serial is not None:
+                            save_data["gateway_serial"] = gw_serial
+                        if dev_id is not None:
+                            save_data["device_id"] = dev_id
+                        save_token_cache(cache_path, save_data)
+                        log.debug("refreshed token and updated cache")
                         return (
                             token_response.access_token,
-                            token_response.refresh_token or refresh_token,
+                            new_refresh_token,
                             inst_id,
                             gw_serial,
                             dev_id,
                             new_expires,
                         )
                     except auth_mod.CliError:
-                        log.debug(
-                            "token refresh failed, falling back to full OAuth",
-                            extra={"run_id": log.extra.get("run_id")},
-                        )
+                        log.debug("token refresh failed, falling back to full OAuth")
                         # Fall through to full OAuth
 
     # 2. Full OAuth flow
@@ -219,26 +285,31 @@ def _extract_list(payload: Any, *, url: str, auth_mod) -> list[dict]:
     - {"data": {...}}  (single object, e.g. single-feature endpoint)
     - [...]           (bare list)
     """
+    # Parsed JSON only yields plain dict/list, so exact type() checks suffice.
     items: Any
-    if isinstance(payload, dict) and "data" in payload:
+    payload_type = type(payload)
+    if payload_type is dict and "data" in payload:
         data = payload["data"]
-        if isinstance(data, list):
+        data_type = type(data)
+        if data_type is list:
             items = data
-        elif isinstance(data, dict):
+        elif data_type is dict:
             items = [data]
         else:
             raise auth_mod.CliError(
                 f"Unexpected 'data' type from {url}: expected list or object."
             )
-    elif isinstance(payload, list):
+    elif payload_type is list:
         items = payload
     else:
         raise auth_mod.CliError(
             f"Unexpected JSON shape from {url}: expected list or dict with 'data'."
         )
 
-    # Defensive: enforce list[dict] shape for downstream key extraction.
-    if not all(isinstance(x, dict) for x in items):
+    # Defensive: callers read keys from items[0] (equipment lists), and feature
+    # lookups skip non-dict entries themselves, so checking the first item is
+    # enough; a full scan would cost a Python-level loop per response.
+    if items and not isinstance(items[0], dict):
         raise auth_mod.CliError(
             f"Unexpected items from {url}: expected list of objects."
         )
@@ -262,49 +333,86 @@ def _require_key(obj: dict, key: str, *, url: str, what: str, auth_mod) -> str:
     raise auth_mod.CliError(f"Missing or invalid '{key}' in first {what} item from {url}.")
 
 
-def api_get_json(*, session: requests.Session, url: str, access_token: str, cfg: Any, log, auth_mod) -> Any:
+def _body_preview(resp: Any, limit: int = 800) -> str:
+    """
+    First `limit` bytes of a response body as text, for error messages.
+
+    Decodes only the slice (UTF-8, invalid bytes replaced) instead of
+    `resp.text`, which runs encoding detection over the whole body.
+    """
+    return (resp.content or b"")[:limit].decode("utf-8", errors="replace")
+
+
+def api_get_json(
+    *,
+    session: requests.Session,
+    url: str,
+    access_token: str,
+    cfg: Any = None,
+    log,
+    auth_mod,
+    timeout: Optional[float] = None,
+    verify: Optional[bool] = None,
+) -> Any:
     """
     Shared IoT GET helper.
 
-    - Adds Authorization: Bearer
-    - Enforces timeout + TLS verification from `api_auth.auth.Config`
+    - Adds Authorization: Bearer (unless the session already carries it)
+    - Enforces timeout + TLS verification: `timeout`/`verify` when given
+      (callers snapshot them once), else read from `cfg` (`api_auth.auth.Config`)
     - Parses JSON and raises `CliError` on failures
     """
-    headers = {"Authorization": f"Bearer {access_token}"}
+    if timeout is None:
+        timeout = float(getattr(cfg, "timeout_seconds", 30.0))
+    if verify is None:
+        verify = bool(getattr(cfg, "ssl_verify", True))
+    authorization = f"Bearer {access_token}"
+    # get_iot_config sets the header on its session once; shared sessions (e.g. the
+    # feature fetcher's) may serve several tokens, so those get it per request.
+    headers = None if session.headers.get("Authorization") == authorization else {"Authorization": authorization}
     resp = session.get(
         url,
         headers=headers,
-        timeout=float(getattr(cfg, "timeout_seconds", 30.0)),
-        verify=bool(getattr(cfg, "ssl_verify", True)),
+        timeout=timeout,
+        verify=verify,
     )
 
     if resp.status_code >= 400:
-        body = (resp.text or "")[:800]
+        body = _body_preview(resp)
         raise auth_mod.CliError(
             f"GET {url} failed: HTTP {resp.status_code}. "
             f"Body (truncated, sanitized): {auth_mod._sanitize_text(body)!r}"
         )
 
     try:
-        return resp.json()
+        # Raw bytes: skips requests' text decoding; orjson when installed.
+        return auth_mod._json_loads(resp.content)
     except Exception as e:
-        body = (resp.text or "")[:800]
+        body = _body_preview(resp)
         raise auth_mod.CliError(
             f"GET {url} response was not valid JSON: {e}. Body: {auth_mod._sanitize_text(body)!r}"
         ) from e
 
 
-def get_installation_id(*, session: requests.Session, access_token: str, cfg: Any, log, auth_mod) -> str:
-    url = config_mod.get_iot_installations_url()
-    payload = api_get_json(session=session, url=url, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod)
+def get_installation_id(
+    *, session: requests.Session, access_token: str, cfg: Any, log, auth_mod, **http_kwargs: Any
+) -> str:
+    url = IOT_INSTALLATIONS_URL
+    payload = api_get_json(
+        session=session, url=url, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod, **http_kwargs
+    )
     items = _extract_list(payload, url=url, auth_mod=auth_mod)
     first = _require_first(items, url=url, what="installations", auth_mod=auth_mod)
     return _require_key(first, "id", url=url, what="installations", auth_mod=auth_mod)
 
 
-def get_gateway_serial(*, session: requests.Session, access_token: str, cfg: Any, log, auth_mod) -> str:
-    url = config_mod.get_iot_gateways_url()
-    payload = api_get_json(session=session, url=url, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod)
+def get_gateway_serial(
+    *, session: requests.Session, access_token: str, cfg: Any, log, auth_mod, **http_kwargs: Any
+) -> str:
+    url = IOT_GATEWAYS_URL
+    payload = api_get_json(
+        session=session, url=url, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod, **http_kwargs
+    )
     items = _extract_list(payload, url=url, auth_mod=auth_mod)
     first = _require_first(items, url=url, what="gateways", auth_mod=auth_mod)
     return _require_key(first, "serial", url=url, what="gateways", auth_mod=auth_mod)
@@ -319,11 +427,14 @@ def get_device_id(
     cfg: Any,
     log,
     auth_mod,
+    **http_kwargs: Any,
 ) -> str:
-    url = config_mod.get_iot_devices_url_tmpl().format(
+    url = IOT_DEVICES_URL_TMPL.format(
         installation_id=installation_id, gateway_serial=gateway_serial
     )
-    payload = api_get_json(session=session, url=url, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod)
+    payload = api_get_json(
+        session=session, url=url, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod, **http_kwargs
+    )
     items = _extract_list(payload, url=url, auth_mod=auth_mod)
     first = _require_first(items, url=url, what="devices", auth_mod=auth_mod)
     return _require_key(first, "id", url=url, what="devices", auth_mod=auth_mod)
@@ -349,10 +460,22 @@ def get_iot_config(
     - VIESSMANN_SCOPE        (optional)
     - VIESSMANN_TOKEN_CACHE_PATH (optional; empty = disabled)
     """
-    run_id = uuid.uuid4().hex[:12]
+    run_id = secrets.token_hex(6)
     effective_log_level = log_level or os.getenv("VIESSMANN_LOG_LEVEL") or "INFO"
     log = auth_mod.configure_logging(run_id=run_id, level=effective_log_level)
 
+    cache_path: Optional[Path] = None
+    if not token_cache_disabled:
+        cache_path = config_mod.get_token_cache_path()
+
+    # Warm path: a fresh token plus all three ids in the cache need no network,
+    # so skip credential loading and session setup entirely.
+    if cache_path is not None:
+        cached_config = _fast_cache_hit(cache_path)
+        if cached_config is not None:
+            log.debug("using cached token and IoT ids (no network calls)")
+            return cached_config
+
     args = _build_auth_args(
         timeout_seconds=timeout_seconds,
         ssl_verify=ssl_verify,
@@ -362,11 +485,9 @@ def get_iot_config(
     )
     cfg = auth_mod.load_config(args, log=log)
 
-    cache_path: Optional[Path] = None
-    if not token_cache_disabled:
-        cache_path = config_mod.get_token_cache_path()
-
-    session = requests.Session()
+    # Keep-alive pool per host (IAM for OAuth, API for the IoT lists) with retries
+    # limited to connection errors and gateway failures on idempotent requests.
+    session = auth_mod._build_session()
     access_token, refresh_token, cached_inst_id, cached_gw_serial, cached_dev_id, expires_at = get_valid_token(
         session=session,
         cfg=cfg,
@@ -375,13 +496,28 @@ def get_iot_config(
         cache_path=cache_path,
     )
 
+    # The session now only talks to the API host with this token.
+    session.headers["Authorization"] = f"Bearer {access_token}"
+    session.headers["Accept"] = "application/json"
+
     if cached_inst_id and cached_gw_serial and cached_dev_id:
         installation_id = cached_inst_id
         gateway_serial = cached_gw_serial
         device_id = cached_dev_id
     else:
-        installation_id = get_installation_id(session=session, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod)
-        gateway_serial = get_gateway_serial(session=session, access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod)
+        # Installations and gateways are independent lists: fetch them concurrently,
+        # each on its own Session over the shared adapters (requests.Session is not
+        # thread-safe); only the devices lookup needs both ids.
+        # Snapshot timeout/verify once instead of getattr + coercion on every GET.
+        http_kwargs = dict(timeout=float(cfg.timeout_seconds), verify=bool(cfg.ssl_verify))
+        common = dict(access_token=access_token, cfg=cfg, log=log, auth_mod=auth_mod, **http_kwargs)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            installation_future = pool.submit(
+                get_installation_id, session=auth_mod._worker_session(session), **common
+            )
+            gateway_future = pool.submit(get_gateway_serial, session=auth_mod._worker_session(session), **common)
+            installation_id = installation_future.result()
+            gateway_serial = gateway_future.result()
         device_id = get_device_id(
             session=session,
             access_token=access_token,
@@ -390,6 +526,7 @@ def get_iot_config(
             cfg=cfg,
             log=log,
             auth_mod=auth_mod,
+            **http_kwargs,
         )
         # Persist full config to cache for next run
         if cache_path is not None and refresh_token:
@@ -435,6 +572,8 @@ __all__ = ["IotConfig", "get_iot_config"]
 
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    import argparse
+
     p = argparse.ArgumentParser(
         description="Fetch Viessmann IoT identifiers (installation id, gateway serial, device id)."
     )
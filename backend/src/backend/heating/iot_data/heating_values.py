@@ -3,24 +3,31 @@
 Heating values retrieval for Viessmann IoT API.
 
 Fetches consumption, betriebsstunden, starts, supply temperature, and outside
-temperature in a single batch call. Reuses get_device_features and get_feature_value.
+temperature in a single batch call via get_feature_values_bulk.
 """
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, TypedDict
 
-import requests
+from .feature_data_fetcher import (
+    _device_features_cached,
+    _get_default_session,
+    clear_feature_cache,
+    get_single_feature,
+)
+from .feature_extractors import extract_feature_value, get_feature_values_bulk
+from .get_iot_config import IotConfig, _body_preview
 
-from ...shared import config as config_mod
-from .feature_data_fetcher import get_device_features
-from .feature_extractors import get_feature_value
-from .get_iot_config import IotConfig
+if TYPE_CHECKING:
+    import requests
 
 OPERATING_MODE_FEATURE = "heating.circuits.0.operating.modes.active"
 VALID_HEATING_MODES = frozenset({"heating", "standby"})
 
+_UTC = timezone.utc
+
 # Feature paths per plan: heating.gas.consumption.heating, supply temp from sensors
 HEATING_FEATURE_PATHS = [
     "heating.gas.consumption.heating",
@@ -31,6 +38,24 @@ HEATING_FEATURE_PATHS = [
 ]
 
 
+class HeatingValues(TypedDict):
+    """
+    Normalized result of get_heating_values.
+
+    A plain dict at runtime: it goes straight to json.dumps in the Lambdas and is
+    read with .get() by viessmann_submit, so there is no conversion at the boundary.
+    """
+
+    gas_consumption_m3_today: Optional[float]  # day.value[0] (m³ today so far)
+    gas_consumption_m3_yesterday: Optional[float]  # day.value[1] (m³ yesterday)
+    betriebsstunden: Optional[int]
+    starts: Optional[int]
+    supply_temp: Optional[float]
+    outside_temp: Optional[float]
+    operating_mode: Optional[str]
+    fetched_at: str  # ISO timestamp, UTC, whole seconds
+
+
 def _extract_gas_consumption_m3_pair(consumption_props: Any) -> tuple[Optional[float], Optional[float]]:
     """
     Extract (today, yesterday) gas consumption (m³) from heating.gas.consumption.heating properties.
@@ -38,25 +63,20 @@ def _extract_gas_consumption_m3_pair(consumption_props: Any) -> tuple[Optional[f
     Viessmann returns day/week/month/year arrays. day.value[0] is today so far,
     day.value[1] is yesterday. Returns (None, None) if invalid or empty.
     """
-    if consumption_props is None or not isinstance(consumption_props, dict):
-        return (None, None)
-    day_obj = consumption_props.get("day")
-    if not isinstance(day_obj, dict):
+    try:
+        val_arr = consumption_props["day"]["value"]
+    except (TypeError, KeyError):
         return (None, None)
-    val_arr = day_obj.get("value")
-    if not isinstance(val_arr, list) or len(val_arr) == 0:
+    if type(val_arr) is not list:
         return (None, None)
-    today_val = None
-    yesterday_val = None
-    try:
-        today_val = float(val_arr[0]) if len(val_arr) >= 1 else None
-    except (TypeError, ValueError):
-        pass
+    return (_float_at(val_arr, 0), _float_at(val_arr, 1))
+
+
+def _float_at(values: list[Any], index: int) -> Optional[float]:
     try:
-        yesterday_val = float(val_arr[1]) if len(val_arr) >= 2 else None
-    except (TypeError, ValueError):
-        pass
-    return (today_val, yesterday_val)
+        return float(values[index])
+    except (IndexError, TypeError, ValueError):
+        return None
 
 
 def get_heating_values(
@@ -64,76 +84,61 @@ def get_heating_values(
     *,
     timeout_seconds: float = 30.0,
     ssl_verify: bool = True,
-) -> dict[str, Any]:
+    session: Optional[requests.Session] = None,
+) -> HeatingValues:
     """
     Fetch all heating values in one batch and return a normalized dict.
 
+    HEATING_FEATURE_PATHS is above the bulk threshold, so this is a single
+    device-features GET followed by local lookups. Without `session`, the
+    fetcher's module-level pooled session is used, so warm Lambda invocations
+    reuse the open TLS connection.
+
+    When the device features come from the fetcher's memo, the operating mode
+    is re-read from the single-feature endpoint: set_heating_mode only clears
+    the memo of the process that ran it, so another warm Lambda container
+    would otherwise report the previous mode for up to the cache TTL.
+
     Returns:
-        {
-            "gas_consumption_m3_today": float | None,  # day.value[0] (m³ today so far)
-            "gas_consumption_m3_yesterday": float | None,  # day.value[1] (m³ yesterday)
-            "betriebsstunden": int | None,
-            "starts": int | None,
-            "supply_temp": float | None,
-            "outside_temp": float | None,
-            "fetched_at": str,  # ISO timestamp
-        }
+        HeatingValues dict (see its fields).
     """
-    features = get_device_features(
+    bulk_memoized = _device_features_cached(iot_config)
+    values = get_feature_values_bulk(
+        HEATING_FEATURE_PATHS,
         iot_config,
         timeout_seconds=timeout_seconds,
         ssl_verify=ssl_verify,
+        session=session,
     )
+    if bulk_memoized:
+        mode_feature = get_single_feature(
+            OPERATING_MODE_FEATURE,
+            iot_config,
+            timeout_seconds=timeout_seconds,
+            ssl_verify=ssl_verify,
+            session=session,
+            use_cache=False,
+        )
+        values[OPERATING_MODE_FEATURE] = extract_feature_value(OPERATING_MODE_FEATURE, mode_feature)
 
-    consumption_props = get_feature_value(
-        "heating.gas.consumption.heating",
-        iot_config,
-        features_data=features,
-        timeout_seconds=timeout_seconds,
-        ssl_verify=ssl_verify,
+    gas_today, gas_yesterday = _extract_gas_consumption_m3_pair(
+        values.get("heating.gas.consumption.heating")
     )
-    gas_today, gas_yesterday = _extract_gas_consumption_m3_pair(consumption_props)
 
-    burner_stats = get_feature_value(
-        "heating.burners.0.statistics",
-        iot_config,
-        features_data=features,
-        timeout_seconds=timeout_seconds,
-        ssl_verify=ssl_verify,
-    )
+    # The extractors already return typed values: burner statistics hold int | None
+    # (_coerce_int) and temperatures float | None (_coerce_float), and the gas pair
+    # is float | None, so no further coercion is needed below.
+    burner_stats = values.get("heating.burners.0.statistics")
     betriebsstunden = None
     starts = None
     if isinstance(burner_stats, dict):
         betriebsstunden = burner_stats.get("betriebsstunden")
         starts = burner_stats.get("starts")
 
-    supply_temp = get_feature_value(
-        "heating.circuits.0.sensors.temperature.supply",
-        iot_config,
-        features_data=features,
-        timeout_seconds=timeout_seconds,
-        ssl_verify=ssl_verify,
-    )
-    if supply_temp is not None and not isinstance(supply_temp, (int, float)):
-        supply_temp = None
-
-    outside_temp = get_feature_value(
-        "heating.sensors.temperature.outside",
-        iot_config,
-        features_data=features,
-        timeout_seconds=timeout_seconds,
-        ssl_verify=ssl_verify,
-    )
-    if outside_temp is not None and not isinstance(outside_temp, (int, float)):
-        outside_temp = None
+    supply_temp = values.get("heating.circuits.0.sensors.temperature.supply")
+    outside_temp = values.get("heating.sensors.temperature.outside")
 
-    operating_mode_props = get_feature_value(
-        "heating.circuits.0.operating.modes.active",
-        iot_config,
-        features_data=features,
-        timeout_seconds=timeout_seconds,
-        ssl_verify=ssl_verify,
-    )
+    operating_mode_props = values.get(OPERATING_MODE_FEATURE)
     operating_mode: Optional[str] = None
     if isinstance(operating_mode_props, dict):
         val = operating_mode_props.get("value")
@@ -143,14 +148,15 @@ def get_heating_values(
             operating_mode = val
 
     return {
-        "gas_consumption_m3_today": float(gas_today) if gas_today is not None else None,
-        "gas_consumption_m3_yesterday": float(gas_yesterday) if gas_yesterday is not None else None,
-        "betriebsstunden": int(betriebsstunden) if betriebsstunden is not None else None,
-        "starts": int(starts) if starts is not None else None,
-        "supply_temp": float(supply_temp) if supply_temp is not None else None,
-        "outside_temp": float(outside_temp) if outside_temp is not None else None,
+        "gas_consumption_m3_today": gas_today,
+        "gas_consumption_m3_yesterday": gas_yesterday,
+        "betriebsstunden": betriebsstunden,
+        "starts": starts,
+        "supply_temp": supply_temp,
+        "outside_temp": outside_temp,
         "operating_mode": operating_mode,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        # Seconds are plenty for a display timestamp and skip microsecond formatting.
+        "fetched_at": datetime.now(_UTC).isoformat(timespec="seconds"),
     }
 
 
@@ -160,6 +166,7 @@ def set_heating_mode(
     *,
     timeout_seconds: float = 30.0,
     ssl_verify: bool = True,
+    session: Optional[requests.Session] = None,
 ) -> None:
     """
     Set the heating operating mode via the Viessmann IoT API setMode command.
@@ -169,6 +176,7 @@ def set_heating_mode(
         iot_config: IoT configuration from get_iot_config().
         timeout_seconds: HTTP timeout.
         ssl_verify: Whether to verify TLS certificates.
+        session: Optional requests session (default: the fetcher's pooled session).
 
     Raises:
         ValueError: If mode is not a valid value.
@@ -177,16 +185,10 @@ def set_heating_mode(
     if mode not in VALID_HEATING_MODES:
         raise ValueError(f"Invalid mode {mode!r}; must be one of {sorted(VALID_HEATING_MODES)}")
 
-    tmpl = config_mod.get_iot_single_feature_url_tmpl()
-    feature_url = tmpl.format(
-        installation_id=iot_config.installation_id,
-        gateway_serial=iot_config.gateway_serial,
-        device_id=iot_config.device_id,
-        feature_path=OPERATING_MODE_FEATURE,
-    )
-    command_url = f"{feature_url}/commands/setMode"
+    command_url = f"{iot_config.single_feature_url(OPERATING_MODE_FEATURE)}/commands/setMode"
 
-    resp = requests.post(
+    sess = session if session is not None else _get_default_session()
+    resp = sess.post(
         command_url,
         json={"mode": mode},
         headers={"Authorization": f"Bearer {iot_config.access_token}"},
@@ -194,10 +196,12 @@ def set_heating_mode(
         verify=bool(ssl_verify),
     )
     if resp.status_code >= 400:
-        body = (resp.text or "")[:400]
+        body = _body_preview(resp, 400)
         raise RuntimeError(
             f"setMode command failed: HTTP {resp.status_code}. Body: {body!r}"
         )
+    # The memoized feature responses now hold the previous operating mode.
+    clear_feature_cache()
 
 
-__all__ = ["get_heating_values", "set_heating_mode"]
+__all__ = ["HeatingValues", "get_heating_values", "set_heating_mode"]
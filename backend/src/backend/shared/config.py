@@ -8,10 +8,16 @@ Environment variables:
   - VIESSMANN_IAM_BASE_URL       (optional, default: https://iam.viessmann-climatesolutions.com/idp/v3)
   - VIESSMANN_API_BASE_URL       (optional, default: https://api.viessmann-climatesolutions.com)
   - VIESSMANN_TOKEN_CACHE_PATH   (optional; path to token cache file; empty = disabled)
+  - VIESSMANN_FEATURE_CACHE_PATH (optional; CLI feature response cache file; empty = disabled)
+  - VIESSMANN_FEATURE_CACHE_TTL  (optional; feature cache lifetime in seconds, default: 30)
+
+URL getters are memoized: the environment is read once per process. Call
+reset_url_cache() after changing VIESSMANN_*_BASE_URL at runtime (e.g. in tests).
 """
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -21,6 +27,15 @@ from typing import Optional
 _DEFAULT_IAM_BASE = "https://iam.viessmann-climatesolutions.com/idp/v3"
 _DEFAULT_API_BASE = "https://api.viessmann-climatesolutions.com"
 
+_DOTENV_LOADED = False
+# Outcome of the one-time load, (env file, whether it set any variable), kept so
+# callers that pass a logger later (e.g. auth.load_config) still get diagnostics.
+_DOTENV_RESULT: Optional[tuple[Path, bool]] = None
+
+# Backend project root (directory with backend/pyproject.toml), resolved once:
+#   shared/config.py → backend(package) → src → backend(project)
+_PACKAGE_ROOT_ENV = Path(__file__).resolve().parents[3] / ".env"
+
 
 def _load_dotenv(log: Optional[logging.LoggerAdapter] = None) -> None:
     """
@@ -28,8 +43,8 @@ def _load_dotenv(log: Optional[logging.LoggerAdapter] = None) -> None:
 
     Search order:
     1. Current working directory (.env)
-    2. The backend package root — i.e. two levels up from this file
-       (backend/src/backend/config.py → backend/)
+    2. The backend project root, i.e. the directory with backend/pyproject.toml
+       (backend/src/backend/shared/config.py → backend/; see _PACKAGE_ROOT_ENV)
 
     Shell / CI environment variables already set take priority: we always
     call load_dotenv() with override=False so existing values are never
@@ -37,36 +52,46 @@ def _load_dotenv(log: Optional[logging.LoggerAdapter] = None) -> None:
 
     If python-dotenv is not installed the function is a no-op; credentials
     must then be exported in the calling shell instead.
+
+    The file is loaded at most once per process (on module import). Later
+    calls do not reload it; with `log` they only report which file was loaded.
     """
+    global _DOTENV_LOADED, _DOTENV_RESULT
+    if not _DOTENV_LOADED:
+        _DOTENV_LOADED = True
+        _DOTENV_RESULT = _find_and_load_dotenv()
+
+    if log is None or _DOTENV_RESULT is None:
+        return
+    env_file, loaded = _DOTENV_RESULT
+    if loaded:
+        log.debug("loaded .env from %s (shell vars take precedence)", env_file)
+    else:
+        log.debug(
+            ".env found at %s but all variables were already set in the environment",
+            env_file,
+        )
+
+
+def _find_and_load_dotenv() -> Optional[tuple[Path, bool]]:
+    """Load the first .env found (see _load_dotenv); None if none or no python-dotenv."""
     try:
         from dotenv import load_dotenv  # type: ignore[import-untyped]
     except ImportError:
-        return
+        return None
 
-    # Candidate 1: standard location – current working directory
-    cwd_env = Path.cwd() / ".env"
-    # Candidate 2: backend project root (directory with backend/pyproject.toml)
-    #   shared/config.py → backend(package) → src → backend(project)
-    package_root_env = Path(__file__).resolve().parents[3] / ".env"
+    # Candidate 1: standard location – current working directory (may change, so
+    # looked up per call; os.path avoids building a Path when no file exists).
+    # Candidate 2: backend project root (_PACKAGE_ROOT_ENV).
+    cwd_env = os.path.join(os.getcwd(), ".env")
+    if os.path.isfile(cwd_env):
+        env_file = Path(cwd_env)
+    elif _PACKAGE_ROOT_ENV.is_file():
+        env_file = _PACKAGE_ROOT_ENV
+    else:
+        return None
 
-    env_file: Optional[Path] = None
-    if cwd_env.is_file():
-        env_file = cwd_env
-    elif package_root_env.is_file():
-        env_file = package_root_env
-
-    if env_file is None:
-        return
-
-    loaded = load_dotenv(env_file, override=False)
-    if log is not None:
-        if loaded:
-            log.debug("loaded .env from %s (shell vars take precedence)", env_file)
-        else:
-            log.debug(
-                ".env found at %s but all variables were already set in the environment",
-                env_file,
-            )
+    return env_file, load_dotenv(env_file, override=False)
 
 
 def _get_env(name: str, default: Optional[str] = None) -> Optional[str]:
@@ -82,21 +107,25 @@ def _get_env(name: str, default: Optional[str] = None) -> Optional[str]:
 _load_dotenv()
 
 
+@functools.cache
 def get_iam_base_url() -> str:
     """Return IAM base URL (e.g. for /authorize, /token)."""
     return _get_env("VIESSMANN_IAM_BASE_URL", _DEFAULT_IAM_BASE) or _DEFAULT_IAM_BASE
 
 
+@functools.cache
 def get_api_base_url() -> str:
     """Return API base URL (e.g. for /users/me, /iot/...)."""
     return _get_env("VIESSMANN_API_BASE_URL", _DEFAULT_API_BASE) or _DEFAULT_API_BASE
 
 
+@functools.cache
 def get_authorize_url() -> str:
     """Return full OAuth authorize endpoint URL."""
     return f"{get_iam_base_url().rstrip('/')}/authorize"
 
 
+@functools.cache
 def get_token_url() -> str:
     """Return full OAuth token endpoint URL."""
     return f"{get_iam_base_url().rstrip('/')}/token"
@@ -121,21 +150,58 @@ def get_token_cache_path() -> Optional[Path]:
     return Path.home() / ".viessmann" / "tokens.json"
 
 
+def get_feature_cache_path() -> Optional[Path]:
+    """
+    Return path to the on-disk feature response cache, or None if disabled.
+
+    Same resolution as get_token_cache_path: VIESSMANN_FEATURE_CACHE_PATH
+    (empty = disabled), /tmp/viessmann/features.json in Lambda, otherwise
+    ~/.viessmann/features.json.
+    """
+    override = _get_env("VIESSMANN_FEATURE_CACHE_PATH")
+    if override is not None:
+        if not override:
+            return None
+        return Path(override).expanduser()
+    if _get_env("AWS_LAMBDA_FUNCTION_NAME"):
+        return Path("/tmp") / "viessmann" / "features.json"
+    return Path.home() / ".viessmann" / "features.json"
+
+
+def get_feature_cache_ttl_seconds() -> float:
+    """
+    Return the feature cache TTL (VIESSMANN_FEATURE_CACHE_TTL, default 30s).
+
+    Applies to the in-process response memo and the CLI's on-disk cache.
+    """
+    raw = _get_env("VIESSMANN_FEATURE_CACHE_TTL")
+    if raw is None:
+        return 30.0
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return 30.0
+
+
+@functools.cache
 def get_users_me_url() -> str:
     """Return /users/me endpoint URL."""
     return f"{get_api_base_url().rstrip('/')}/users/v1/users/me"
 
 
+@functools.cache
 def get_iot_installations_url() -> str:
     """Return IoT installations list endpoint URL."""
     return f"{get_api_base_url().rstrip('/')}/iot/v2/equipment/installations"
 
 
+@functools.cache
 def get_iot_gateways_url() -> str:
     """Return IoT gateways list endpoint URL."""
     return f"{get_api_base_url().rstrip('/')}/iot/v2/equipment/gateways"
 
 
+@functools.cache
 def get_iot_devices_url_tmpl() -> str:
     """
     Return IoT devices URL template with placeholders:
@@ -145,6 +211,7 @@ def get_iot_devices_url_tmpl() -> str:
     return f"{base}/iot/v2/equipment/installations/{{installation_id}}/gateways/{{gateway_serial}}/devices"
 
 
+@functools.cache
 def get_iot_features_url_tmpl() -> str:
     """
     Return IoT features URL template with placeholders:
@@ -154,6 +221,7 @@ def get_iot_features_url_tmpl() -> str:
     return f"{base}/iot/v2/features/installations/{{installation_id}}/gateways/{{gateway_serial}}/devices/{{device_id}}/features"
 
 
+@functools.cache
 def get_iot_single_feature_url_tmpl() -> str:
     """
     Return IoT single-feature URL template with placeholders:
@@ -162,3 +230,23 @@ def get_iot_single_feature_url_tmpl() -> str:
     """
     base = get_api_base_url().rstrip("/")
     return f"{base}/iot/v2/features/installations/{{installation_id}}/gateways/{{gateway_serial}}/devices/{{device_id}}/features/{{feature_path}}"
+
+
+_CACHED_URL_GETTERS = (
+    get_iam_base_url,
+    get_api_base_url,
+    get_authorize_url,
+    get_token_url,
+    get_users_me_url,
+    get_iot_installations_url,
+    get_iot_gateways_url,
+    get_iot_devices_url_tmpl,
+    get_iot_features_url_tmpl,
+    get_iot_single_feature_url_tmpl,
+)
+
+
+def reset_url_cache() -> None:
+    """Drop memoized URLs so the next getter call re-reads the environment."""
+    for getter in _CACHED_URL_GETTERS:
+        getter.cache_clear()
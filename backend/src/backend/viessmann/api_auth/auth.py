@@ -32,8 +32,8 @@ Notes:
 
 from __future__ import annotations
 
-import argparse
 import base64
+import functools
 import hashlib
 import json
 import logging
@@ -41,16 +41,26 @@ import os
 import re
 import secrets
 import sys
+import threading
 import time
-import uuid
 from dataclasses import dataclass
-from typing import Optional
-from urllib.parse import parse_qs, urlparse
-
-import requests
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from urllib.parse import unquote_plus
 
 from ...shared import config as _config
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import argparse
+
+    # `requests` (and urllib3, idna, certifi, ...) is imported lazily where HTTP
+    # actually happens, so importing this module for its helpers stays cheap.
+    import requests
+
 # Module-level URL constants for testability (used by test_vis_connect_get_iot_config).
 AUTHORIZE_URL = _config.get_authorize_url()
 TOKEN_URL = _config.get_token_url()
@@ -87,7 +97,7 @@ def configure_logging(*, run_id: str, level: str) -> logging.LoggerAdapter:
     Configure logging for CLI runs.
 
     - Uses root logger configuration only if nothing is configured yet.
-    - Adds a run_id to all records so we can correlate multi-step flows.
+    - Adds a run_id to all handled records so we can correlate multi-step flows.
     """
     root = logging.getLogger()
     if not root.handlers:
@@ -98,40 +108,62 @@ def configure_logging(*, run_id: str, level: str) -> logging.LoggerAdapter:
     else:
         root.setLevel(_coerce_log_level(level))
 
-    # Ensure *every* log record can be formatted with %(run_id)s, even if emitted
-    # by a 3rd-party library or by a logger not wrapped in our LoggerAdapter.
-    old_factory = logging.getLogRecordFactory()
-
-    def record_factory(*args, **kwargs):  # type: ignore[no-untyped-def]
-        record = old_factory(*args, **kwargs)
-        if not hasattr(record, "run_id"):
-            record.run_id = run_id
-        return record
-
-    logging.setLogRecordFactory(record_factory)
-
-    # Also attach a filter to handlers so run_id is present even if a different
-    # record factory is installed later (belt-and-suspenders).
+    # Stamp run_id via handler filters only: they run for every record that
+    # reaches a handler (including records propagated from 3rd-party loggers),
+    # while records dropped by level never pay for it. Replace filters left by
+    # an earlier call (e.g. a previous warm Lambda invocation) so the current
+    # run_id wins instead of the first one ever installed.
     for h in root.handlers:
+        for f in [f for f in h.filters if isinstance(f, _RunIdFilter)]:
+            h.removeFilter(f)
         h.addFilter(_RunIdFilter(run_id))
 
     logger = logging.getLogger("backend.viessmann.api_auth")
-    # We intentionally do NOT inject run_id via LoggerAdapter `extra`, because
-    # our LogRecordFactory already sets run_id on every record. Injecting it
-    # twice would raise KeyError ("Attempt to overwrite 'run_id' in LogRecord").
+    # We intentionally do NOT inject run_id via LoggerAdapter `extra`: the
+    # handler filters above already set it, and the adapter would otherwise
+    # overwrite per-call `extra` mappings.
     return logging.LoggerAdapter(logger, {})
 
 
-_SENSITIVE_KEYS = {
-    "password",
-    "access_token",
-    "refresh_token",
-    "id_token",
-    "client_secret",
-    "code_verifier",
-    "code",
-    "authorization",
-}
+_SENSITIVE_KEYS = frozenset(
+    {
+        "password",
+        "access_token",
+        "refresh_token",
+        "id_token",
+        "client_secret",
+        "code_verifier",
+        "code",
+        "authorization",
+    }
+)
+
+
+def _is_sensitive(key: object) -> bool:
+    """
+    Return True if `key` names a secret-bearing field (case-insensitive).
+
+    JSON keys are usually already lowercase, so the exact-match check
+    short-circuits before allocating a lowered copy. Non-string keys never match.
+    """
+    return isinstance(key, str) and (key in _SENSITIVE_KEYS or key.lower() in _SENSITIVE_KEYS)
+
+
+class _LazyStr:
+    """
+    Defer building a log argument until the record is actually formatted.
+
+    `logging` only calls `str()` on arguments in `LogRecord.getMessage()`,
+    which never runs for records dropped by level.
+    """
+
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn: Callable[[], object]) -> None:
+        self._fn = fn
+
+    def __str__(self) -> str:
+        return str(self._fn())
 
 
 def _redact(value: object) -> str:
@@ -169,7 +201,7 @@ def _sanitize_mapping(d: dict) -> dict:
     """
     safe: dict = {}
     for k, v in d.items():
-        if str(k).lower() in _SENSITIVE_KEYS:
+        if _is_sensitive(k):
             safe[k] = _redact_sensitive(v)
         else:
             safe[k] = v
@@ -179,20 +211,71 @@ def _sanitize_mapping(d: dict) -> dict:
 def _sanitize_obj(obj: object) -> object:
     """
     Deep-sanitize JSON-like objects (dict/list/tuple) for safe logging.
+
+    Walks the structure with an explicit stack instead of recursion. Tuples are
+    built as lists first and frozen deepest-first once all children are filled in.
+    Each entry carries the ids of the containers above it, so a container that
+    contains itself raises ValueError (as json.dumps does) instead of looping;
+    shared, non-circular substructures are simply sanitized once per reference.
     """
-    if isinstance(obj, dict):
-        out: dict = {}
-        for k, v in obj.items():
-            if str(k).lower() in _SENSITIVE_KEYS:
-                out[k] = _redact_sensitive(v)
-            else:
-                out[k] = _sanitize_obj(v)
-        return out
-    if isinstance(obj, list):
-        return [_sanitize_obj(v) for v in obj]
-    if isinstance(obj, tuple):
-        return tuple(_sanitize_obj(v) for v in obj)
-    return obj
+    if not isinstance(obj, (dict, list, tuple)):
+        return obj
+
+    root: list = [None]
+    stack: list[tuple[object, object, object, frozenset[int]]] = [(obj, root, 0, frozenset())]
+    tuples: list[tuple[list, object, object]] = []
+    while stack:
+        value, parent, slot, ancestors = stack.pop()
+        if id(value) in ancestors:
+            raise ValueError("Circular reference detected")
+        ancestors = ancestors | {id(value)}
+        if isinstance(value, dict):
+            out: dict = {}
+            for k, v in value.items():
+                if _is_sensitive(k):
+                    out[k] = _redact_sensitive(v)
+                else:
+                    out[k] = v
+                    if isinstance(v, (dict, list, tuple)):
+                        stack.append((v, out, k, ancestors))
+            parent[slot] = out  # type: ignore[index]
+        else:
+            items = list(value)  # type: ignore[call-overload]
+            for i, v in enumerate(items):
+                if isinstance(v, (dict, list, tuple)):
+                    stack.append((v, items, i, ancestors))
+            parent[slot] = items  # type: ignore[index]
+            if isinstance(value, tuple):
+                tuples.append((items, parent, slot))
+
+    for items, parent, slot in reversed(tuples):
+        parent[slot] = tuple(items)  # type: ignore[index]
+    return root[0]
+
+
+# Single-pass scrub of OAuth secrets in free-form text. Alternatives:
+#   1/2: JSON-ish tokens ("access_token":"...")
+#   3:   form/query-ish tokens (access_token=...)
+#   4:   authorization codes in redirect URLs or HTML (code=...)
+_TOKEN_SCRUB_RE = re.compile(
+    r'("(?:access_token|refresh_token|id_token)"\s*:\s*")[^"]+(")'
+    r"|((?:access_token|refresh_token|id_token)=)[^&\s]+"
+    r'|(code=)[^&"\s]+',
+    re.IGNORECASE,
+)
+# Every alternative above requires one of these literals, so a cheap substring
+# check lets token-free bodies (e.g. HTML error pages) skip the regex entirely.
+_TOKEN_SCRUB_MARKERS = ("access_token", "refresh_token", "id_token", "code=")
+# The check runs on text.casefold(), which folds every other IGNORECASE variant
+# of the marker letters (e.g. "ſ", the Kelvin sign) but leaves dotless "ı" alone
+# and turns "İ" into "i" + U+0307; map those two so no variant skips the scrub.
+_TOKEN_SCRUB_FOLD = str.maketrans({"\u0131": "i", "\u0307": None})
+
+
+def _scrub_token_match(m: re.Match) -> str:
+    if m.group(1) is not None:
+        return f"{m.group(1)}<redacted>{m.group(2)}"
+    return f"{m.group(3) or m.group(4)}<redacted>"
 
 
 def _sanitize_text(text: str) -> str:
@@ -203,17 +286,45 @@ def _sanitize_text(text: str) -> str:
     """
     if not text:
         return text
-    # JSON-ish tokens: "access_token":"..."
-    scrubbed = re.sub(r'("access_token"\s*:\s*")[^"]+(")', r'\1<redacted>\2', text, flags=re.IGNORECASE)
-    scrubbed = re.sub(r'("refresh_token"\s*:\s*")[^"]+(")', r'\1<redacted>\2', scrubbed, flags=re.IGNORECASE)
-    scrubbed = re.sub(r'("id_token"\s*:\s*")[^"]+(")', r'\1<redacted>\2', scrubbed, flags=re.IGNORECASE)
-    # Form/query-ish tokens: access_token=...
-    scrubbed = re.sub(r"(access_token=)[^&\s]+", r"\1<redacted>", scrubbed, flags=re.IGNORECASE)
-    scrubbed = re.sub(r"(refresh_token=)[^&\s]+", r"\1<redacted>", scrubbed, flags=re.IGNORECASE)
-    scrubbed = re.sub(r"(id_token=)[^&\s]+", r"\1<redacted>", scrubbed, flags=re.IGNORECASE)
-    # Authorization codes can appear in redirect URLs or HTML.
-    scrubbed = re.sub(r"(code=)[^&\"\s]+", r"\1<redacted>", scrubbed, flags=re.IGNORECASE)
-    return scrubbed
+    folded = text.casefold().translate(_TOKEN_SCRUB_FOLD)
+    if not any(marker in folded for marker in _TOKEN_SCRUB_MARKERS):
+        return text
+    return _TOKEN_SCRUB_RE.sub(_scrub_token_match, text)
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    """
+    Parse a JSON response body. Uses orjson when installed (pass `resp.content`
+    to skip the intermediate text decode), stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any, *, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize JSON for CLI output (UTF-8, not ASCII-escaped).
+
+    `default` converts otherwise unserializable values, as in json.dumps.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True, default=default)
+    return json.dumps(obj, ensure_ascii=False, default=default)
+
+
+def _json_dumpb(obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize JSON to UTF-8 bytes for file writes (compact, not ASCII-escaped).
+
+    orjson already produces bytes, so no str round trip is needed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, ensure_ascii=False, default=default).encode("utf-8")
 
 
 def _base64url_no_padding(raw: bytes) -> str:
@@ -231,34 +342,41 @@ def generate_code_verifier(length: int = 64) -> str:
     """
     if length < 43 or length > 128:
         raise ValueError("PKCE code_verifier length must be 43..128")
-    # token_urlsafe(n) returns a string length ~ ceil(n*4/3).
-    # We trim to desired length for determinism.
-    return secrets.token_urlsafe(96)[:length]
+    # token_urlsafe(n) returns ceil(n*4/3) chars, so ceil(length*3/4) random
+    # bytes are the minimum that covers `length`; trim any excess char.
+    return secrets.token_urlsafe((length * 3 + 3) // 4)[:length]
+
+
+def _sha256_b64url(verifier: str) -> str:
+    return _base64url_no_padding(hashlib.sha256(verifier.encode("ascii")).digest())
 
 
 def code_challenge_s256(verifier: str) -> str:
-    digest = hashlib.sha256(verifier.encode("ascii")).digest()
-    return _base64url_no_padding(digest)
+    return _sha256_b64url(verifier)
 
 
 def code_challenge_plain(verifier: str) -> str:
     return verifier
 
 
+# `code` parameter in the query string of a URL / Location header value.
+_CODE_IN_QUERY_RE = re.compile(r"(?:^|&)code=([^&\s]+)")
+# PHP used: /code=(.*)"/ (greedy). We use non-greedy and stop at " or & or whitespace.
+_CODE_IN_BODY_RE = re.compile(r'code=([^"&\s]+)')
+
+
 def _extract_code_from_url(url: str) -> Optional[str]:
     """
     Extract ?code=... from a URL (or Location header value).
     Returns None if no code is present.
     """
-    try:
-        parsed = urlparse(url)
-        qs = parse_qs(parsed.query)
-        values = qs.get("code")
-        if values and values[0]:
-            return values[0]
-    except Exception:
+    # Only the query string counts: "&code=" in a path or fragment is not a parameter.
+    query = url.partition("#")[0].partition("?")[2]
+    m = _CODE_IN_QUERY_RE.search(query)
+    if m is None:
         return None
-    return None
+    # Decode like parse_qs would (percent-escapes and '+').
+    return unquote_plus(m.group(1)) or None
 
 
 def extract_authorization_code(*, response: requests.Response, log: Optional[logging.LoggerAdapter] = None) -> str:
@@ -271,10 +389,7 @@ def extract_authorization_code(*, response: requests.Response, log: Optional[log
         code = _extract_code_from_url(location)
         if code:
             if log is not None:
-                log.debug(
-                    "authorization code extracted from Location header",
-                    extra={"run_id": log.extra.get("run_id")},
-                )
+                log.debug("authorization code extracted from Location header")
             return code
 
     # 2) Final URL (if redirects were followed elsewhere).
@@ -282,22 +397,15 @@ def extract_authorization_code(*, response: requests.Response, log: Optional[log
         code = _extract_code_from_url(response.url)
         if code:
             if log is not None:
-                log.debug(
-                    "authorization code extracted from response.url",
-                    extra={"run_id": log.extra.get("run_id")},
-                )
+                log.debug("authorization code extracted from response.url")
             return code
 
     # 3) Fallback: HTML/text body regex similar to the PHP script.
-    # PHP used: /code=(.*)"/ (greedy). We use non-greedy and stop at " or & or whitespace.
     body = response.text or ""
-    m = re.search(r'code=([^"&\s]+)', body)
+    m = _CODE_IN_BODY_RE.search(body)
     if m:
         if log is not None:
-            log.debug(
-                "authorization code extracted from response body regex",
-                extra={"run_id": log.extra.get("run_id")},
-            )
+            log.debug("authorization code extracted from response body regex")
         return m.group(1)
 
     raise CliError(
@@ -327,6 +435,17 @@ class Config:
     pkce_method: str  # "S256" or "plain"
     code_verifier: str
 
+    @functools.cached_property
+    def code_challenge(self) -> str:
+        """PKCE code_challenge derived from `code_verifier` (computed once per Config)."""
+        if self.pkce_method == "S256":
+            return code_challenge_s256(self.code_verifier)
+        return code_challenge_plain(self.code_verifier)
+
+    @property
+    def code_challenge_method(self) -> str:
+        return "S256" if self.pkce_method == "S256" else "plain"
+
 
 def _get_env(name: str) -> Optional[str]:
     value = os.getenv(name)
@@ -349,27 +468,25 @@ def load_config(args: argparse.Namespace, *, log: logging.LoggerAdapter) -> Conf
         raise CliError(f"Missing required environment variables: {', '.join(missing)}")
 
     # Log high-level config without leaking secrets/PII.
-    email_hash = hashlib.sha256(email.lower().encode("utf-8")).hexdigest()[:12] if email else "<none>"
-    log.info(
-        "loaded configuration",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "config details (sanitized): %s",
-        _sanitize_mapping(
-            {
-                "client_id": _redact(client_id),
-                "email_sha256_12": email_hash,
-                "callback_uri": callback_uri,
-                "scope": scope,
-                "timeout_seconds": args.timeout_seconds,
-                "ssl_verify": not bool(args.insecure_skip_ssl_verify),
-                "pkce_method_arg": args.pkce_method,
-                "code_verifier_arg_provided": bool(args.code_verifier),
-            }
-        ),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("loaded configuration")
+    if log.isEnabledFor(logging.DEBUG):
+        # Log-correlation id only (not authentication): 6-byte BLAKE2b = 12 hex chars.
+        email_hash = hashlib.blake2b(email.lower().encode("utf-8"), digest_size=6).hexdigest() if email else "<none>"
+        log.debug(
+            "config details (sanitized): %s",
+            _sanitize_mapping(
+                {
+                    "client_id": _redact(client_id),
+                    "email_blake2b_12": email_hash,
+                    "callback_uri": callback_uri,
+                    "scope": scope,
+                    "timeout_seconds": args.timeout_seconds,
+                    "ssl_verify": not bool(args.insecure_skip_ssl_verify),
+                    "pkce_method_arg": args.pkce_method,
+                    "code_verifier_arg_provided": bool(args.code_verifier),
+                }
+            ),
+        )
 
     # PKCE config
     pkce_method = (args.pkce_method or _get_env("VIESSMANN_PKCE_METHOD") or "S256").strip()
@@ -392,6 +509,13 @@ def load_config(args: argparse.Namespace, *, log: logging.LoggerAdapter) -> Conf
     )
 
 
+# PHP sets a form content-type and uses POST; we mirror that behavior. Shared,
+# never mutated: requests merges per-call headers into a new dict.
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+# Log-safe view of the only header sent with bearer-authenticated GETs.
+_BEARER_HEADERS_SANITIZED = {"Authorization": "<redacted>"}
+
+
 def request_authorization_code(*, session: requests.Session, cfg: Config, log: logging.LoggerAdapter) -> str:
     """
     Do the authorize call and return the extracted code.
@@ -399,72 +523,57 @@ def request_authorization_code(*, session: requests.Session, cfg: Config, log: l
     We intentionally do NOT follow redirects to avoid trying to connect to
     localhost (the typical redirect_uri).
     """
-    if cfg.pkce_method == "S256":
-        challenge = code_challenge_s256(cfg.code_verifier)
-        challenge_method = "S256"
-    else:
-        challenge = code_challenge_plain(cfg.code_verifier)
-        challenge_method = "plain"
-
     params = {
         "client_id": cfg.client_id,
-        "code_challenge": challenge,
-        "code_challenge_method": challenge_method,
+        "code_challenge": cfg.code_challenge,
+        "code_challenge_method": cfg.code_challenge_method,
         "scope": cfg.scope,
         "redirect_uri": cfg.callback_uri,
         "response_type": "code",
     }
 
-    # PHP sets a form content-type and uses POST; we mirror that behavior.
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
-    log.info(
-        "requesting authorization code",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "authorize request details (sanitized): %s",
-        _sanitize_mapping(
-            {
-                "url": _config.get_authorize_url(),
-                "params": _sanitize_mapping(params),
-                "headers": _sanitize_mapping(headers),
-                "auth_username": "<redacted>",  # email
-                "auth_password": "<redacted>",
-                "timeout_seconds": cfg.timeout_seconds,
-                "ssl_verify": cfg.ssl_verify,
-                "allow_redirects": False,
-            }
-        ),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("requesting authorization code")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "authorize request details (sanitized): %s",
+            _sanitize_mapping(
+                {
+                    "url": _config.get_authorize_url(),
+                    "params": _sanitize_mapping(params),
+                    "headers": _FORM_HEADERS,
+                    "auth_username": "<redacted>",  # email
+                    "auth_password": "<redacted>",
+                    "timeout_seconds": cfg.timeout_seconds,
+                    "ssl_verify": cfg.ssl_verify,
+                    "allow_redirects": False,
+                }
+            ),
+        )
 
     start = time.perf_counter()
     resp = session.post(
         _config.get_authorize_url(),
         params=params,
         data=b"",
-        headers=headers,
+        headers=_FORM_HEADERS,
         auth=(cfg.email, cfg.password),
         timeout=cfg.timeout_seconds,
         verify=cfg.ssl_verify,
         allow_redirects=False,
     )
     elapsed_ms = int((time.perf_counter() - start) * 1000)
-    log.info(
-        "authorize response received",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "authorize response details: %s",
-        {
-            "status_code": resp.status_code,
-            "elapsed_ms": elapsed_ms,
-            "has_location_header": bool(resp.headers.get("Location") or resp.headers.get("location")),
-            "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
-            "content_length": resp.headers.get("Content-Length") or resp.headers.get("content-length"),
-        },
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("authorize response received")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "authorize response details: %s",
+            {
+                "status_code": resp.status_code,
+                "elapsed_ms": elapsed_ms,
+                "has_location_header": bool(resp.headers.get("Location") or resp.headers.get("location")),
+                "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
+                "content_length": resp.headers.get("Content-Length") or resp.headers.get("content-length"),
+            },
+        )
 
     # Some IDPs use 302 for /authorize. Treat 2xx/3xx as potentially valid.
     if resp.status_code >= 400:
@@ -477,7 +586,6 @@ def request_authorization_code(*, session: requests.Session, cfg: Config, log: l
     log.debug(
         "authorization code extracted (length=%s)",
         len(code),
-        extra={"run_id": log.extra.get("run_id")},
     )
     return code
 
@@ -489,7 +597,6 @@ def _parse_token_payload(payload: dict, *, log: logging.LoggerAdapter) -> TokenR
         log.warning(
             "token response missing access_token (keys=%s)",
             sorted(payload.keys()),
-            extra={"run_id": log.extra.get("run_id")},
         )
         raise CliError(f"/token response missing access_token. Keys: {sorted(payload.keys())}")
 
@@ -517,45 +624,41 @@ def exchange_code_for_token(*, session: requests.Session, cfg: Config, code: str
         "redirect_uri": cfg.callback_uri,
         "code": code,
     }
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-    log.info(
-        "exchanging authorization code for access token",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "token request details (sanitized): %s",
-        _sanitize_mapping(
-            {
-                "url": _config.get_token_url(),
-                "params": _sanitize_mapping(params),
-                "headers": _sanitize_mapping(headers),
-                "timeout_seconds": cfg.timeout_seconds,
-                "ssl_verify": cfg.ssl_verify,
-            }
-        ),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("exchanging authorization code for access token")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "token request details (sanitized): %s",
+            _sanitize_mapping(
+                {
+                    "url": _config.get_token_url(),
+                    "params": _sanitize_mapping(params),
+                    "headers": _FORM_HEADERS,
+                    "timeout_seconds": cfg.timeout_seconds,
+                    "ssl_verify": cfg.ssl_verify,
+                }
+            ),
+        )
 
     start = time.perf_counter()
     resp = session.post(
         _config.get_token_url(),
         params=params,
         data=b"",
-        headers=headers,
+        headers=_FORM_HEADERS,
         timeout=cfg.timeout_seconds,
         verify=cfg.ssl_verify,
     )
     elapsed_ms = int((time.perf_counter() - start) * 1000)
-    log.debug(
-        "token response details: %s",
-        {
-            "status_code": resp.status_code,
-            "elapsed_ms": elapsed_ms,
-            "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
-        },
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "token response details: %s",
+            {
+                "status_code": resp.status_code,
+                "elapsed_ms": elapsed_ms,
+                "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
+            },
+        )
 
     if resp.status_code >= 400:
         raise CliError(
@@ -564,28 +667,21 @@ def exchange_code_for_token(*, session: requests.Session, cfg: Config, code: str
         )
 
     try:
-        payload = resp.json()
+        payload = _json_loads(resp.content)
     except Exception as e:
         raise CliError(
             f"/token response was not valid JSON: {e}. Body: {_sanitize_text((resp.text or '')[:800])!r}"
         ) from e
 
-    log.debug(
-        "token response body (sanitized): %s",
-        _sanitize_obj(payload),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "token response body (sanitized): %s",
+            _sanitize_obj(payload),
+        )
 
     token_response = _parse_token_payload(payload, log=log)
-    log.info(
-        "access token acquired",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "token response keys: %s",
-        sorted(payload.keys()),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("access token acquired")
+    log.debug("token response keys: %s", _LazyStr(lambda: sorted(payload.keys())))
     return token_response
 
 
@@ -606,45 +702,41 @@ def refresh_access_token(
         "client_id": cfg.client_id,
         "refresh_token": refresh_token,
     }
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-    log.info(
-        "refreshing access token",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "token refresh request details (sanitized): %s",
-        _sanitize_mapping(
-            {
-                "url": _config.get_token_url(),
-                "params": _sanitize_mapping(params),
-                "headers": _sanitize_mapping(headers),
-                "timeout_seconds": cfg.timeout_seconds,
-                "ssl_verify": cfg.ssl_verify,
-            }
-        ),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("refreshing access token")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "token refresh request details (sanitized): %s",
+            _sanitize_mapping(
+                {
+                    "url": _config.get_token_url(),
+                    "params": _sanitize_mapping(params),
+                    "headers": _FORM_HEADERS,
+                    "timeout_seconds": cfg.timeout_seconds,
+                    "ssl_verify": cfg.ssl_verify,
+                }
+            ),
+        )
 
     start = time.perf_counter()
     resp = session.post(
         _config.get_token_url(),
         params=params,
         data=b"",
-        headers=headers,
+        headers=_FORM_HEADERS,
         timeout=cfg.timeout_seconds,
         verify=cfg.ssl_verify,
     )
     elapsed_ms = int((time.perf_counter() - start) * 1000)
-    log.debug(
-        "token refresh response details: %s",
-        {
-            "status_code": resp.status_code,
-            "elapsed_ms": elapsed_ms,
-            "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
-        },
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "token refresh response details: %s",
+            {
+                "status_code": resp.status_code,
+                "elapsed_ms": elapsed_ms,
+                "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
+            },
+        )
 
     if resp.status_code >= 400:
         raise CliError(
@@ -653,24 +745,21 @@ def refresh_access_token(
         )
 
     try:
-        payload = resp.json()
+        payload = _json_loads(resp.content)
     except Exception as e:
         raise CliError(
             f"/token refresh response was not valid JSON: {e}. "
             f"Body: {_sanitize_text((resp.text or '')[:800])!r}"
         ) from e
 
-    log.debug(
-        "token refresh response body (sanitized): %s",
-        _sanitize_obj(payload),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "token refresh response body (sanitized): %s",
+            _sanitize_obj(payload),
+        )
 
     token_response = _parse_token_payload(payload, log=log)
-    log.info(
-        "access token refreshed",
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("access token refreshed")
     return token_response
 
 
@@ -678,23 +767,20 @@ def fetch_users_me(*, session: requests.Session, cfg: Config, access_token: str,
     params = {"sections": "identity"}
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    log.info(
-        "fetching /users/me",
-        extra={"run_id": log.extra.get("run_id")},
-    )
-    log.debug(
-        "users/me request details (sanitized): %s",
-        _sanitize_mapping(
-            {
-                "url": _config.get_users_me_url(),
-                "params": _sanitize_mapping(params),
-                "headers": _sanitize_mapping(headers),
-                "timeout_seconds": cfg.timeout_seconds,
-                "ssl_verify": cfg.ssl_verify,
-            }
-        ),
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    log.info("fetching /users/me")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "users/me request details (sanitized): %s",
+            _sanitize_mapping(
+                {
+                    "url": _config.get_users_me_url(),
+                    "params": _sanitize_mapping(params),
+                    "headers": _BEARER_HEADERS_SANITIZED,
+                    "timeout_seconds": cfg.timeout_seconds,
+                    "ssl_verify": cfg.ssl_verify,
+                }
+            ),
+        )
 
     start = time.perf_counter()
     resp = session.get(
@@ -705,15 +791,15 @@ def fetch_users_me(*, session: requests.Session, cfg: Config, access_token: str,
         verify=cfg.ssl_verify,
     )
     elapsed_ms = int((time.perf_counter() - start) * 1000)
-    log.debug(
-        "users/me response details: %s",
-        {
-            "status_code": resp.status_code,
-            "elapsed_ms": elapsed_ms,
-            "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
-        },
-        extra={"run_id": log.extra.get("run_id")},
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "users/me response details: %s",
+            {
+                "status_code": resp.status_code,
+                "elapsed_ms": elapsed_ms,
+                "content_type": resp.headers.get("Content-Type") or resp.headers.get("content-type"),
+            },
+        )
 
     if resp.status_code >= 400:
         raise CliError(
@@ -721,29 +807,142 @@ def fetch_users_me(*, session: requests.Session, cfg: Config, access_token: str,
             f"Body (truncated, sanitized): {_sanitize_text((resp.text or '')[:800])!r}"
         )
 
+    # Parse the raw bytes: no intermediate `resp.text` copy on the success path.
+    # Compression needs no extra setup; requests already sends
+    # Accept-Encoding: gzip, deflate and decodes transparently.
     try:
-        payload = resp.json()
+        payload = _json_loads(resp.content)
     except Exception as e:
         raise CliError(
             f"/users/me response was not valid JSON: {e}. Body: {_sanitize_text((resp.text or '')[:800])!r}"
         ) from e
 
     if isinstance(payload, dict):
-        log.debug(
-            "users/me response keys: %s",
-            sorted(payload.keys()),
-            extra={"run_id": log.extra.get("run_id")},
-        )
+        log.debug("users/me response keys: %s", _LazyStr(lambda: sorted(payload.keys())))
     else:
         log.debug(
             "users/me response type: %s",
             type(payload).__name__,
-            extra={"run_id": log.extra.get("run_id")},
         )
     return payload
 
 
+def _build_session(*, pool_connections: int = 2, pool_maxsize: int = 4) -> requests.Session:
+    """
+    Build the HTTP session shared by the /authorize -> /token -> /users/me flow
+    (also used by `get_iot_config` for OAuth plus the IoT equipment lists, and
+    by the feature fetcher with a larger pool).
+
+    /authorize and /token hit the IAM host, /users/me the API host; one
+    keep-alive pool per host lets each reuse its TCP+TLS connection. Retries
+    only cover connection errors and gateway failures on idempotent requests
+    (urllib3's default `allowed_methods`), so the single-use authorization
+    code is never replayed. Once retries run out the last 502/503/504 is
+    returned (`raise_on_status=False`), so callers' `status_code >= 400`
+    handling still turns it into a sanitized CliError.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _worker_session(base: requests.Session) -> requests.Session:
+    """
+    Return a new Session for one worker thread that shares `base`'s adapters.
+
+    requests.Session is not thread-safe (headers, cookies and the adapter map
+    are plain mutable state), but its HTTPAdapters are: their urllib3 pools
+    hand out connections under a lock. So concurrent fetches each get their
+    own Session with a snapshot of `base`'s settings, and still reuse its
+    keep-alive connections. Create it before starting the worker, and do not
+    close it: that would close the adapters `base` still uses.
+    """
+    import requests
+
+    session = requests.Session()
+    session.headers = base.headers.copy()
+    session.cookies = base.cookies.copy()
+    session.auth = base.auth
+    session.proxies = dict(base.proxies)
+    session.params = dict(base.params)
+    session.verify = base.verify
+    session.cert = base.cert
+    session.trust_env = base.trust_env
+    session.max_redirects = base.max_redirects
+    session.adapters.clear()
+    for prefix, adapter in base.adapters.items():
+        session.mount(prefix, adapter)
+    return session
+
+
+def _prewarm_connection(*, session: requests.Session, url: str, cfg: Config) -> threading.Thread:
+    """
+    Open a keep-alive connection to `url`'s host in the background.
+
+    The OAuth calls are strictly sequential, but the API host used by
+    /users/me is independent of the IAM host, so its DNS lookup and TLS
+    handshake can overlap with /authorize + /token. Failures are ignored:
+    the real request simply opens its own connection.
+
+    The worker never touches `session` (requests.Session is not thread-safe);
+    it sends a HEAD straight through the urllib3 pool that the session's
+    adapter will use for `url` (urllib3 pools are thread-safe), so the
+    connection is returned to that pool for /users/me to reuse.
+    """
+
+    import requests
+    import urllib3
+
+    # Resolve the pool on the calling thread, with the same TLS settings the
+    # session will apply to the real request.
+    try:
+        request = requests.Request("HEAD", url).prepare()
+        settings = session.merge_environment_settings(url, {}, None, cfg.ssl_verify, None)
+        pool = session.get_adapter(url).get_connection_with_tls_context(
+            request, settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+        )
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ValueError, AttributeError):
+        # AttributeError: adapter without get_connection_with_tls_context
+        # (requests < 2.32.2); the prewarm is best-effort, so just skip it.
+        pool = None
+
+    def _run() -> None:
+        if pool is None:
+            return
+        try:
+            pool.urlopen(
+                "HEAD",
+                request.path_url,
+                timeout=cfg.timeout_seconds,
+                retries=False,
+                redirect=False,
+            )
+        except (urllib3.exceptions.HTTPError, OSError):
+            pass
+
+    thread = threading.Thread(target=_run, name="prewarm-connection", daemon=True)
+    thread.start()
+    return thread
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
+    # Imported lazily: only the CLI path needs argparse, library callers don't.
+    import argparse
+
     p = argparse.ArgumentParser(
         prog="auth.py",
         description="Viessmann Vis-Connect auth CLI (authorize -> token -> users/me).",
@@ -776,10 +975,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 
 def main(argv: Optional[list[str]] = None) -> int:
+    import requests
+
     args = parse_args(sys.argv[1:] if argv is None else argv)
     log: Optional[logging.LoggerAdapter] = None
     try:
-        run_id = uuid.uuid4().hex[:12]
+        run_id = secrets.token_hex(6)
         log_level = args.log_level or _get_env("VIESSMANN_LOG_LEVEL") or "INFO"
         log = configure_logging(run_id=run_id, level=log_level)
 
@@ -787,15 +988,13 @@ def main(argv: Optional[list[str]] = None) -> int:
 
         cfg = load_config(args, log=log)
 
-        session = requests.Session()
+        session = _build_session()
+        _prewarm_connection(session=session, url=_config.get_api_base_url(), cfg=cfg)
         code = request_authorization_code(session=session, cfg=cfg, log=log)
         token_response = exchange_code_for_token(session=session, cfg=cfg, code=code, log=log)
         me = fetch_users_me(session=session, cfg=cfg, access_token=token_response.access_token, log=log)
 
-        if args.pretty:
-            print(json.dumps(me, indent=2, ensure_ascii=False, sort_keys=True))
-        else:
-            print(json.dumps(me, ensure_ascii=False))
+        print(_json_dumps(me, pretty=args.pretty))
         log.info("completed successfully")
         return 0
     except CliError as e:
@@ -94,6 +94,13 @@ def create_app() -> App:
             + "Set them before running 'cdk synth/deploy'."
         )
 
+    # Opt-in for throwaway deployments only: data stacks are deleted by `cdk destroy`.
+    ephemeral_data_stacks = os.environ.get("EPHEMERAL_DATA_STACKS", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
     # Create component stacks for development environment
     init_stack = InitStack(
         app,
@@ -130,6 +137,7 @@ def create_app() -> App:
         ssm_namespace_prefix=ssm_namespace_prefix,
         active_submissions_table_name=str(active_submissions_table_name),
         passive_submissions_table_name=str(passive_submissions_table_name),
+        ephemeral=ephemeral_data_stacks,
         env=env_config,
         description="Data Collection Web Application - DynamoDB (dev)",
     )
@@ -139,6 +147,7 @@ def create_app() -> App:
         app,
         f"DataCollectionDataLake-{environment_name}",
         environment_name=environment_name,
+        ephemeral=ephemeral_data_stacks,
         env=env_config,
         description="Data Collection Web Application - DataLake (dev)",
     )
@@ -178,6 +187,14 @@ def create_app() -> App:
         auto_retrieval_daily_schedule_name=auto_retrieval_daily_schedule_name,
         cloudfront_domain=frontend_stack.distribution.domain_name,
         viessmann_credentials_secret_arn=viessmann_credentials_secret_arn,
+        heating_live_provisioned_concurrency=int(
+            os.environ.get("HEATING_LIVE_PROVISIONED_CONCURRENCY", "0").strip() or 0
+        ),
+        submit_provisioned_concurrency=int(
+            os.environ.get("SUBMIT_PROVISIONED_CONCURRENCY", "0").strip() or 0
+        ),
+        single_submissions_function=os.environ.get("SINGLE_SUBMISSIONS_FUNCTION", "").strip().lower()
+        in ("1", "true", "yes"),
         env=env_config,
         description="Data Collection Web Application - API (dev)",
     )
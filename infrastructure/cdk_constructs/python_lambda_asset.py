@@ -7,27 +7,75 @@ from aws_cdk import BundlingOptions, aws_lambda as lambda_
 from infrastructure.config.lambda_assets import LAMBDA_CODE_ASSET_EXCLUDE
 from infrastructure.config.paths import repo_root
 
+# Python runtime for the repo's handlers. aws-cdk-lib 2.100 predates the
+# Runtime.PYTHON_3_12 constant, so it is declared directly; bundling uses the
+# matching public.ecr.aws/sam/build-python3.12 image. Functions built with
+# heating_lambda_bundling() must use this runtime: the bundle contains
+# compiled wheels (orjson) for this interpreter version.
+PYTHON_RUNTIME = lambda_.Runtime("python3.12", lambda_.RuntimeFamily.PYTHON)
 
-def python_lambda_code_from_repo(*, bundling: BundlingOptions | None = None) -> lambda_.Code:
+# Graviton: lower price per GB-second at equal or better speed for this I/O + JSON
+# workload. Used by the API stack; its backend layer installs matching wheels.
+LAMBDA_ARCHITECTURE = lambda_.Architecture.ARM_64
+
+# Bundled assets ship __pycache__ bytecode: /var/task and /opt are read-only, so
+# without it every cold start recompiles each imported module. unchecked-hash pycs
+# are used without comparing source mtimes, which asset zipping does not preserve.
+# -f rewrites the timestamp pycs pip already left behind. The bundling image's
+# interpreter matches PYTHON_RUNTIME, so the cache tags match.
+_COMPILE_BYTECODE = "python -m compileall -q -f -j 0 --invalidation-mode unchecked-hash"
+
+
+def python_lambda_code_from_repo(
+    *,
+    bundling: BundlingOptions | None = None,
+    extra_exclude: tuple[str, ...] = (),
+) -> lambda_.Code:
     """
-    Asset bundle: entire repo root with shared excludes.
+    Asset bundle: entire repo root with shared excludes (plus ``extra_exclude``).
 
     Optional Docker ``bundling`` installs ``requirements-heating.txt`` and copies ``backend`` and ``lambdas``.
     """
-    kwargs: dict = {"exclude": list(LAMBDA_CODE_ASSET_EXCLUDE)}
+    kwargs: dict = {"exclude": [*LAMBDA_CODE_ASSET_EXCLUDE, *extra_exclude]}
     if bundling is not None:
         kwargs["bundling"] = bundling
     return lambda_.Code.from_asset(str(repo_root()), **kwargs)
 
 
 def heating_lambda_bundling() -> BundlingOptions:
-    """Bundling step shared by heating / Viessmann Lambdas (pip + copy ``backend``, ``lambdas``)."""
+    """Bundling step shared by heating / Viessmann Lambdas (pip + copy ``backend``, ``lambdas``, precompile)."""
     return BundlingOptions(
-        image=lambda_.Runtime.PYTHON_3_11.bundling_image,
+        image=PYTHON_RUNTIME.bundling_image,
         command=[
             "bash",
             "-c",
             "pip install -r /asset-input/requirements-heating.txt -t /asset-output "
-            "&& cp -r /asset-input/backend /asset-input/lambdas /asset-output/",
+            "&& cp -r /asset-input/backend /asset-input/lambdas /asset-output/ "
+            f"&& {_COMPILE_BYTECODE} /asset-output",
         ],
     )
+
+
+def backend_layer_code() -> lambda_.Code:
+    """
+    Layer asset: ``requirements-heating.txt`` plus the ``backend`` package under ``python/``, precompiled.
+
+    Lambda puts ``/opt/python`` on ``sys.path``, so functions using the layer import
+    ``backend`` without a ``PYTHONPATH`` override or their own copy of it. pip targets
+    ``LAMBDA_ARCHITECTURE`` explicitly, so compiled wheels (orjson) match the functions
+    even when the bundling container runs on x86_64.
+    """
+    return python_lambda_code_from_repo(
+        bundling=BundlingOptions(
+            image=PYTHON_RUNTIME.bundling_image,
+            command=[
+                "bash",
+                "-c",
+                "pip install -r /asset-input/requirements-heating.txt -t /asset-output/python "
+                "--platform manylinux2014_aarch64 --implementation cp --python-version 3.12 "
+                "--only-binary=:all: "
+                "&& cp -r /asset-input/backend/src/backend /asset-output/python/ "
+                f"&& {_COMPILE_BYTECODE} /asset-output/python",
+            ],
+        )
+    )
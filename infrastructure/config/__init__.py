@@ -2,13 +2,19 @@
 
 from infrastructure.config.heating_lambda_env import (
     BACKEND_PYTHONPATH,
+    HEATING_LIVE_FEATURE_CACHE_TTL_SECONDS,
     VIESSMANN_TOKEN_CACHE_PATH,
 )
-from infrastructure.config.lambda_assets import LAMBDA_CODE_ASSET_EXCLUDE
+from infrastructure.config.lambda_assets import (
+    API_HANDLER_ASSET_EXCLUDE,
+    LAMBDA_CODE_ASSET_EXCLUDE,
+)
 from infrastructure.config.paths import repo_root
 
 __all__ = [
+    "API_HANDLER_ASSET_EXCLUDE",
     "BACKEND_PYTHONPATH",
+    "HEATING_LIVE_FEATURE_CACHE_TTL_SECONDS",
     "LAMBDA_CODE_ASSET_EXCLUDE",
     "VIESSMANN_TOKEN_CACHE_PATH",
     "repo_root",
@@ -5,3 +5,7 @@ BACKEND_PYTHONPATH = "backend/src"
 
 # Lambda filesystem is read-only except /tmp; token cache must use a writable path.
 VIESSMANN_TOKEN_CACHE_PATH = "/tmp/viessmann/tokens.json"
+
+# GET /heating/live: warm containers reuse the device features for this long.
+# Viessmann data changes on the order of minutes; the frontend may poll faster.
+HEATING_LIVE_FEATURE_CACHE_TTL_SECONDS = "60"
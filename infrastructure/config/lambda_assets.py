@@ -20,7 +20,19 @@ LAMBDA_CODE_ASSET_EXCLUDE: tuple[str, ...] = (
     "scripts",
     ".github",
     ".cursor",
+    ".claude",
     ".vscode",
+    # Repo tooling and docs at any depth (handlers never read them)
+    "**/*.md",
+    ".gitignore",
+    "Taskfile.yml",
+    "cdk.json",
+    "cdk.context.json",
+    "pytest.ini",
+    # Local env files may hold credentials; Lambdas get theirs from Secrets Manager
+    ".env",
+    "**/.env",
+    "taskfile.env",
     # Dev / build artefacts (may exist under backend/ or lambdas/ after local runs)
     "**/__pycache__",
     "**/*.py[cod]",
@@ -33,3 +45,12 @@ LAMBDA_CODE_ASSET_EXCLUDE: tuple[str, ...] = (
     "build",
     "**/*.egg-info",
 )
+
+# Extra excludes for the API stack's handler asset: ``backend`` and the pip
+# requirements ship in the backend layer, and ``lambdas/auto_retrieval`` only runs
+# from the scheduler stacks. What remains is the ``lambdas`` package itself.
+API_HANDLER_ASSET_EXCLUDE: tuple[str, ...] = (
+    "backend",
+    "requirements*.txt",
+    "lambdas/auto_retrieval",
+)
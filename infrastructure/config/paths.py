@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 
+@functools.cache
 def repo_root() -> Path:
-    """Absolute path to the repository root (parent of the ``infrastructure/`` package)."""
+    """Absolute path to the repository root (parent of the ``infrastructure/`` package).
+
+    Cached: every ``Code.from_asset`` call in every stack asks for it, and the
+    answer cannot change within a synth.
+    """
     return Path(__file__).resolve().parent.parent.parent
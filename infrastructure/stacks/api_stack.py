@@ -16,16 +16,18 @@ from aws_cdk import (
 from constructs import Construct
 
 from infrastructure.config.heating_lambda_env import (
-    BACKEND_PYTHONPATH,
+    HEATING_LIVE_FEATURE_CACHE_TTL_SECONDS,
     VIESSMANN_TOKEN_CACHE_PATH,
 )
+from infrastructure.config.lambda_assets import API_HANDLER_ASSET_EXCLUDE
 from infrastructure.cdk_constructs.python_lambda_asset import (
-    heating_lambda_bundling,
+    LAMBDA_ARCHITECTURE,
+    PYTHON_RUNTIME,
+    backend_layer_code,
     python_lambda_code_from_repo,
 )
 from infrastructure.stacks.ssm_contract import (
     DEFAULT_SSM_NAMESPACE_PREFIX,
-    SUBMISSIONS_ACTIVE_TABLE_ARN_SEGMENTS,
     SUBMISSIONS_ACTIVE_TABLE_NAME_SEGMENTS,
     normalize_namespace_prefix,
     ssm_parameter_name,
@@ -37,6 +39,20 @@ class APIStack(Stack):
 
     DEFAULT_SSM_PREFIX = DEFAULT_SSM_NAMESPACE_PREFIX
 
+    # Local development origins always allowed by CORS (alternative port 8000).
+    LOCAL_CORS_ORIGINS: tuple[str, ...] = ("http://localhost:3000", "http://localhost:8000")
+
+    # (memory MB, timeout seconds) per DynamoDB handler. Memory also scales CPU, so
+    # JSON + DynamoDB round trips finish sooner at roughly equal GB-s; timeouts sit
+    # well below the 30 s HTTP API integration limit so a stuck call fails fast.
+    HANDLER_TUNING: dict[str, tuple[int, int]] = {
+        "submit": (1024, 10),
+        "history": (512, 15),
+        "recent": (512, 10),
+        # Combined router (single_submissions_function): submit's memory, history's timeout.
+        "submissions_api": (1024, 15),
+    }
+
     def __init__(
         self,
         scope: Construct,
@@ -53,6 +69,9 @@ class APIStack(Stack):
         ssm_namespace_prefix: str = DEFAULT_SSM_PREFIX,
         cloudfront_domain: str | None = None,
         viessmann_credentials_secret_arn: str | None = None,
+        heating_live_provisioned_concurrency: int = 0,
+        submit_provisioned_concurrency: int = 0,
+        single_submissions_function: bool = False,
         **kwargs
     ) -> None:
         """
@@ -75,6 +94,14 @@ class APIStack(Stack):
             cloudfront_domain: CloudFront distribution domain name for CORS (e.g. dxxxx.cloudfront.net)
             viessmann_credentials_secret_arn: ARN of Secrets Manager secret with VIESSMANN_CLIENT_ID,
                 VIESSMANN_EMAIL, VIESSMANN_PASSWORD. If set, enables GET /heating/live endpoint.
+            heating_live_provisioned_concurrency: Pre-initialized environments for the heating
+                live Lambda (0 = none). When > 0, routes target a "live" alias with provisioned
+                concurrency so /heating/live never waits on a cold start (billed while idle).
+            submit_provisioned_concurrency: Same for the submit Lambda (0 = none); POST /submit
+                then targets a "live" alias. Intended for prod, where form saves are user-blocking.
+            single_submissions_function: Serve /submit, /history and /recent from one Lambda
+                (lambdas.submissions_api.handler) with one role instead of three functions.
+                submit_provisioned_concurrency then applies to that function.
             **kwargs: Additional arguments to pass to Stack
         """
         super().__init__(scope, construct_id, **kwargs)
@@ -82,16 +109,13 @@ class APIStack(Stack):
         self.ssm_prefix = normalize_namespace_prefix(ssm_namespace_prefix)
 
         # Create HTTP API (not REST API for cost efficiency)
-        # CORS origins will include both localhost for development and CloudFront domain for production
+        # CORS origins: localhost for development plus the CloudFront domain of the
+        # deployed frontend (passed from FrontendStack).
         cors_origins = [
-            "http://localhost:3000",  # Local development
-            "http://localhost:8000",  # Local development (alternative port)
+            *self.LOCAL_CORS_ORIGINS,
+            *((f"https://{cloudfront_domain}",) if cloudfront_domain else ()),
         ]
 
-        # Add CloudFront origin for the deployed frontend (passed from FrontendStack)
-        if cloudfront_domain:
-            cors_origins.append(f"https://{cloudfront_domain}")
-        
         http_api = apigw.HttpApi(
             self,
             "DataCollectionAPI",
@@ -99,28 +123,32 @@ class APIStack(Stack):
             description="Data Collection Web Application API",
             cors_preflight=apigw.CorsPreflightOptions(
                 allow_headers=["Content-Type", "Authorization"],
+                # Preflight OPTIONS requests are answered by HTTP API itself and never
+                # need to be listed; PUT is used by /config/auto-retrieval.
                 allow_methods=[
                     apigw.CorsHttpMethod.GET,
                     apigw.CorsHttpMethod.POST,
                     apigw.CorsHttpMethod.PUT,
-                    apigw.CorsHttpMethod.OPTIONS,
                 ],
                 allow_origins=cors_origins,
-                max_age=Duration.hours(1),
+                # Let browsers reuse a preflight result for a day (they may cap it lower).
+                max_age=Duration.days(1),
             ),
         )
 
         # Create JWT Authorizer using Cognito User Pool
-        # For Cognito User Pool, we use the issuer URL format
+        # For Cognito User Pool, we use the issuer URL format; the pool lives in this
+        # stack's region (CognitoStack and APIStack share env_config).
         jwt_authorizer = apigw_auth.HttpJwtAuthorizer(
             id="DataCollectionJWTAuthorizer",
             # Audience must match the "aud" claim in tokens, which is the App Client ID (not the User Pool ID).
             jwt_audience=[cognito_user_pool_client_id],
-            jwt_issuer=f"https://cognito-idp.eu-central-1.amazonaws.com/{cognito_user_pool_id}",
+            jwt_issuer=f"https://cognito-idp.{self.region}.amazonaws.com/{cognito_user_pool_id}",
             identity_source=["$request.header.Authorization"],
         )
 
-        # Create Lambda execution role with least-privilege permissions
+        # Lambda execution role for the non-DynamoDB handlers (heating live, auto-retrieval
+        # config); the DynamoDB handlers get their own narrower roles below.
         lambda_execution_role = iam.Role(
             self,
             "LambdaExecutionRole",
@@ -135,24 +163,17 @@ class APIStack(Stack):
             )
         )
 
-        # Add DynamoDB permissions (least-privilege)
-        # Read active DynamoDB table ARN from SSM Parameter Store pointer (owned by DynamoDBStack).
+        # Read active DynamoDB table name from SSM Parameter Store pointer (owned by DynamoDBStack).
         # This avoids tight coupling to CloudFormation exports/imports and makes rollovers deterministic.
-        submissions_active_table_arn = ssm.StringParameter.value_for_string_parameter(
-            self, ssm_parameter_name(self.ssm_prefix, *SUBMISSIONS_ACTIVE_TABLE_ARN_SEGMENTS)
+        # The ARN is derived from the name (same account/region) rather than read from the
+        # Active/TableArn pointer: one SSM resolve per deploy instead of two.
+        submissions_table_name = ssm.StringParameter.value_for_string_parameter(
+            self, ssm_parameter_name(self.ssm_prefix, *SUBMISSIONS_ACTIVE_TABLE_NAME_SEGMENTS)
         )
-
-        lambda_execution_role.add_to_policy(
-            iam.PolicyStatement(
-                effect=iam.Effect.ALLOW,
-                actions=[
-                    "dynamodb:PutItem",
-                    "dynamodb:GetItem",
-                    "dynamodb:Query",
-                    "dynamodb:Scan",
-                ],
-                resources=[submissions_active_table_arn],
-            )
+        submissions_active_table_arn = self.format_arn(
+            service="dynamodb",
+            resource="table",
+            resource_name=submissions_table_name,
         )
 
         # Add Secrets Manager permission for heating live Lambda (when Viessmann secret is configured)
@@ -207,24 +228,97 @@ class APIStack(Stack):
                 )
             )
 
-        # Read active DynamoDB table name from SSM Parameter Store pointer (owned by DynamoDBStack).
-        submissions_table_name = ssm.StringParameter.value_for_string_parameter(
-            self, ssm_parameter_name(self.ssm_prefix, *SUBMISSIONS_ACTIVE_TABLE_NAME_SEGMENTS)
+        # One thin, unbundled handler asset shared by all functions: fingerprinted,
+        # staged and uploaded once instead of once per function, and holding little
+        # beyond the `lambdas` package. The `backend` package and its pip
+        # dependencies live in a layer instead, attached only where imported.
+        self._repo_code = python_lambda_code_from_repo(extra_exclude=API_HANDLER_ASSET_EXCLUDE)
+        self._backend_layer = lambda_.LayerVersion(
+            self,
+            "BackendLayer",
+            code=backend_layer_code(),
+            compatible_runtimes=[PYTHON_RUNTIME],
+            compatible_architectures=[LAMBDA_ARCHITECTURE],
+            description="backend package and requirements-heating.txt dependencies",
         )
 
         # Create Lambda functions
-        submit_handler = self._create_submit_handler(
-            lambda_execution_role, submissions_table_name
-        )
-        history_handler = self._create_history_handler(
-            lambda_execution_role, submissions_table_name
-        )
-        recent_handler = self._create_recent_handler(
-            lambda_execution_role, submissions_table_name
-        )
+        submissions_env = {"SUBMISSIONS_TABLE": submissions_table_name}
+        if single_submissions_function:
+            # One function (and role) behind /submit, /history and /recent: a single
+            # warm pool and one cold start instead of three, at the cost of history
+            # and recent sharing submit's PutItem grant.
+            submissions_api_role = self._create_dynamodb_handler_role(
+                "SubmissionsApiHandlerRole",
+                f"data-collection-submissions-api-role-{environment_name}",
+                actions=["dynamodb:Query", "dynamodb:PutItem"],
+                table_arn=submissions_active_table_arn,
+            )
+            submit_handler = history_handler = recent_handler = self._create_dynamodb_handler(
+                "SubmissionsApiHandler",
+                "submissions_api",
+                "lambdas.submissions_api.handler.lambda_handler",
+                submissions_api_role,
+                submissions_env,
+                "Lambda handler for submit, history and recent endpoints",
+                layers=[self._backend_layer],
+                provisioned_concurrency=submit_provisioned_concurrency,
+            )
+        else:
+            # One role per DynamoDB handler, each limited to the calls it makes: submit
+            # reads the previous entry (Query) and writes (PutItem); history and recent
+            # only Query. No Scan or GetItem anywhere.
+            submit_role = self._create_dynamodb_handler_role(
+                "SubmitHandlerRole",
+                f"data-collection-submit-role-{environment_name}",
+                actions=["dynamodb:Query", "dynamodb:PutItem"],
+                table_arn=submissions_active_table_arn,
+            )
+            history_role = self._create_dynamodb_handler_role(
+                "HistoryHandlerRole",
+                f"data-collection-history-role-{environment_name}",
+                actions=["dynamodb:Query"],
+                table_arn=submissions_active_table_arn,
+            )
+            recent_role = self._create_dynamodb_handler_role(
+                "RecentHandlerRole",
+                f"data-collection-recent-role-{environment_name}",
+                actions=["dynamodb:Query"],
+                table_arn=submissions_active_table_arn,
+            )
+            submit_handler = self._create_dynamodb_handler(
+                "SubmitHandler",
+                "submit",
+                "lambdas.submit.handler.lambda_handler",
+                submit_role,
+                submissions_env,
+                "Lambda handler for form submission endpoint",
+                # submit imports backend.shared (models, validators)
+                layers=[self._backend_layer],
+                provisioned_concurrency=submit_provisioned_concurrency,
+            )
+            history_handler = self._create_dynamodb_handler(
+                "HistoryHandler",
+                "history",
+                "lambdas.history.handler.lambda_handler",
+                history_role,
+                submissions_env,
+                "Lambda handler for history retrieval endpoint",
+            )
+            recent_handler = self._create_dynamodb_handler(
+                "RecentHandler",
+                "recent",
+                "lambdas.recent.handler.lambda_handler",
+                recent_role,
+                submissions_env,
+                "Lambda handler for recent submissions endpoint",
+            )
+
         heating_live_handler = (
             self._create_heating_live_handler(
-                lambda_execution_role, viessmann_credentials_secret_arn
+                lambda_execution_role,
+                viessmann_credentials_secret_arn,
+                provisioned_concurrency=heating_live_provisioned_concurrency,
             )
             if viessmann_credentials_secret_arn
             else None
@@ -273,138 +367,113 @@ class APIStack(Stack):
             description="Lambda execution role ARN",
         )
 
-    def _create_submit_handler(
+    def _create_dynamodb_handler_role(
         self,
-        lambda_execution_role: iam.Role,
-        table_name: str,
-        passive_table_name: str | None = None,
-    ) -> lambda_.Function:
+        construct_id: str,
+        role_name: str,
+        actions: list[str],
+        table_arn: str,
+    ) -> iam.Role:
         """
-        Create Lambda function for POST /submit endpoint.
+        Create an execution role for a DynamoDB handler.
 
         Args:
-            lambda_execution_role: IAM role for Lambda execution
-            table_name: DynamoDB table name
+            construct_id: Logical ID of the role
+            role_name: Physical IAM role name
+            actions: DynamoDB actions the handler calls
+            table_arn: ARN of the submissions table the actions are scoped to
 
         Returns:
-            Lambda Function construct
+            IAM Role with CloudWatch Logs access and the given DynamoDB actions
         """
-        submit_fn = lambda_.Function(
+        role = iam.Role(
             self,
-            "SubmitHandler",
-            runtime=lambda_.Runtime.PYTHON_3_11,
-            handler="lambdas.submit.handler.lambda_handler",
-            code=python_lambda_code_from_repo(),
-            role=lambda_execution_role,
-            environment={
-                "SUBMISSIONS_TABLE": table_name,
-                "PYTHONPATH": BACKEND_PYTHONPATH,
-                **(
-                    {"PASSIVE_SUBMISSIONS_TABLE": passive_table_name}
-                    if passive_table_name
-                    else {}
-                ),
-            },
-            timeout=Duration.seconds(30),
-            memory_size=256,
-            description="Lambda handler for form submission endpoint",
-            # Configure retention for the *actual* Lambda log group:
-            # /aws/lambda/<function name>
-            log_retention=logs.RetentionDays.ONE_WEEK,
+            construct_id,
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+            role_name=role_name,
         )
-
-        return submit_fn
-
-    def _create_history_handler(
-        self,
-        lambda_execution_role: iam.Role,
-        table_name: str,
-        passive_table_name: str | None = None,
-    ) -> lambda_.Function:
-        """
-        Create Lambda function for GET /history endpoint.
-
-        Args:
-            lambda_execution_role: IAM role for Lambda execution
-            table_name: DynamoDB table name
-
-        Returns:
-            Lambda Function construct
-        """
-        history_fn = lambda_.Function(
-            self,
-            "HistoryHandler",
-            runtime=lambda_.Runtime.PYTHON_3_11,
-            handler="lambdas.history.handler.lambda_handler",
-            code=python_lambda_code_from_repo(),
-            role=lambda_execution_role,
-            environment={
-                "SUBMISSIONS_TABLE": table_name,
-                **(
-                    {"PASSIVE_SUBMISSIONS_TABLE": passive_table_name}
-                    if passive_table_name
-                    else {}
-                ),
-            },
-            timeout=Duration.seconds(30),
-            memory_size=256,
-            description="Lambda handler for history retrieval endpoint",
-            # Configure retention for the *actual* Lambda log group:
-            # /aws/lambda/<function name>
-            log_retention=logs.RetentionDays.ONE_WEEK,
+        role.add_managed_policy(
+            iam.ManagedPolicy.from_aws_managed_policy_name(
+                "service-role/AWSLambdaBasicExecutionRole"
+            )
         )
+        role.add_to_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=actions,
+                resources=[table_arn],
+            )
+        )
+        return role
 
-        return history_fn
-
-    def _create_recent_handler(
+    def _create_dynamodb_handler(
         self,
-        lambda_execution_role: iam.Role,
-        table_name: str,
-        passive_table_name: str | None = None,
-    ) -> lambda_.Function:
+        construct_id: str,
+        tuning_key: str,
+        handler: str,
+        role: iam.Role,
+        environment: dict[str, str],
+        description: str,
+        layers: list[lambda_.ILayerVersion] | None = None,
+        provisioned_concurrency: int = 0,
+    ) -> lambda_.IFunction:
         """
-        Create Lambda function for GET /recent endpoint.
+        Create a Lambda function for one of the submissions DynamoDB endpoints.
+
+        All callers pass the same shared code asset and environment dict; only the
+        handler string, role, tuning and layers differ.
 
         Args:
-            lambda_execution_role: IAM role for Lambda execution
-            table_name: DynamoDB table name
+            construct_id: Logical ID of the function (e.g. "SubmitHandler")
+            tuning_key: Key into HANDLER_TUNING for memory size and timeout
+            handler: Lambda handler string (lambdas.<name>.handler.lambda_handler)
+            role: IAM role for Lambda execution
+            environment: Lambda environment variables
+            description: Function description
+            layers: Layers to attach (the backend layer where `backend` is imported)
+            provisioned_concurrency: When > 0, pre-initialized environments on a "live" alias
 
         Returns:
-            Lambda Function construct
+            Lambda Function construct, or its "live" alias when provisioned
         """
-        recent_fn = lambda_.Function(
+        memory_size, timeout_seconds = self.HANDLER_TUNING[tuning_key]
+        fn = lambda_.Function(
             self,
-            "RecentHandler",
-            runtime=lambda_.Runtime.PYTHON_3_11,
-            handler="lambdas.recent.handler.lambda_handler",
-            code=python_lambda_code_from_repo(),
-            role=lambda_execution_role,
-            environment={
-                "SUBMISSIONS_TABLE": table_name,
-                **(
-                    {"PASSIVE_SUBMISSIONS_TABLE": passive_table_name}
-                    if passive_table_name
-                    else {}
-                ),
-            },
-            timeout=Duration.seconds(30),
-            memory_size=256,
-            description="Lambda handler for recent submissions endpoint",
+            construct_id,
+            runtime=PYTHON_RUNTIME,
+            architecture=LAMBDA_ARCHITECTURE,
+            handler=handler,
+            code=self._repo_code,
+            layers=layers,
+            role=role,
+            environment=environment,
+            timeout=Duration.seconds(timeout_seconds),
+            memory_size=memory_size,
+            description=description,
             # Configure retention for the *actual* Lambda log group:
             # /aws/lambda/<function name>
             log_retention=logs.RetentionDays.ONE_WEEK,
         )
 
-        return recent_fn
+        if provisioned_concurrency > 0:
+            return lambda_.Alias(
+                self,
+                f"{construct_id.removesuffix('Handler')}Live",
+                alias_name="live",
+                version=fn.current_version,
+                provisioned_concurrent_executions=provisioned_concurrency,
+            )
+
+        return fn
 
     def _wire_routes(
         self,
         http_api: apigw.HttpApi,
         jwt_authorizer: apigw_auth.HttpJwtAuthorizer,
-        submit_handler: lambda_.Function,
-        history_handler: lambda_.Function,
-        recent_handler: lambda_.Function,
-        heating_live_handler: lambda_.Function | None = None,
+        submit_handler: lambda_.IFunction,
+        history_handler: lambda_.IFunction,
+        recent_handler: lambda_.IFunction,
+        heating_live_handler: lambda_.IFunction | None = None,
         auto_retrieval_config_handler: lambda_.Function | None = None,
     ) -> None:
         """
@@ -413,84 +482,48 @@ class APIStack(Stack):
         Args:
             http_api: HTTP API construct
             jwt_authorizer: JWT authorizer for route protection
-            submit_handler: Lambda function for POST /submit
+            submit_handler: Lambda function (or alias) for POST /submit
             history_handler: Lambda function for GET /history
             recent_handler: Lambda function for GET /recent
-            heating_live_handler: Optional Lambda for GET /heating/live
+            heating_live_handler: Optional Lambda (or alias) for GET /heating/live
             auto_retrieval_config_handler: Optional Lambda for GET/PUT /config/auto-retrieval
         """
-        # POST /submit route
-        http_api.add_routes(
-            path="/submit",
-            methods=[apigw.HttpMethod.POST],
-            integration=apigw_integrations.HttpLambdaIntegration(
-                "SubmitIntegration",
-                submit_handler,
-            ),
-            authorizer=jwt_authorizer,
-        )
-
-        # GET /history route
-        http_api.add_routes(
-            path="/history",
-            methods=[apigw.HttpMethod.GET],
-            integration=apigw_integrations.HttpLambdaIntegration(
-                "HistoryIntegration",
-                history_handler,
-            ),
-            authorizer=jwt_authorizer,
-        )
-
-        # GET /recent route
-        http_api.add_routes(
-            path="/recent",
-            methods=[apigw.HttpMethod.GET],
-            integration=apigw_integrations.HttpLambdaIntegration(
-                "RecentIntegration",
-                recent_handler,
-            ),
-            authorizer=jwt_authorizer,
-        )
+        # (path, methods, integration id, handler); optional handlers are added only when set.
+        route_specs: list[tuple[str, list[apigw.HttpMethod], str, lambda_.IFunction]] = [
+            ("/submit", [apigw.HttpMethod.POST], "SubmitIntegration", submit_handler),
+            ("/history", [apigw.HttpMethod.GET], "HistoryIntegration", history_handler),
+            ("/recent", [apigw.HttpMethod.GET], "RecentIntegration", recent_handler),
+        ]
 
         # GET /heating/live and POST /heating/mode routes (optional; requires Viessmann credentials secret)
         if heating_live_handler is not None:
-            http_api.add_routes(
-                path="/heating/live",
-                methods=[apigw.HttpMethod.GET],
-                integration=apigw_integrations.HttpLambdaIntegration(
-                    "HeatingLiveIntegration",
-                    heating_live_handler,
-                ),
-                authorizer=jwt_authorizer,
-            )
-            http_api.add_routes(
-                path="/heating/mode",
-                methods=[apigw.HttpMethod.POST],
-                integration=apigw_integrations.HttpLambdaIntegration(
-                    "HeatingModeIntegration",
-                    heating_live_handler,
-                ),
-                authorizer=jwt_authorizer,
-            )
+            route_specs += [
+                ("/heating/live", [apigw.HttpMethod.GET], "HeatingLiveIntegration", heating_live_handler),
+                ("/heating/mode", [apigw.HttpMethod.POST], "HeatingModeIntegration", heating_live_handler),
+            ]
 
-        # GET/PUT /config/auto-retrieval route
+        # GET/PUT /config/auto-retrieval routes
         if auto_retrieval_config_handler is not None:
-            http_api.add_routes(
-                path="/config/auto-retrieval",
-                methods=[apigw.HttpMethod.GET, apigw.HttpMethod.PUT],
-                integration=apigw_integrations.HttpLambdaIntegration(
+            route_specs += [
+                (
+                    "/config/auto-retrieval",
+                    [apigw.HttpMethod.GET, apigw.HttpMethod.PUT],
                     "AutoRetrievalConfigIntegration",
                     auto_retrieval_config_handler,
                 ),
-                authorizer=jwt_authorizer,
-            )
-            http_api.add_routes(
-                path="/config/auto-retrieval/deployment-status",
-                methods=[apigw.HttpMethod.GET],
-                integration=apigw_integrations.HttpLambdaIntegration(
+                (
+                    "/config/auto-retrieval/deployment-status",
+                    [apigw.HttpMethod.GET],
                     "AutoRetrievalConfigDeploymentStatusIntegration",
                     auto_retrieval_config_handler,
                 ),
+            ]
+
+        for path, methods, integration_id, handler in route_specs:
+            http_api.add_routes(
+                path=path,
+                methods=methods,
+                integration=apigw_integrations.HttpLambdaIntegration(integration_id, handler),
                 authorizer=jwt_authorizer,
             )
 
@@ -498,31 +531,50 @@ class APIStack(Stack):
         self,
         lambda_execution_role: iam.Role,
         viessmann_credentials_secret_arn: str,
-    ) -> lambda_.Function:
+        provisioned_concurrency: int = 0,
+    ) -> lambda_.IFunction:
         """
         Create Lambda function for GET /heating/live endpoint.
 
-        Fetches heating values from Viessmann IoT API. Requires backend package
-        and PYTHONPATH for backend.heating.iot_data. Credentials from Secrets Manager.
+        Fetches heating values from Viessmann IoT API. backend.heating.iot_data and
+        its dependencies come from the backend layer. Credentials from Secrets Manager.
+
+        With provisioned_concurrency > 0, returns a "live" alias on the current
+        version with that many pre-initialized environments; otherwise the function.
+        (SnapStart would need a newer aws-cdk-lib than the pinned 2.100.)
         """
         heating_live_fn = lambda_.Function(
             self,
             "HeatingLiveHandler",
-            runtime=lambda_.Runtime.PYTHON_3_11,
+            runtime=PYTHON_RUNTIME,
+            architecture=LAMBDA_ARCHITECTURE,
             handler="lambdas.heating_live.handler.lambda_handler",
-            code=python_lambda_code_from_repo(bundling=heating_lambda_bundling()),
+            code=self._repo_code,
+            layers=[self._backend_layer],
             role=lambda_execution_role,
             environment={
                 "VIESSMANN_CREDENTIALS_SECRET_ARN": viessmann_credentials_secret_arn,
-                "PYTHONPATH": BACKEND_PYTHONPATH,
                 "VIESSMANN_TOKEN_CACHE_PATH": VIESSMANN_TOKEN_CACHE_PATH,
+                "VIESSMANN_FEATURE_CACHE_TTL": HEATING_LIVE_FEATURE_CACHE_TTL_SECONDS,
             },
             timeout=Duration.seconds(60),
-            memory_size=256,
+            # CPU scales with memory: TLS handshakes and JSON parsing of the
+            # features payload finish faster, so duration (and cost) drops roughly
+            # in proportion.
+            memory_size=1024,
             description="Lambda handler for heating live data endpoint",
             log_retention=logs.RetentionDays.ONE_WEEK,
         )
 
+        if provisioned_concurrency > 0:
+            return lambda_.Alias(
+                self,
+                "HeatingLiveAlias",
+                alias_name="live",
+                version=heating_live_fn.current_version,
+                provisioned_concurrent_executions=provisioned_concurrency,
+            )
+
         return heating_live_fn
 
     def _create_auto_retrieval_config_handler(
@@ -539,9 +591,10 @@ class APIStack(Stack):
         return lambda_.Function(
             self,
             "AutoRetrievalConfigHandler",
-            runtime=lambda_.Runtime.PYTHON_3_11,
+            runtime=PYTHON_RUNTIME,
+            architecture=LAMBDA_ARCHITECTURE,
             handler="lambdas.auto_retrieval_config.handler.lambda_handler",
-            code=python_lambda_code_from_repo(),
+            code=self._repo_code,
             role=lambda_execution_role,
             environment={
                 "AUTO_RETRIEVAL_APPCONFIG_APPLICATION_ID": appconfig_application_id,
@@ -564,19 +617,3 @@ class APIStack(Stack):
             description="Lambda handler for auto-retrieval AppConfig management endpoint",
             log_retention=logs.RetentionDays.ONE_WEEK,
         )
-
-    def _get_user_pool(self, user_pool_id: str):
-        """
-        Get Cognito User Pool from ID.
-
-        Args:
-            user_pool_id: The Cognito User Pool ID
-
-        Returns:
-            Cognito User Pool construct
-        """
-        from aws_cdk import aws_cognito as cognito
-
-        return cognito.UserPool.from_user_pool_id(
-            self, "ImportedUserPool", user_pool_id
-        )
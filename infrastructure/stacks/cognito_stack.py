@@ -1,5 +1,7 @@
 """Cognito User Pool stack for authentication."""
 
+import os
+
 from aws_cdk import (
     Stack,
     aws_cognito as cognito,
@@ -54,7 +56,6 @@ class CognitoStack(Stack):
         logout_urls = ["http://localhost:3000", "http://localhost:8000"]
         
         # Add CloudFront domain if available (will be set during deployment)
-        import os
         cloudfront_domain = os.environ.get("CLOUDFRONT_DOMAIN")
         if cloudfront_domain:
             callback_urls.append(f"https://{cloudfront_domain}")
@@ -85,7 +86,7 @@ class CognitoStack(Stack):
         )
 
         # Configure Hosted UI
-        user_pool.add_domain(
+        user_pool_domain = user_pool.add_domain(
             "DataCollectionDomain",
             cognito_domain=cognito.CognitoDomainOptions(
                 domain_prefix=f"data-collection-{environment_name}",
@@ -123,7 +124,8 @@ class CognitoStack(Stack):
         CfnOutput(
             self,
             "HostedUiDomain",
-            value=f"https://data-collection-{environment_name}.auth.eu-central-1.amazoncognito.com",
+            # https://<prefix>.auth.<stack region>.amazoncognito.com
+            value=user_pool_domain.base_url(),
             export_name=f"DataCollectionHostedUiDomain-{environment_name}",
             description="Cognito Hosted UI domain",
         )
@@ -13,6 +13,10 @@ Design goals
   - Server-side encryption
   - Enforce SSL
   - Versioning enabled (protect against accidental overwrite/deletion)
+- Lifecycle: noncurrent versions expire after 30 days (the recovery window),
+  incomplete multipart uploads are aborted after 7 days. No storage-class
+  transitions: exports are small gzipped objects, below the 128 KB that
+  Intelligent-Tiering monitors and that Glacier Instant Retrieval bills as a minimum.
 
 Notes
 -----
@@ -24,6 +28,7 @@ from aws_cdk import (
     Stack,
     aws_s3 as s3,
     CfnOutput,
+    Duration,
     RemovalPolicy,
 )
 from constructs import Construct
@@ -37,6 +42,7 @@ class DataLakeStack(Stack):
         scope: Construct,
         construct_id: str,
         environment_name: str,
+        ephemeral: bool = False,
         **kwargs,
     ) -> None:
         """
@@ -46,6 +52,8 @@ class DataLakeStack(Stack):
             scope: The parent construct
             construct_id: The logical ID of the stack
             environment_name: The environment name (dev, prod, etc.)
+            ephemeral: Throwaway deployment: the bucket and its objects are deleted with
+                the stack. Never set for an environment holding real exports.
             **kwargs: Additional arguments to pass to Stack
         """
         super().__init__(scope, construct_id, **kwargs)
@@ -71,8 +79,17 @@ class DataLakeStack(Stack):
             ),
             encryption=s3.BucketEncryption.S3_MANAGED,
             enforce_ssl=True,
-            # This bucket is a long-lived archive for exports; do not delete automatically.
-            removal_policy=RemovalPolicy.RETAIN,
+            lifecycle_rules=[
+                s3.LifecycleRule(
+                    id="ExpireNoncurrentVersions",
+                    noncurrent_version_expiration=Duration.days(30),
+                    abort_incomplete_multipart_upload_after=Duration.days(7),
+                )
+            ],
+            # This bucket is a long-lived archive for exports; do not delete automatically
+            # (except for throwaway deployments, where `cdk destroy` should leave nothing).
+            removal_policy=RemovalPolicy.DESTROY if ephemeral else RemovalPolicy.RETAIN,
+            auto_delete_objects=ephemeral,
         )
 
         self.datalake_bucket = datalake_bucket
@@ -33,6 +33,7 @@ class DynamoDBStack(Stack):
         active_submissions_table_name: str,
         passive_submissions_table_name: str,
         ssm_namespace_prefix: str = DEFAULT_SSM_PREFIX,
+        ephemeral: bool = False,
         **kwargs
     ) -> None:
         """
@@ -45,6 +46,8 @@ class DynamoDBStack(Stack):
             ssm_namespace_prefix: Root SSM namespace prefix (for example /HeatingDataCollection)
             active_submissions_table_name: Physical table name for the active (current) submissions table
             passive_submissions_table_name: Physical table name for the passive (previous) submissions table
+            ephemeral: Throwaway deployment: tables are deleted with the stack and skip
+                point-in-time recovery. Never set for an environment holding real data.
             **kwargs: Additional arguments to pass to Stack
         """
         super().__init__(scope, construct_id, **kwargs)
@@ -72,6 +75,10 @@ class DynamoDBStack(Stack):
             [str(active_submissions_table_name), str(passive_submissions_table_name)]
         )
 
+        # Keep historical data unless explicitly removed out-of-band; only throwaway
+        # (ephemeral) deployments let `cdk destroy` delete the tables.
+        removal_policy = RemovalPolicy.DESTROY if ephemeral else RemovalPolicy.RETAIN
+
         # Create DynamoDB table for active submissions.
         # We keep the construct IDs stable to avoid CloudFormation resource replacement.
         submissions_2025_table = dynamodb.Table(
@@ -88,9 +95,8 @@ class DynamoDBStack(Stack):
             ),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
             encryption=dynamodb.TableEncryption.AWS_MANAGED,
-            # Keep historical data unless explicitly removed out-of-band.
-            removal_policy=RemovalPolicy.RETAIN,
-            point_in_time_recovery=True,
+            removal_policy=removal_policy,
+            point_in_time_recovery=not ephemeral,
         )
 
         # Store reference for use by other stacks
@@ -112,9 +118,8 @@ class DynamoDBStack(Stack):
             ),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
             encryption=dynamodb.TableEncryption.AWS_MANAGED,
-            # Keep historical data unless explicitly removed out-of-band.
-            removal_policy=RemovalPolicy.RETAIN,
-            point_in_time_recovery=True,
+            removal_policy=removal_policy,
+            point_in_time_recovery=not ephemeral,
         )
 
         # Store reference for use by other stacks (future roll-over)
@@ -206,12 +211,15 @@ class DynamoDBStack(Stack):
             description="LEGACY (temporary): kept for stacks importing the old 2025 table ARN export",
         )
 
-        # Export active table name/ARN (scoped by env to avoid export collisions)
+        # Active/passive table name/ARN as plain outputs (for the console and
+        # describe-stacks), deliberately *not* exports: consumers read the SSM pointers
+        # above. These values swap at every year rollover, and CloudFormation refuses to
+        # change an export while any stack imports it; without exports no other stack can
+        # pin them, and the template carries no cross-stack export entries.
         CfnOutput(
             self,
             "SubmissionsActiveTableName",
             value=active_table.table_name,
-            export_name=f"DataCollectionSubmissionsActiveTableName-{environment_name}",
             description="DynamoDB submissions active table name",
         )
 
@@ -219,16 +227,13 @@ class DynamoDBStack(Stack):
             self,
             "SubmissionsActiveTableArn",
             value=active_table.table_arn,
-            export_name=f"DataCollectionSubmissionsActiveTableArn-{environment_name}",
             description="DynamoDB submissions active table ARN",
         )
 
-        # Export passive table name/ARN (scoped by env to avoid export collisions)
         CfnOutput(
             self,
             "SubmissionsPassiveTableName",
             value=passive_table.table_name,
-            export_name=f"DataCollectionSubmissionsPassiveTableName-{environment_name}",
             description="DynamoDB submissions passive table name",
         )
 
@@ -236,6 +241,5 @@ class DynamoDBStack(Stack):
             self,
             "SubmissionsPassiveTableArn",
             value=passive_table.table_arn,
-            export_name=f"DataCollectionSubmissionsPassiveTableArn-{environment_name}",
             description="DynamoDB submissions passive table ARN",
         )
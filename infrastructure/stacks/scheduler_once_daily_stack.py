@@ -20,6 +20,7 @@ from infrastructure.config.heating_lambda_env import (
     VIESSMANN_TOKEN_CACHE_PATH,
 )
 from infrastructure.cdk_constructs.python_lambda_asset import (
+    PYTHON_RUNTIME,
     heating_lambda_bundling,
     python_lambda_code_from_repo,
 )
@@ -183,7 +184,7 @@ class SchedulerOnceDailyStack(Stack):
         auto_retrieval_fn = lambda_.Function(
             self,
             "AutoRetrievalHandler",
-            runtime=lambda_.Runtime.PYTHON_3_11,
+            runtime=PYTHON_RUNTIME,
             handler="lambdas.auto_retrieval.handler.lambda_handler",
             code=python_lambda_code_from_repo(bundling=heating_lambda_bundling()),
             role=lambda_role,
@@ -42,7 +42,11 @@ def get_table():
     if dynamodb is None:
         # Import boto3 lazily so unit tests that don't need AWS dependencies can import this module.
         import boto3
-        dynamodb = boto3.resource("dynamodb")
+        from botocore.config import Config
+
+        # Module-level, so warm invocations reuse the client and its open HTTPS
+        # connection; TCP keep-alive stops idle pooled sockets from going stale.
+        dynamodb = boto3.resource("dynamodb", config=Config(tcp_keepalive=True))
 
     table_name = os.environ.get("SUBMISSIONS_TABLE")
     if not table_name:
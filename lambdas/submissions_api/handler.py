@@ -0,0 +1,46 @@
+"""
+Lambda handler routing the submissions endpoints from one function.
+
+Handles:
+  POST /submit   — delegated to lambdas.submit.handler
+  GET  /history  — delegated to lambdas.history.handler
+  GET  /recent   — delegated to lambdas.recent.handler
+
+Deployed only when APIStack is built with single_submissions_function=True: one
+warm environment then serves all three routes instead of each paying its own
+cold start. Route modules are imported on first use, so a request never loads
+handlers it does not need.
+"""
+
+import importlib
+import json
+from typing import Any, Dict
+
+
+# HTTP API routeKey -> module providing lambda_handler for that route.
+ROUTES: Dict[str, str] = {
+    "POST /submit": "lambdas.submit.handler",
+    "GET /history": "lambdas.history.handler",
+    "GET /recent": "lambdas.recent.handler",
+}
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Dispatch to the handler registered for the event's routeKey.
+
+    Args:
+        event: Lambda event from API Gateway HTTP API (payload format 2.0)
+        context: Lambda context object
+
+    Returns:
+        API Gateway response from the route handler, or 404 for unknown routes
+    """
+    module_name = ROUTES.get(event.get("routeKey", ""))
+    if module_name is None:
+        return {
+            "statusCode": 404,
+            "body": json.dumps({"error": "Not found"}),
+            "headers": {"Content-Type": "application/json"},
+        }
+    return importlib.import_module(module_name).lambda_handler(event, context)
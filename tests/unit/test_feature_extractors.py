@@ -1,13 +1,22 @@
 """Unit tests for backend.heating.iot_data.feature_extractors."""
 
+import json
 from unittest.mock import Mock
 
 import pytest
 
+import backend.heating.iot_data.feature_data_fetcher as fetcher_mod
 import backend.heating.iot_data.feature_extractors as ext_mod
 from backend.heating.iot_data.get_iot_config import IotConfig
 
 
+@pytest.fixture(autouse=True)
+def _clear_feature_cache():
+    fetcher_mod.clear_feature_cache()
+    yield
+    fetcher_mod.clear_feature_cache()
+
+
 def _make_iot_config() -> IotConfig:
     return IotConfig(
         access_token="test-token",
@@ -22,6 +31,7 @@ def _mock_json_response(payload, *, status_code: int = 200):
     resp.status_code = status_code
     resp.text = ""
     resp.json = Mock(return_value=payload)
+    resp.content = json.dumps(payload).encode()
     return resp
 
 
@@ -67,6 +77,21 @@ def test_extract_temperature_returns_none_when_no_properties() -> None:
     assert ext_mod.extract_temperature(feature) is None
 
 
+@pytest.mark.parametrize(
+    ("props", "expected"),
+    [
+        ({"value": {"type": "number", "value": "36.8"}}, 36.8),
+        ({"value": {"unit": "celsius"}}, None),
+        ({"value": "21"}, None),
+        ({"value": True}, 1.0),
+        ({"temperature": "19.5", "value": 99}, 19.5),
+        (None, None),
+    ],
+)
+def test_extract_temperature_shapes(props, expected) -> None:
+    assert ext_mod.extract_temperature({"properties": props}) == expected
+
+
 # --- extract_consumption ---
 
 
@@ -136,6 +161,22 @@ def test_extract_burner_statistics_returns_none_when_empty() -> None:
     assert result["starts"] is None
 
 
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(7, 7), (7.9, 7), ("42", 42), ("12.5", 12), (True, True), (float("nan"), None), ("inf", None), ("n/a", None), ([1], None)],
+)
+def test_coerce_int(raw, expected) -> None:
+    assert ext_mod._coerce_int(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(1.5, 1.5), (2, 2.0), ("21.0", 21.0), (False, 0.0), ("abc", None), (None, None), ({"value": 1}, None)],
+)
+def test_coerce_float(raw, expected) -> None:
+    assert ext_mod._coerce_float(raw) == expected
+
+
 def test_extract_feature_value_uses_burner_extractor_for_statistics_path() -> None:
     feature = {
         "feature": "heating.burners.0.statistics",
@@ -172,6 +213,14 @@ def test_extract_feature_value_uses_raw_extractor_for_unknown_path() -> None:
     assert result == {"foo": "bar"}
 
 
+def test_get_extractor_resolution_is_cached_per_path() -> None:
+    ext_mod._get_extractor.cache_clear()
+    assert ext_mod._get_extractor("heating.boiler.temperature") is ext_mod.extract_temperature
+    assert ext_mod._get_extractor("heating.boiler.temperature") is ext_mod.extract_temperature
+    info = ext_mod._get_extractor.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 # --- get_feature_value (integration with fetch) ---
 
 
@@ -248,3 +297,77 @@ def test_get_feature_value_without_cache_fetches_via_http() -> None:
 
     assert result == 21.0
     session.get.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(36.8, 36.8), (21, 21.0), (True, 1.0), ("21", None), (None, None), ({"value": "7.5"}, 7.5), ({"unit": "x"}, None), ([1], None)],
+)
+def test_extract_scalar_from_prop(raw, expected) -> None:
+    assert ext_mod._extract_scalar_from_prop(raw) == expected
+
+
+def test_get_feature_values_bulk_uses_one_device_fetch_above_threshold() -> None:
+    iot_config = _make_iot_config()
+    session = Mock()
+    session.get.return_value = _mock_json_response({
+        "data": [
+            {"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}},
+            {"feature": "heating.gas.consumption.heating", "isEnabled": True, "properties": {"day": {"value": [1]}}},
+            {"feature": "heating.dhw.temperature", "isEnabled": False, "properties": {"value": 50}},
+        ],
+    })
+
+    values = ext_mod.get_feature_values_bulk(
+        ["heating.boiler.temperature", "heating.gas.consumption.heating", "heating.dhw.temperature", "missing"],
+        iot_config,
+        session=session,
+    )
+
+    assert values == {
+        "heating.boiler.temperature": 65.0,
+        "heating.gas.consumption.heating": {"day": {"value": [1]}},
+        "heating.dhw.temperature": None,
+        "missing": None,
+    }
+    session.get.assert_called_once()
+    assert session.get.call_args[0][0] == iot_config.features_url
+
+
+def test_get_feature_values_bulk_extracts_memoized_payload_afresh() -> None:
+    iot_config = _make_iot_config()
+    session = Mock()
+    session.get.return_value = _mock_json_response({
+        "data": [{"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}}],
+    })
+    paths = ["heating.boiler.temperature", "a", "b"]
+
+    first = ext_mod.get_feature_values_bulk(paths, iot_config, session=session)
+    first["heating.boiler.temperature"] = "mutated by caller"
+    second = ext_mod.get_feature_values_bulk(paths, iot_config, session=session)
+
+    assert second["heating.boiler.temperature"] == 65.0
+    assert second is not first
+    assert session.get.call_count == 1
+
+
+def test_get_feature_value_from_cache_never_fetches(monkeypatch) -> None:
+    monkeypatch.setattr(fetcher_mod, "get_single_feature", Mock(side_effect=AssertionError("no HTTP")))
+    features = [{"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}}]
+
+    assert ext_mod.get_feature_value_from_cache("heating.boiler.temperature", features) == 65.0
+    assert ext_mod.get_feature_value_from_cache("heating.missing", features) is None
+    assert ext_mod.get_feature_value_from_cache("heating.missing", fetcher_mod.index_features(features)) is None
+
+
+def test_get_feature_values_bulk_uses_single_endpoint_below_threshold() -> None:
+    iot_config = _make_iot_config()
+    session = Mock()
+    session.get.return_value = _mock_json_response({
+        "data": {"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}},
+    })
+
+    values = ext_mod.get_feature_values_bulk(["heating.boiler.temperature"], iot_config, session=session)
+
+    assert values == {"heating.boiler.temperature": 65.0}
+    assert session.get.call_args[0][0] == iot_config.single_feature_url("heating.boiler.temperature")
@@ -0,0 +1,18 @@
+"""Unit tests for backend.heating.iot_data.feature_value_cli (offline)."""
+
+import pytest
+
+import backend.heating.iot_data.feature_value_cli as cli_mod
+
+
+def test_parse_args_converts_timeout_to_float() -> None:
+    assert cli_mod._parse_args(["heating.boiler.temperature"]).timeout_seconds == 30.0
+    assert cli_mod._parse_args(["heating.boiler.temperature", "--timeout-seconds", "7.5"]).timeout_seconds == 7.5
+
+
+def test_parse_args_rejects_non_numeric_timeout(capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli_mod._parse_args(["heating.boiler.temperature", "--timeout-seconds", "soon"])
+
+    assert exc.value.code == 2
+    assert "invalid float value" in capsys.readouterr().err
@@ -1,15 +1,27 @@
 """Unit tests for backend.heating.iot_data.feature_data_fetcher."""
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
+import requests
 
+import backend.shared.config as config_mod
 import backend.viessmann.api_auth.auth as auth_mod
 import backend.heating.iot_data.feature_data_fetcher as fetcher_mod
 from backend.heating.iot_data.get_iot_config import IotConfig
 
 
+@pytest.fixture(autouse=True)
+def _clear_feature_cache():
+    fetcher_mod.clear_feature_cache()
+    yield
+    fetcher_mod.clear_feature_cache()
+
+
 def _make_iot_config(
     *,
     access_token: str = "test-token",
@@ -30,6 +42,7 @@ def _mock_json_response(payload, *, status_code: int = 200, text: str = ""):
     resp.status_code = status_code
     resp.text = text
     resp.json = Mock(return_value=payload)
+    resp.content = json.dumps(payload).encode()
     return resp
 
 
@@ -66,7 +79,7 @@ def test_get_device_features_returns_data_array() -> None:
     assert len(features) == 2
     assert features[0]["feature"] == "heating.circuits.0.temperature"
     assert features[1]["feature"] == "heating.boiler.temperature"
-    expected_url = fetcher_mod.IOT_FEATURES_URL_TMPL.format(
+    expected_url = config_mod.get_iot_features_url_tmpl().format(
         installation_id="inst-123",
         gateway_serial="gw-xyz",
         device_id="dev-1",
@@ -189,7 +202,7 @@ def test_get_feature_data_without_cache_fetches_via_single_feature_endpoint() ->
     assert result is not None
     assert result["feature"] == "heating.circuits.0.temperature"
     session.get.assert_called_once()
-    expected_url = fetcher_mod.IOT_SINGLE_FEATURE_URL_TMPL.format(
+    expected_url = config_mod.get_iot_single_feature_url_tmpl().format(
         installation_id="inst-123",
         gateway_serial="gw-xyz",
         device_id="dev-1",
@@ -214,3 +227,228 @@ def test_get_feature_data_without_cache_returns_none_on_404() -> None:
     )
 
     assert result is None
+
+
+def test_iot_config_urls_match_config_templates() -> None:
+    iot_config = _make_iot_config()
+
+    assert iot_config.features_url == config_mod.get_iot_features_url_tmpl().format(
+        installation_id="inst-123", gateway_serial="gw-xyz", device_id="dev-1"
+    )
+    assert iot_config.features_url is iot_config.features_url
+    assert iot_config.single_feature_url("heating.boiler.temperature") == config_mod.get_iot_single_feature_url_tmpl().format(
+        installation_id="inst-123",
+        gateway_serial="gw-xyz",
+        device_id="dev-1",
+        feature_path="heating.boiler.temperature",
+    )
+
+def test_get_single_feature_memoizes_within_ttl(monkeypatch) -> None:
+    iot_config = _make_iot_config()
+    session = Mock()
+    session.get.return_value = _mock_json_response({
+        "data": {"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}},
+    })
+
+    first = fetcher_mod.get_single_feature("heating.boiler.temperature", iot_config, session=session)
+    first["properties"]["value"] = "mutated by caller"
+    second = fetcher_mod.get_single_feature("heating.boiler.temperature", iot_config, session=session)
+    second["isEnabled"] = False
+    third = fetcher_mod.get_single_feature("heating.boiler.temperature", iot_config, session=session)
+
+    # Served from the memo, but as copies: caller mutations don't leak into later hits.
+    assert third == {"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}}
+    session.get.assert_called_once()
+
+    monkeypatch.setattr(fetcher_mod, "_FEATURE_CACHE_TTL_SECONDS", 0.0)
+    fetcher_mod.clear_feature_cache()
+    fetcher_mod.get_single_feature("heating.boiler.temperature", iot_config, session=session)
+    fetcher_mod.get_single_feature("heating.boiler.temperature", iot_config, session=session)
+    assert session.get.call_count == 3
+
+
+def test_feature_cache_evicts_safely_under_concurrent_puts(monkeypatch) -> None:
+    monkeypatch.setattr(fetcher_mod, "_FEATURE_CACHE_MAXSIZE", 8)
+    monkeypatch.setattr(fetcher_mod, "_FEATURE_CACHE_TTL_SECONDS", 60.0)
+
+    def fill(worker: int) -> None:
+        for i in range(500):
+            fetcher_mod._cache_put((str(worker), str(i)), {"i": i})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for future in [pool.submit(fill, n) for n in range(4)]:
+            future.result()  # re-raises e.g. "dictionary changed size during iteration"
+
+    assert len(fetcher_mod._FEATURE_CACHE) == 8
+
+
+def test_feature_memo_ttl_comes_from_env(monkeypatch) -> None:
+    iot_config = _make_iot_config()
+    session = Mock()
+    session.get.return_value = _mock_json_response({"data": []})
+
+    monkeypatch.setenv("VIESSMANN_FEATURE_CACHE_TTL", "0")
+    fetcher_mod.get_device_features(iot_config, session=session)
+    fetcher_mod.get_device_features(iot_config, session=session)
+    assert session.get.call_count == 2
+
+    monkeypatch.setenv("VIESSMANN_FEATURE_CACHE_TTL", "60")
+    fetcher_mod.get_device_features(iot_config, session=session)
+    fetcher_mod.get_device_features(iot_config, session=session)
+    assert session.get.call_count == 3
+
+
+def test_get_device_features_memoizes_per_device() -> None:
+    session = Mock()
+    session.get.return_value = _mock_json_response({"data": [{"feature": "a", "isEnabled": True}]})
+
+    fetcher_mod.get_device_features(_make_iot_config(), session=session)
+    fetcher_mod.get_device_features(_make_iot_config(), session=session)
+    fetcher_mod.get_device_features(_make_iot_config(device_id="dev-2"), session=session)
+
+    assert session.get.call_count == 2
+
+
+def test_get_feature_data_with_indexed_features() -> None:
+    iot_config = _make_iot_config()
+    index = fetcher_mod.index_features([
+        {"feature": "heating.circuits.0.temperature", "isEnabled": True, "properties": {"value": 21}},
+        {"feature": "heating.boiler.temperature", "isEnabled": False, "properties": {"value": 65}},
+        {"isEnabled": True},
+        "not-a-dict",
+    ])
+
+    assert set(index) == {"heating.circuits.0.temperature", "heating.boiler.temperature"}
+    found = fetcher_mod.get_feature_data("heating.circuits.0.temperature", iot_config, features_data=index)
+    assert found["properties"]["value"] == 21
+    assert fetcher_mod.get_feature_data("heating.boiler.temperature", iot_config, features_data=index) is None
+    assert fetcher_mod.get_feature_data("heating.dhw.temperature", iot_config, features_data=index) is None
+
+
+def test_index_features_can_keep_only_requested_paths() -> None:
+    features = [
+        {"feature": "heating.circuits.0.temperature", "isEnabled": True},
+        {"feature": "heating.boiler.temperature", "isEnabled": True},
+        {"feature": "heating.dhw.temperature", "isEnabled": True},
+        "not-a-dict",
+    ]
+
+    index = fetcher_mod.index_features(features, ["heating.boiler.temperature", "heating.missing"])
+
+    assert list(index) == ["heating.boiler.temperature"]
+
+
+def test_default_session_is_shared_and_pooled(monkeypatch) -> None:
+    monkeypatch.setattr(fetcher_mod, "_default_session", None)
+
+    first = fetcher_mod._get_default_session()
+    second = fetcher_mod._get_default_session()
+
+    assert first is second
+    adapter = first.get_adapter("https://api.viessmann-climatesolutions.com")
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.raise_on_status is False
+
+
+class _FakeAdapter(requests.adapters.BaseAdapter):
+    """Answers single-feature GETs in-process and records the requested paths."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        path = request.url.rsplit("/", 1)[-1]
+        with self._lock:
+            self.calls.append(path)
+        resp = requests.Response()
+        resp.request = request
+        resp.url = request.url
+        if path == "missing":
+            resp.status_code = 404
+            resp._content = b"{}"  # noqa: SLF001 - test helper
+        else:
+            resp.status_code = 200
+            resp._content = json.dumps(  # noqa: SLF001 - test helper
+                {"data": {"feature": path, "isEnabled": True, "properties": {}}}
+            ).encode()
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def test_get_single_features_fetches_each_path_once() -> None:
+    iot_config = _make_iot_config()
+    adapter = _FakeAdapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.get = Mock(side_effect=AssertionError("shared session used from a worker"))
+
+    result = fetcher_mod.get_single_features(
+        ["heating.boiler.temperature", "missing", "heating.boiler.temperature", "heating.dhw.temperature"],
+        iot_config,
+        session=session,
+    )
+
+    assert list(result) == ["heating.boiler.temperature", "missing", "heating.dhw.temperature"]
+    assert result["missing"] is None
+    assert result["heating.dhw.temperature"]["feature"] == "heating.dhw.temperature"
+    # Every GET went through the shared adapter, none through the shared Session.
+    assert sorted(adapter.calls) == sorted(result)
+
+
+def test_worker_session_shares_adapters_but_not_session_state() -> None:
+    base = auth_mod._build_session()
+    base.headers["Authorization"] = "Bearer base"
+
+    worker = auth_mod._worker_session(base)
+    worker.headers["Authorization"] = "Bearer worker"
+
+    assert worker is not base
+    assert worker.get_adapter("https://api.example.invalid") is base.get_adapter("https://api.example.invalid")
+    assert base.headers["Authorization"] == "Bearer base"
+    assert worker.cookies is not base.cookies
+
+
+def test_get_feature_data_disk_cached_reuses_file_across_calls(tmp_path) -> None:
+    iot_config = _make_iot_config()
+    cache_path = tmp_path / "features.json"
+    session = Mock()
+    session.get.return_value = _mock_json_response({
+        "data": {"feature": "heating.boiler.temperature", "isEnabled": True, "properties": {"value": 65}},
+    })
+
+    first = fetcher_mod.get_feature_data_disk_cached(
+        "heating.boiler.temperature", iot_config, cache_path=cache_path, session=session
+    )
+    # A new process would start with an empty in-memory memo.
+    fetcher_mod.clear_feature_cache()
+    second = fetcher_mod.get_feature_data_disk_cached(
+        "heating.boiler.temperature", iot_config, cache_path=cache_path, session=session
+    )
+
+    assert first == second
+    session.get.assert_called_once()
+    assert oct(cache_path.stat().st_mode & 0o777) == "0o600"
+
+    expired_path = tmp_path / "expired.json"
+    fetcher_mod.clear_feature_cache()
+    fetcher_mod.get_feature_data_disk_cached(
+        "heating.boiler.temperature", iot_config, cache_path=expired_path, ttl_seconds=0.0, session=session
+    )
+    fetcher_mod.clear_feature_cache()
+    fetcher_mod.get_feature_data_disk_cached(
+        "heating.boiler.temperature", iot_config, cache_path=expired_path, session=session
+    )
+    assert session.get.call_count == 3
+
+
+def test_get_single_feature_rejects_unexpected_shape() -> None:
+    session = Mock()
+    session.get.return_value = _mock_json_response({"data": "oops"})
+
+    with pytest.raises(auth_mod.CliError, match="Unexpected 'data' type"):
+        fetcher_mod.get_single_feature("heating.boiler.temperature", _make_iot_config(), session=session)
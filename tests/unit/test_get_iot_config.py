@@ -1,3 +1,6 @@
+import http.server
+import json
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock
 
@@ -15,6 +18,7 @@ def _mock_json_response(payload, *, status_code: int = 200, text: str = ""):
     resp.status_code = status_code
     resp.text = text
     resp.json = Mock(return_value=payload)
+    resp.content = json.dumps(payload).encode()
     return resp
 
 
@@ -199,3 +203,194 @@ def test_missing_device_id_key_raises_clear_error() -> None:
 
     assert "Missing or invalid 'id'" in str(e.value)
     assert "devices" in str(e.value)
+
+
+def test_iot_config_is_slotted_and_compares_on_ids_only() -> None:
+    a = get_iot_mod.IotConfig(access_token="t", installation_id="i", gateway_serial="g", device_id="d")
+    b = get_iot_mod.IotConfig(access_token="t", installation_id="i", gateway_serial="g", device_id="d")
+
+    assert not hasattr(a, "__dict__")
+    assert a == b
+    assert "features_url" not in repr(a)
+    assert a.features_url.endswith("/installations/i/gateways/g/devices/d/features")
+
+
+def test_api_get_json_raises_cli_error_on_invalid_json() -> None:
+    session = Mock()
+    resp = _mock_json_response(None, text="<html>oops</html>")
+    resp.content = b"<html>oops</html>"
+    session.get.return_value = resp
+
+    with pytest.raises(auth_mod.CliError, match="not valid JSON"):
+        get_iot_mod.api_get_json(
+            session=session, url="https://x/y", access_token="t", cfg=_make_cfg(), log=None, auth_mod=auth_mod
+        )
+
+
+def test_api_get_json_error_body_is_bounded_preview_of_raw_bytes() -> None:
+    session = Mock()
+    resp = Mock()
+    resp.status_code = 500
+    resp.content = ("é" * 1000).encode("utf-8") + b"\xff"
+    session.get.return_value = resp
+
+    with pytest.raises(auth_mod.CliError) as excinfo:
+        get_iot_mod.api_get_json(
+            session=session, url="https://x/y", access_token="t", cfg=_make_cfg(), log=None, auth_mod=auth_mod
+        )
+
+    # 800 bytes of 2-byte characters -> 400 characters, no full-body decode.
+    assert "é" * 400 in str(excinfo.value)
+    assert "é" * 401 not in str(excinfo.value)
+
+
+def test_get_iot_config_fetches_installations_and_gateways_concurrently(monkeypatch) -> None:
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_installation_id(**kwargs):
+        both_started.wait()
+        return "inst-1"
+
+    def fake_gateway_serial(**kwargs):
+        both_started.wait()
+        return "gw-1"
+
+    monkeypatch.setattr(get_iot_mod, "get_installation_id", fake_installation_id)
+    monkeypatch.setattr(get_iot_mod, "get_gateway_serial", fake_gateway_serial)
+    monkeypatch.setattr(get_iot_mod, "get_device_id", lambda **kw: f"dev-for-{kw['installation_id']}-{kw['gateway_serial']}")
+    monkeypatch.setattr(get_iot_mod, "get_valid_token", lambda **kw: ("AT", None, None, None, None, 0))
+    monkeypatch.setattr(
+        get_iot_mod.auth_mod, "load_config", lambda args, log: SimpleNamespace(timeout_seconds=30.0, ssl_verify=True)
+    )
+    monkeypatch.setattr(get_iot_mod.config_mod, "get_token_cache_path", lambda: None)
+
+    cfg = get_iot_mod.get_iot_config()
+
+    assert (cfg.installation_id, cfg.gateway_serial, cfg.device_id) == ("inst-1", "gw-1", "dev-for-inst-1-gw-1")
+
+
+def test_get_iot_config_gives_concurrent_lookups_their_own_sessions(monkeypatch) -> None:
+    sessions = {}
+
+    def record(name, result):
+        def fake(**kwargs):
+            sessions[name] = kwargs["session"]
+            return result
+
+        return fake
+
+    monkeypatch.setattr(get_iot_mod, "get_installation_id", record("installations", "inst-1"))
+    monkeypatch.setattr(get_iot_mod, "get_gateway_serial", record("gateways", "gw-1"))
+    monkeypatch.setattr(get_iot_mod, "get_device_id", record("devices", "dev-1"))
+    monkeypatch.setattr(get_iot_mod, "get_valid_token", lambda **kw: ("AT", None, None, None, None, 0))
+    monkeypatch.setattr(
+        get_iot_mod.auth_mod, "load_config", lambda args, log: SimpleNamespace(timeout_seconds=30.0, ssl_verify=True)
+    )
+    monkeypatch.setattr(get_iot_mod.config_mod, "get_token_cache_path", lambda: None)
+
+    get_iot_mod.get_iot_config()
+
+    base = sessions["devices"]
+    assert len({id(s) for s in sessions.values()}) == 3
+    for name in ("installations", "gateways"):
+        worker = sessions[name]
+        assert worker.headers["Authorization"] == "Bearer AT"
+        assert worker.get_adapter("https://api.example.invalid") is base.get_adapter("https://api.example.invalid")
+
+
+def test_get_iot_config_passes_timeout_and_verify_snapshot_to_lookups(monkeypatch) -> None:
+    seen = []
+
+    def record(result):
+        def fake(**kwargs):
+            seen.append((kwargs["timeout"], kwargs["verify"]))
+            return result
+
+        return fake
+
+    monkeypatch.setattr(get_iot_mod, "get_installation_id", record("inst-1"))
+    monkeypatch.setattr(get_iot_mod, "get_gateway_serial", record("gw-1"))
+    monkeypatch.setattr(get_iot_mod, "get_device_id", record("dev-1"))
+    monkeypatch.setattr(get_iot_mod, "get_valid_token", lambda **kw: ("AT", None, None, None, None, 0))
+    monkeypatch.setattr(get_iot_mod.config_mod, "get_token_cache_path", lambda: None)
+    monkeypatch.setenv("VIESSMANN_CLIENT_ID", "cid")
+    monkeypatch.setenv("VIESSMANN_EMAIL", "user@example.com")
+    monkeypatch.setenv("VIESSMANN_PASSWORD", "pw")
+
+    # Real load_config: the timeout travels as a float, not a str round-trip.
+    get_iot_mod.get_iot_config(timeout_seconds=12.5, ssl_verify=False)
+
+    assert seen == [(12.5, False)] * 3
+
+
+def test_list_lookups_use_module_url_constants(monkeypatch) -> None:
+    monkeypatch.setattr(get_iot_mod, "IOT_INSTALLATIONS_URL", "https://patched.example/installations")
+    session = Mock()
+    session.get.return_value = _mock_json_response({"data": [{"id": 7}]})
+
+    assert get_iot_mod.get_installation_id(
+        session=session, access_token="t", cfg=_make_cfg(), log=None, auth_mod=auth_mod
+    ) == "7"
+    assert session.get.call_args[0][0] == "https://patched.example/installations"
+
+
+def test_module_import_defers_requests() -> None:
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    src = Path(__file__).resolve().parents[2] / "backend" / "src"
+    code = (
+        "import sys; import backend.heating.iot_data.get_iot_config as m; "
+        "assert 'requests' not in sys.modules and 'argparse' not in sys.modules; "
+        "assert m.IOT_GATEWAYS_URL.endswith('/gateways')"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=src)
+
+
+def test_extract_list_rejects_non_object_first_item() -> None:
+    with pytest.raises(auth_mod.CliError, match="expected list of objects"):
+        get_iot_mod._extract_list({"data": ["x", {"id": 1}]}, url="https://x", auth_mod=auth_mod)
+
+    assert get_iot_mod._extract_list([], url="https://x", auth_mod=auth_mod) == []
+
+
+def test_api_get_json_gateway_error_after_retries_raises_cli_error() -> None:
+    hits = []
+
+    class _BadGateway(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            hits.append(self.path)
+            body = b'{"error": "bad gateway"}'
+            self.send_response(502)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _BadGateway)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        # The session get_iot_config uses, with its retrying adapter also on http://.
+        session = auth_mod._build_session()
+        session.mount("http://", session.get_adapter("https://api.example.invalid"))
+        url = f"http://127.0.0.1:{server.server_port}/iot/v2/equipment/gateways"
+
+        with pytest.raises(auth_mod.CliError, match="HTTP 502.*bad gateway"):
+            get_iot_mod.api_get_json(
+                session=session,
+                url=url,
+                access_token="token",
+                cfg=_make_cfg(timeout_seconds=5.0),
+                log=Mock(),
+                auth_mod=auth_mod,
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(hits) == 3  # first attempt + 2 retries
@@ -1,9 +1,12 @@
 """Unit tests for backend.heating.iot_data.heating_values."""
 
-from unittest.mock import patch
+import json
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
 
 import pytest
 
+import backend.heating.iot_data.feature_data_fetcher as fetcher_mod
 import backend.heating.iot_data.heating_values as hv_mod
 from backend.heating.iot_data.get_iot_config import IotConfig
 
@@ -48,9 +51,11 @@ def test_get_heating_values_extracts_gas_consumption_m3_from_day_value() -> None
                 return props
         return None
 
-    with patch.object(hv_mod, "get_device_features", return_value=features):
-        with patch.object(hv_mod, "get_feature_value", side_effect=mock_get_feature_value):
-            result = hv_mod.get_heating_values(iot_config)
+    def mock_bulk(paths, *args, **kwargs):
+        return {path: mock_get_feature_value(path) for path in paths}
+
+    with patch.object(hv_mod, "get_feature_values_bulk", side_effect=mock_bulk):
+        result = hv_mod.get_heating_values(iot_config)
 
     assert result["gas_consumption_m3_today"] == 5.5
     assert result["gas_consumption_m3_yesterday"] == 8.3
@@ -58,7 +63,17 @@ def test_get_heating_values_extracts_gas_consumption_m3_from_day_value() -> None
     assert result["starts"] == 25
     assert result["supply_temp"] == 45.2
     assert result["outside_temp"] == 3.1
-    assert "fetched_at" in result
+    fetched_at = datetime.fromisoformat(result["fetched_at"])
+    assert fetched_at.utcoffset() == timedelta(0)
+    assert fetched_at.microsecond == 0
+
+
+def test_heating_values_typed_dict_lists_every_returned_key() -> None:
+    with patch.object(hv_mod, "get_feature_values_bulk", return_value={}):
+        result = hv_mod.get_heating_values(_make_iot_config())
+
+    assert type(result) is dict
+    assert set(result) == set(hv_mod.HeatingValues.__annotations__)
 
 
 def test_get_heating_values_returns_none_when_day_value_empty() -> None:
@@ -71,17 +86,12 @@ def test_get_heating_values_returns_none_when_day_value_empty() -> None:
         {"feature": "heating.sensors.temperature.outside", "isEnabled": True, "properties": {}},
     ]
 
-    with patch.object(hv_mod, "get_device_features", return_value=features):
-        with patch.object(hv_mod, "get_feature_value") as mock_gfv:
-            def side_effect(path, *args, **kwargs):
-                for f in features:
-                    if f.get("feature") == path:
-                        return f.get("properties")
-                return None
-
-            mock_gfv.side_effect = side_effect
+    def mock_bulk(paths, *args, **kwargs):
+        by_path = {f["feature"]: f.get("properties") for f in features}
+        return {path: by_path.get(path) for path in paths}
 
-            result = hv_mod.get_heating_values(iot_config)
+    with patch.object(hv_mod, "get_feature_values_bulk", side_effect=mock_bulk):
+        result = hv_mod.get_heating_values(iot_config)
 
     assert result["gas_consumption_m3_today"] is None
     assert result["gas_consumption_m3_yesterday"] is None
@@ -102,3 +112,71 @@ def test_extract_gas_consumption_m3_pair_single_element_returns_yesterday_none()
     """When day.value has only one element, yesterday is None."""
     props = {"day": {"type": "array", "value": [5.5], "unit": "cubicMeter"}}
     assert hv_mod._extract_gas_consumption_m3_pair(props) == (5.5, None)
+
+
+@pytest.mark.parametrize(
+    "props, expected",
+    [
+        (None, (None, None)),
+        ([1, 2], (None, None)),
+        ({"day": None}, (None, None)),
+        ({"day": {"value": "12"}}, (None, None)),
+        ({"day": {"value": []}}, (None, None)),
+        ({"day": {"value": ["x", "2.5"]}}, (None, 2.5)),
+    ],
+)
+def test_extract_gas_consumption_m3_pair_tolerates_malformed_payloads(props, expected) -> None:
+    assert hv_mod._extract_gas_consumption_m3_pair(props) == expected
+
+
+def test_set_heating_mode_posts_on_given_session_and_clears_feature_cache() -> None:
+    iot_config = _make_iot_config()
+    session = Mock()
+    session.post.return_value = Mock(status_code=202, content=b"")
+
+    with patch.object(hv_mod, "clear_feature_cache") as clear_cache:
+        hv_mod.set_heating_mode("standby", iot_config, session=session)
+
+    assert session.post.call_args[0][0] == (
+        iot_config.single_feature_url(hv_mod.OPERATING_MODE_FEATURE) + "/commands/setMode"
+    )
+    assert session.post.call_args[1]["json"] == {"mode": "standby"}
+    clear_cache.assert_called_once_with()
+
+
+def test_get_heating_values_rereads_mode_when_device_features_are_memoized() -> None:
+    iot_config = _make_iot_config()
+    mode = {"value": "heating"}
+
+    def mode_feature() -> dict:
+        return {
+            "feature": hv_mod.OPERATING_MODE_FEATURE,
+            "isEnabled": True,
+            "properties": {"value": {"type": "string", "value": mode["value"]}},
+        }
+
+    def fake_get(url, **kwargs):
+        if url == iot_config.features_url:
+            payload = {"data": [mode_feature()]}
+        else:
+            assert url == iot_config.single_feature_url(hv_mod.OPERATING_MODE_FEATURE)
+            payload = {"data": mode_feature()}
+        return Mock(status_code=200, content=json.dumps(payload).encode())
+
+    session = Mock()
+    session.get.side_effect = fake_get
+    fetcher_mod.clear_feature_cache()
+    try:
+        first = hv_mod.get_heating_values(iot_config, session=session)
+        # setMode handled by another container: this container's memo is not cleared.
+        mode["value"] = "standby"
+        second = hv_mod.get_heating_values(iot_config, session=session)
+    finally:
+        fetcher_mod.clear_feature_cache()
+
+    assert first["operating_mode"] == "heating"
+    assert second["operating_mode"] == "standby"
+    assert [call.args[0] for call in session.get.call_args_list] == [
+        iot_config.features_url,
+        iot_config.single_feature_url(hv_mod.OPERATING_MODE_FEATURE),
+    ]
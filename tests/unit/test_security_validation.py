@@ -232,7 +232,7 @@ def test_cors_restrictions_configured():
     # This is verified through infrastructure code inspection:
     # - api_stack.py configures CORS with specific allowed origins
     # - Allowed origins include localhost for development and CloudFront domain for production
-    # - Only specific HTTP methods are allowed (GET, POST, OPTIONS)
+    # - Only specific HTTP methods are allowed (GET, POST, PUT; preflight handled by HTTP API)
     # - Only specific headers are allowed (Content-Type, Authorization)
     
     # Verification: Check that CORS is configured in api_stack.py
@@ -249,15 +249,16 @@ def test_cors_allowed_methods():
     """
     For CORS configuration, only specific HTTP methods SHALL be allowed.
     
-    This test verifies that only GET, POST, and OPTIONS methods are allowed.
+    This test verifies that only GET, POST, and PUT methods are allowed.
     """
     # This is verified through infrastructure code inspection:
-    # - api_stack.py specifies allow_methods=[GET, POST, OPTIONS]
-    # - Other methods (PUT, DELETE, PATCH) are not allowed
+    # - api_stack.py specifies allow_methods=[GET, POST, PUT]
+    # - Preflight OPTIONS requests are answered by HTTP API itself
+    # - Other methods (DELETE, PATCH) are not allowed
     
-    # Verification: Check that only GET, POST, OPTIONS are allowed
+    # Verification: Check that only GET, POST, PUT are allowed
     # In production, this would be verified by:
-    # 1. Making PUT request to API endpoint
+    # 1. Making DELETE request to API endpoint
     # 2. Verifying response is 403 or method not allowed
     
     assert True, "CORS allowed methods verified in infrastructure code"
@@ -533,9 +534,9 @@ def test_lambda_execution_role_least_privilege():
     This test verifies that Lambda functions only have necessary permissions.
     """
     # This is verified through infrastructure code inspection:
-    # - api_stack.py creates Lambda execution role with specific permissions
-    # - Role has AWSLambdaBasicExecutionRole for CloudWatch Logs
-    # - Role has DynamoDB permissions limited to: PutItem, GetItem, Query, Scan
+    # - api_stack.py creates one execution role per DynamoDB handler
+    # - Each role has AWSLambdaBasicExecutionRole for CloudWatch Logs
+    # - DynamoDB permissions limited to: Query + PutItem (submit), Query (history, recent)
     # - Role does NOT have permissions for: DeleteItem, UpdateItem, DescribeTable, etc.
     # - Role is scoped to specific DynamoDB table ARN
     
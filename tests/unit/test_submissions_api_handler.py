@@ -0,0 +1,36 @@
+"""Tests for the combined submissions API router handler."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import lambdas.submissions_api.handler as mod
+
+
+@pytest.mark.parametrize(
+    "route_key,target",
+    [
+        ("POST /submit", "lambdas.submit.handler.lambda_handler"),
+        ("GET /history", "lambdas.history.handler.lambda_handler"),
+        ("GET /recent", "lambdas.recent.handler.lambda_handler"),
+    ],
+)
+def test_lambda_handler_delegates_by_route_key(route_key, target) -> None:
+    event = {"routeKey": route_key}
+    context = object()
+    with patch(target, return_value={"statusCode": 200, "body": "{}"}) as handler:
+        result = mod.lambda_handler(event, context)
+    handler.assert_called_once_with(event, context)
+    assert result == {"statusCode": 200, "body": "{}"}
+
+
+def test_lambda_handler_unknown_route_returns_404() -> None:
+    result = mod.lambda_handler({"routeKey": "DELETE /submit"}, None)
+    assert result["statusCode"] == 404
+    assert json.loads(result["body"]) == {"error": "Not found"}
+
+
+def test_lambda_handler_missing_route_key_returns_404() -> None:
+    result = mod.lambda_handler({}, None)
+    assert result["statusCode"] == 404
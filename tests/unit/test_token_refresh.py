@@ -118,6 +118,15 @@ def test_save_and_load_token_cache_roundtrip(tmp_path: Path) -> None:
     assert cache_path.stat().st_mode & 0o777 == 0o600
 
 
+def test_save_token_cache_replaces_existing_file_without_leftovers(tmp_path: Path) -> None:
+    cache_path = tmp_path / "nested" / "tokens.json"
+    get_iot_mod.save_token_cache(cache_path, {"access_token": "old", "expires_at": 1})
+    get_iot_mod.save_token_cache(cache_path, {"access_token": "new", "expires_at": 2})
+
+    assert get_iot_mod.load_token_cache(cache_path)["access_token"] == "new"
+    assert [p.name for p in cache_path.parent.iterdir()] == ["tokens.json"]
+
+
 def test_get_valid_token_uses_cache_when_valid(tmp_path: Path, monkeypatch) -> None:
     """get_valid_token returns cached token when not expired."""
     monkeypatch.setenv("VIESSMANN_CLIENT_ID", "client-id")
@@ -230,6 +239,32 @@ def test_get_valid_token_refreshes_when_expired(tmp_path: Path, monkeypatch) ->
     assert loaded["access_token"] == "REFRESHED_TOKEN"
 
 
+def test_get_valid_token_refresh_omits_unknown_ids_from_cache(tmp_path: Path, monkeypatch) -> None:
+    """A refresh before the IoT ids are known writes only the token fields."""
+    monkeypatch.setenv("VIESSMANN_CLIENT_ID", "client-id")
+    monkeypatch.setenv("VIESSMANN_EMAIL", "user@example.com")
+    monkeypatch.setenv("VIESSMANN_PASSWORD", "pw")
+
+    cache_path = tmp_path / "tokens.json"
+    cache_path.write_text(
+        json.dumps({"access_token": "EXPIRED_TOKEN", "refresh_token": "VALID_REFRESH", "expires_at": int(time.time()) - 100})
+    )
+    cache_path.chmod(0o600)
+
+    session = Mock()
+    session.post.return_value = _make_json_response(
+        {"access_token": "REFRESHED_TOKEN", "expires_in": 1800}, status_code=200
+    )
+    log = logging.LoggerAdapter(logging.getLogger("test"), {})
+    cfg = auth_mod.load_config(get_iot_mod._build_auth_args(timeout_seconds=30.0, ssl_verify=True), log=log)
+
+    get_iot_mod.get_valid_token(session=session, cfg=cfg, log=log, auth_mod=auth_mod, cache_path=cache_path)
+
+    loaded = get_iot_mod.load_token_cache(cache_path)
+    assert set(loaded) == {"access_token", "refresh_token", "expires_at"}
+    assert loaded["refresh_token"] == "VALID_REFRESH"
+
+
 def test_get_valid_token_full_oauth_when_no_cache(tmp_path: Path, monkeypatch) -> None:
     """get_valid_token runs full OAuth when cache_path is None."""
     monkeypatch.setenv("VIESSMANN_CLIENT_ID", "client-id")
@@ -268,3 +303,29 @@ def test_get_valid_token_full_oauth_when_no_cache(tmp_path: Path, monkeypatch) -
     assert gw_serial is None
     assert dev_id is None
     assert session.post.call_count == 2  # authorize + token exchange
+
+
+def test_get_iot_config_returns_from_cache_without_network(tmp_path: Path, monkeypatch) -> None:
+    cache_path = tmp_path / "tokens.json"
+    get_iot_mod.save_token_cache(
+        cache_path,
+        {
+            "access_token": "CACHED",
+            "refresh_token": "rt",
+            "expires_at": int(time.time()) + 3600,
+            "installation_id": 194640,
+            "gateway_serial": "gw-1",
+            "device_id": "0",
+        },
+    )
+    monkeypatch.setattr(get_iot_mod.config_mod, "get_token_cache_path", lambda: cache_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("warm cache must not load credentials or open a session")
+
+    monkeypatch.setattr(get_iot_mod.auth_mod, "load_config", fail)
+    monkeypatch.setattr(get_iot_mod.auth_mod, "_build_session", fail)
+
+    cfg = get_iot_mod.get_iot_config()
+
+    assert (cfg.access_token, cfg.installation_id, cfg.gateway_serial, cfg.device_id) == ("CACHED", "194640", "gw-1", "0")
@@ -69,3 +69,19 @@ def test_raises_cli_error_when_code_missing(vis_auth) -> None:
     with pytest.raises(vis_auth.CliError):
         vis_auth.extract_authorization_code(response=resp)
 
+
+
+def test_extracts_percent_encoded_code_and_ignores_fragment(vis_auth) -> None:
+    resp = FakeResponse(headers={"Location": "http://localhost:4200/?state=s&code=a%2Fb%3D#code=frag"})
+    assert vis_auth.extract_authorization_code(response=resp) == "a/b="
+
+
+def test_code_only_in_fragment_or_other_param_is_not_extracted_from_url(vis_auth) -> None:
+    assert vis_auth._extract_code_from_url("http://localhost:4200/?xcode=1#code=frag") is None
+    assert vis_auth._extract_code_from_url("http://localhost:4200/?code=&state=s") is None
+
+
+def test_code_in_path_is_not_extracted_from_url(vis_auth) -> None:
+    assert vis_auth._extract_code_from_url("http://localhost:4200/cb&code=path") is None
+    assert vis_auth._extract_code_from_url("http://localhost:4200/cb&code=path?state=s") is None
+    assert vis_auth._extract_code_from_url("http://localhost:4200/cb&code=path?state=s&code=real") == "real"
@@ -0,0 +1,66 @@
+"""Unit tests for `backend.shared.config` URL getters (offline)."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+import backend.shared.config as config_mod
+
+
+@pytest.fixture
+def fresh_url_cache():
+    config_mod.reset_url_cache()
+    yield
+    config_mod.reset_url_cache()
+
+
+def test_url_getters_are_memoized_until_reset(monkeypatch, fresh_url_cache) -> None:
+    monkeypatch.setenv("VIESSMANN_API_BASE_URL", "https://api.staging.example/")
+    assert config_mod.get_users_me_url() == "https://api.staging.example/users/v1/users/me"
+
+    monkeypatch.setenv("VIESSMANN_API_BASE_URL", "https://api.other.example")
+    assert config_mod.get_api_base_url() == "https://api.staging.example/"
+
+    config_mod.reset_url_cache()
+    assert config_mod.get_api_base_url() == "https://api.other.example"
+    assert config_mod.get_iot_gateways_url() == "https://api.other.example/iot/v2/equipment/gateways"
+
+
+def test_load_dotenv_runs_once(monkeypatch, tmp_path) -> None:
+    (tmp_path / ".env").write_text("VIS_CONNECT_DOTENV_PROBE=first\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("VIS_CONNECT_DOTENV_PROBE", raising=False)
+    monkeypatch.setattr(config_mod, "_DOTENV_LOADED", False)
+    monkeypatch.setattr(config_mod, "_DOTENV_RESULT", None)
+
+    config_mod._load_dotenv()
+    assert config_mod._DOTENV_LOADED is True
+    monkeypatch.delenv("VIS_CONNECT_DOTENV_PROBE")
+
+    config_mod._load_dotenv()
+    assert "VIS_CONNECT_DOTENV_PROBE" not in os.environ
+
+
+def test_load_dotenv_reports_earlier_load_to_later_logger(monkeypatch, tmp_path) -> None:
+    (tmp_path / ".env").write_text("VIS_CONNECT_DOTENV_PROBE=first\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("VIS_CONNECT_DOTENV_PROBE", raising=False)
+    monkeypatch.setattr(config_mod, "_DOTENV_LOADED", False)
+    monkeypatch.setattr(config_mod, "_DOTENV_RESULT", None)
+    config_mod._load_dotenv()  # as on module import: no logger yet
+    monkeypatch.delenv("VIS_CONNECT_DOTENV_PROBE")
+    log = Mock()
+
+    config_mod._load_dotenv(log=log)
+
+    log.debug.assert_called_once_with(
+        "loaded .env from %s (shell vars take precedence)", tmp_path / ".env"
+    )
+
+
+def test_package_root_env_points_at_backend_project() -> None:
+    assert (config_mod._PACKAGE_ROOT_ENV.parent / "pyproject.toml").is_file()
+    assert config_mod._PACKAGE_ROOT_ENV.name == ".env"
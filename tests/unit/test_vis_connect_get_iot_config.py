@@ -2,8 +2,8 @@
 Offline unit tests for `backend.heating.iot_data.get_iot_config`.
 
 We do not perform network calls:
-- OAuth calls (/authorize, /token) are satisfied by a fake Session.post().
-- IoT list endpoints are satisfied by a fake Session.get().
+- OAuth calls (/authorize, /token) and the IoT list endpoints are answered by a
+  fake transport adapter mounted on a real requests.Session.
 """
 
 from __future__ import annotations
@@ -36,23 +36,31 @@ def _make_redirect_response(*, location: str, status_code: int = 302) -> request
     return resp
 
 
-class FakeSession:
+class FakeAdapter(requests.adapters.BaseAdapter):
+    """Transport for a real Session: answers OAuth and IoT list requests in-process."""
+
     def __init__(self, mod, *, installations_payload, gateways_payload, devices_payload) -> None:
+        super().__init__()
         self._mod = mod
         self._installations_payload = installations_payload
         self._gateways_payload = gateways_payload
         self._devices_payload = devices_payload
-        self.get_calls: list[dict] = []
-
-    def post(self, url: str, **kwargs):  # noqa: ANN001 - mimic requests.Session.post
-        if url == auth_mod.AUTHORIZE_URL:
-            return _make_redirect_response(location="http://localhost:4200/?code=fake-auth-code")
-        if url == auth_mod.TOKEN_URL:
-            return _make_json_response({"access_token": "FAKE_ACCESS_TOKEN"}, url=url)
-        raise AssertionError(f"Unexpected POST url: {url}")
-
-    def get(self, url: str, **kwargs):  # noqa: ANN001 - mimic requests.Session.get
-        self.get_calls.append({"url": url, "kwargs": kwargs})
+        self.get_calls: list[requests.PreparedRequest] = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs):  # noqa: ANN003 - mimic HTTPAdapter.send
+        resp = self._respond(request)
+        resp.request = request
+        return resp
+
+    def _respond(self, request: requests.PreparedRequest) -> requests.Response:
+        url = request.url.split("?", 1)[0]
+        if request.method == "POST":
+            if url == auth_mod.AUTHORIZE_URL:
+                return _make_redirect_response(location="http://localhost:4200/?code=fake-auth-code")
+            if url == auth_mod.TOKEN_URL:
+                return _make_json_response({"access_token": "FAKE_ACCESS_TOKEN"}, url=url)
+            raise AssertionError(f"Unexpected POST url: {url}")
+        self.get_calls.append(request)
         if url == self._mod.IOT_INSTALLATIONS_URL:
             return _make_json_response(self._installations_payload, url=url)
         if url == self._mod.IOT_GATEWAYS_URL:
@@ -61,6 +69,15 @@ class FakeSession:
             return _make_json_response(self._devices_payload, url=url)
         raise AssertionError(f"Unexpected GET url: {url}")
 
+    def close(self) -> None:
+        pass
+
+
+def _fake_session(adapter: FakeAdapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
 
 @pytest.fixture()
 def mod():
@@ -76,13 +93,13 @@ def test_get_iot_config_happy_path_picks_first_and_sets_bearer_header(monkeypatc
     monkeypatch.setenv("VIESSMANN_CALLBACK_URI", "http://localhost:4200/")
     monkeypatch.setattr(mod.config_mod, "get_token_cache_path", lambda: None)
 
-    fake_session = FakeSession(
+    fake_adapter = FakeAdapter(
         mod,
         installations_payload={"data": [{"id": "inst-1"}]},
         gateways_payload={"data": [{"serial": "gw-serial-1"}]},
         devices_payload={"data": [{"id": "dev-1"}]},
     )
-    monkeypatch.setattr(mod.requests, "Session", lambda: fake_session)
+    monkeypatch.setattr(mod.auth_mod, "_build_session", lambda: _fake_session(fake_adapter))
 
     cfg = mod.get_iot_config()
 
@@ -91,11 +108,10 @@ def test_get_iot_config_happy_path_picks_first_and_sets_bearer_header(monkeypatc
     assert cfg.gateway_serial == "gw-serial-1"
     assert cfg.device_id == "dev-1"
 
-    # Verify Bearer header is used for ALL IoT GETs.
-    assert len(fake_session.get_calls) == 3
-    for call in fake_session.get_calls:
-        headers = call["kwargs"].get("headers") or {}
-        assert headers.get("Authorization") == "Bearer FAKE_ACCESS_TOKEN"
+    # Verify Bearer header is sent on ALL IoT GETs (session default or per request).
+    assert len(fake_adapter.get_calls) == 3
+    for request in fake_adapter.get_calls:
+        assert request.headers.get("Authorization") == "Bearer FAKE_ACCESS_TOKEN"
 
 
 def test_get_iot_config_empty_installations_raises(monkeypatch, mod) -> None:
@@ -105,13 +121,13 @@ def test_get_iot_config_empty_installations_raises(monkeypatch, mod) -> None:
     monkeypatch.setenv("VIESSMANN_CALLBACK_URI", "http://localhost:4200/")
     monkeypatch.setattr(mod.config_mod, "get_token_cache_path", lambda: None)
 
-    fake_session = FakeSession(
+    fake_adapter = FakeAdapter(
         mod,
         installations_payload={"data": []},
         gateways_payload={"data": [{"serial": "gw"}]},
         devices_payload={"data": [{"id": "dev"}]},
     )
-    monkeypatch.setattr(mod.requests, "Session", lambda: fake_session)
+    monkeypatch.setattr(mod.auth_mod, "_build_session", lambda: _fake_session(fake_adapter))
 
     with pytest.raises(auth_mod.CliError):
         mod.get_iot_config()
@@ -124,13 +140,13 @@ def test_get_iot_config_missing_installation_id_raises(monkeypatch, mod) -> None
     monkeypatch.setenv("VIESSMANN_CALLBACK_URI", "http://localhost:4200/")
     monkeypatch.setattr(mod.config_mod, "get_token_cache_path", lambda: None)
 
-    fake_session = FakeSession(
+    fake_adapter = FakeAdapter(
         mod,
         installations_payload={"data": [{}]},  # missing "id"
         gateways_payload={"data": [{"serial": "gw"}]},
         devices_payload={"data": [{"id": "dev"}]},
     )
-    monkeypatch.setattr(mod.requests, "Session", lambda: fake_session)
+    monkeypatch.setattr(mod.auth_mod, "_build_session", lambda: _fake_session(fake_adapter))
 
     with pytest.raises(auth_mod.CliError):
         mod.get_iot_config()
@@ -56,3 +56,37 @@ def test_generate_code_verifier_returns_requested_length(vis_auth) -> None:
     assert len(v) == 64
     v.encode("ascii")  # should not raise
 
+
+
+def _config(vis_auth, *, pkce_method: str):
+    return vis_auth.Config(
+        client_id="client-id",
+        email="user@example.com",
+        password="pw",
+        callback_uri="http://localhost:4200/",
+        scope="IoT User",
+        timeout_seconds=5.0,
+        ssl_verify=True,
+        pkce_method=pkce_method,
+        code_verifier="dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk",
+    )
+
+
+def test_config_code_challenge_is_derived_once_per_config(vis_auth) -> None:
+    cfg = _config(vis_auth, pkce_method="S256")
+
+    assert cfg.code_challenge == "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+    assert cfg.code_challenge_method == "S256"
+    assert "code_challenge" in vars(cfg)
+
+
+def test_config_plain_code_challenge_is_verifier(vis_auth) -> None:
+    cfg = _config(vis_auth, pkce_method="plain")
+
+    assert cfg.code_challenge == cfg.code_verifier
+    assert cfg.code_challenge_method == "plain"
+
+
+@pytest.mark.parametrize("length", [43, 44, 45, 46, 64, 127, 128])
+def test_generate_code_verifier_covers_every_length_in_range(vis_auth, length: int) -> None:
+    assert len(vis_auth.generate_code_verifier(length)) == length
@@ -1,5 +1,9 @@
+import datetime
+import http.server
 import json
 import logging
+import socket
+import threading
 from unittest.mock import Mock
 
 import pytest
@@ -84,3 +88,295 @@ def test_exchange_code_for_token_logs_sanitized_response(auth_module, caplog) ->
     assert "ACCESS_TOKEN_SHOULD_NOT_APPEAR_IN_LOGS" not in caplog.text
     assert "REFRESH_TOKEN_SHOULD_NOT_APPEAR_IN_LOGS" not in caplog.text
 
+
+def test_sanitize_obj_rejects_circular_references(auth_module) -> None:
+    looped: dict = {"items": []}
+    looped["items"].append(({"parent": looped},))
+
+    with pytest.raises(ValueError, match="Circular reference"):
+        auth_module._sanitize_obj(looped)
+
+
+def test_sanitize_obj_sanitizes_shared_substructures(auth_module) -> None:
+    shared = {"access_token": "AT", "kind": "x"}
+
+    sanitized = auth_module._sanitize_obj({"a": shared, "b": [shared, shared]})
+
+    expected = {"access_token": "<redacted>", "kind": "x"}
+    assert sanitized == {"a": expected, "b": [expected, expected]}
+
+
+def test_sanitize_text_redacts_json_form_and_code_tokens(auth_module) -> None:
+    text = (
+        '{"access_token": "AT_SECRET", "Refresh_Token":"RT_SECRET", "token_type":"Bearer"} '
+        "id_token=ID_SECRET&state=ok "
+        '<a href="http://localhost:4200/?CODE=CODE_SECRET">'
+    )
+
+    scrubbed = auth_module._sanitize_text(text)
+
+    for secret in ("AT_SECRET", "RT_SECRET", "ID_SECRET", "CODE_SECRET"):
+        assert secret not in scrubbed
+    assert '"access_token": "<redacted>"' in scrubbed
+    assert '"Refresh_Token":"<redacted>"' in scrubbed
+    assert "id_token=<redacted>&state=ok" in scrubbed
+    assert 'CODE=<redacted>"' in scrubbed
+    assert '"token_type":"Bearer"' in scrubbed
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "acce\u017fs_token=S_SECRET",  # long s
+        "access_to\u212aen=K_SECRET",  # Kelvin sign
+        "\u0131d_token=I_SECRET",  # dotless i
+        "\u0130D_TOKEN=I_SECRET",  # dotted capital I
+    ],
+)
+def test_sanitize_text_prefilter_lets_unicode_case_variants_through(auth_module, text) -> None:
+    # The IGNORECASE regex matches these spellings, so the pre-filter must not skip them.
+    assert "_SECRET" not in auth_module._sanitize_text(text)
+
+
+def test_sanitize_text_returns_token_free_text_unchanged(auth_module) -> None:
+    text = "<html><body>Invalid client</body></html>"
+    assert auth_module._sanitize_text(text) is text
+
+
+def test_sanitize_obj_preserves_container_types_and_order(auth_module) -> None:
+    raw = {
+        "b": ({"code": "C"}, [1, ("x", {"Password": "P"})]),
+        "a": [],
+        1: "non-str key",
+    }
+
+    sanitized = auth_module._sanitize_obj(raw)
+
+    assert list(sanitized) == ["b", "a", 1]
+    assert sanitized["b"] == ({"code": "<redacted>"}, [1, ("x", {"Password": "<redacted>"})])
+    assert isinstance(sanitized["b"], tuple)
+    assert isinstance(sanitized["b"][1][1], tuple)
+    assert sanitized[1] == "non-str key"
+    assert raw["b"][0]["code"] == "C"
+
+
+def test_build_session_mounts_pooled_https_adapter(auth_module) -> None:
+    session = auth_module._build_session()
+
+    adapter = session.get_adapter("https://iam.example.invalid/token")
+
+    assert adapter._pool_maxsize == 4  # noqa: SLF001 - requests.HTTPAdapter internals
+    assert adapter.max_retries.total == 2
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_build_session_returns_final_gateway_error_as_cli_error(auth_module, monkeypatch) -> None:
+    hits = []
+
+    class _Unavailable(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            hits.append(self.path)
+            body = b"upstream down"
+            self.send_response(503)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Unavailable)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        session = auth_module._build_session()
+        # Route the local plain-HTTP server through the same retrying adapter.
+        session.mount("http://", session.get_adapter("https://api.example.invalid"))
+        monkeypatch.setattr(
+            auth_module._config,
+            "get_users_me_url",
+            lambda: f"http://127.0.0.1:{server.server_port}/users/v1/users/me",
+        )
+        cfg = Mock(timeout_seconds=5.0, ssl_verify=True)
+        log = logging.LoggerAdapter(logging.getLogger("backend.viessmann.api_auth.test"), {})
+
+        with pytest.raises(auth_module.CliError, match="HTTP 503.*upstream down"):
+            auth_module.fetch_users_me(session=session, cfg=cfg, access_token="AT", log=log)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(hits) == 3  # first attempt + 2 retries
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_roundtrip_with_and_without_orjson(auth_module, monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(auth_module, "orjson", None)
+    elif auth_module.orjson is None:
+        pytest.skip("orjson not installed")
+
+    payload = auth_module._json_loads('{"b": [1, 2], "a": "Wärme"}'.encode("utf-8"))
+    pretty = auth_module._json_dumps(payload, pretty=True)
+
+    assert payload == {"b": [1, 2], "a": "Wärme"}
+    assert json.loads(pretty) == payload
+    assert pretty.index('"a"') < pretty.index('"b"')
+    assert "Wärme" in auth_module._json_dumps(payload)
+
+    stamped = {"at": datetime.date(2026, 1, 2)}
+    assert json.loads(auth_module._json_dumps(stamped, default=str)) == {"at": "2026-01-02"}
+
+    raw = auth_module._json_dumpb(payload)
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == payload
+    assert "Wärme".encode("utf-8") in raw
+
+
+def test_exchange_code_for_token_skips_debug_sanitizing_above_debug(auth_module, caplog, monkeypatch) -> None:
+    session = Mock()
+    session.post.return_value = _make_json_response({"access_token": "AT", "expires_in": 60})
+    cfg = auth_module.Config(
+        client_id="client-id",
+        email="user@example.com",
+        password="password",
+        callback_uri="http://localhost:4200/",
+        scope="IoT User",
+        timeout_seconds=5.0,
+        ssl_verify=True,
+        pkce_method="S256",
+        code_verifier="code-verifier",
+    )
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("sanitizer must not run when DEBUG is disabled")
+
+    monkeypatch.setattr(auth_module, "_sanitize_obj", _fail)
+    monkeypatch.setattr(auth_module, "_sanitize_mapping", _fail)
+    log = logging.LoggerAdapter(logging.getLogger("backend.viessmann.api_auth.test"), {})
+    caplog.set_level(logging.INFO, logger="backend.viessmann.api_auth.test")
+
+    token_response = auth_module.exchange_code_for_token(session=session, cfg=cfg, code="auth-code", log=log)
+
+    assert token_response.access_token == "AT"
+
+
+def test_prewarm_connection_warms_session_pool_without_using_session(auth_module) -> None:
+    connections = set()
+    requests_seen = []
+
+    class _KeepAlive(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, body: bytes) -> None:
+            connections.add(self.client_address)
+            requests_seen.append(self.command)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_HEAD(self) -> None:  # noqa: N802 - http.server API
+            self._reply(b"{}")
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            self._reply(b"{}")
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAlive)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        session = auth_module._build_session()
+        session.mount("http://", session.get_adapter("https://api.example.invalid"))
+        url = f"http://127.0.0.1:{server.server_port}/"
+        cfg = Mock(timeout_seconds=5.0, ssl_verify=True)
+        session.head = Mock(side_effect=AssertionError("prewarm must not use the Session"))
+
+        thread = auth_module._prewarm_connection(session=session, url=url, cfg=cfg)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+        assert session.get(url, timeout=5.0).status_code == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert requests_seen == ["HEAD", "GET"]
+    assert len(connections) == 1  # the GET reused the prewarmed connection
+
+
+def test_prewarm_connection_swallows_connection_errors(auth_module) -> None:
+    cfg = Mock(timeout_seconds=2.0, ssl_verify=True)
+    session = auth_module._build_session()
+    session.mount("http://", session.get_adapter("https://api.example.invalid"))
+    # Bind then close a socket to get a local port with nothing listening.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    thread = auth_module._prewarm_connection(session=session, url=f"http://127.0.0.1:{port}/", cfg=cfg)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+
+
+def test_prewarm_connection_skips_adapters_without_tls_context_lookup(auth_module) -> None:
+    cfg = Mock(timeout_seconds=2.0, ssl_verify=True)
+    session = auth_module._build_session()
+    # requests < 2.32.2 adapters have no get_connection_with_tls_context.
+    session.mount("https://", Mock(spec=["send", "close"]))
+
+    thread = auth_module._prewarm_connection(session=session, url="https://api.example.invalid/", cfg=cfg)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+
+
+def test_configure_logging_stamps_latest_run_id_without_record_factory(auth_module) -> None:
+    root = logging.getLogger()
+    handler = logging.Handler()
+    records: list[logging.LogRecord] = []
+    handler.emit = records.append  # type: ignore[method-assign]
+    old_level = root.level
+    old_factory = logging.getLogRecordFactory()
+    root.addHandler(handler)
+    try:
+        auth_module.configure_logging(run_id="first", level="INFO")
+        log = auth_module.configure_logging(run_id="second", level="INFO")
+        log.info("hello")
+
+        assert logging.getLogRecordFactory() is old_factory
+        assert sum(isinstance(f, auth_module._RunIdFilter) for f in handler.filters) == 1
+        assert records[-1].run_id == "second"
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(old_level)
+        for h in root.handlers:
+            for f in [f for f in h.filters if isinstance(f, auth_module._RunIdFilter)]:
+                h.removeFilter(f)
+
+
+def test_sanitize_mapping_matches_sensitive_keys_case_insensitively(auth_module) -> None:
+    sanitized = auth_module._sanitize_mapping({"Authorization": "Bearer X", "code": "C", 7: "seven", "scope": "IoT"})
+
+    assert sanitized == {"Authorization": "<redacted>", "code": "<redacted>", 7: "seven", "scope": "IoT"}
+
+
+def test_lazy_str_defers_evaluation_until_formatted(auth_module, caplog) -> None:
+    calls: list[int] = []
+
+    def build() -> list[str]:
+        calls.append(1)
+        return ["a", "b"]
+
+    logger = logging.getLogger("backend.viessmann.api_auth.test.lazy")
+    caplog.set_level(logging.INFO, logger=logger.name)
+    logger.debug("keys: %s", auth_module._LazyStr(build))
+    assert calls == []
+
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    logger.debug("keys: %s", auth_module._LazyStr(build))
+    assert "keys: ['a', 'b']" in caplog.text
+    assert calls  # formatted at least once (once per handler)